@@ -0,0 +1,289 @@
+"""
+bench.py – How Spirida holds up as its fields grow
+
+A headless, reproducible benchmark suite. It measures:
+
+- emit:        the cost of one SpiralField.emit (with its resonances) into
+               fields already holding 100 ... 10k pulses
+- compost:     compost() latency in every composting mode
+- resonances:  find_resonances (every pair met, pure Python) and the
+               vectorised count_resonances, from 100 to 100k pulses
+- status:      system_status() across several fields
+- memory:      bytes held per pulse, for each storage
+
+Every field runs on a VirtualClock with seeded randomness, so two runs
+see the same pulses. Sizes whose estimated time would exceed --budget
+seconds (resonances grow with the square of the field) are reported as
+skipped rather than run.
+
+Examples:
+    python benchmarks/bench.py --quick
+    python benchmarks/bench.py --output baseline.json
+    python benchmarks/bench.py --baseline baseline.json --fail-on-regression
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import ContemplativeSystem, SpiralField
+from spirida.sinks import NullSink, set_default_sink
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional – columnar fields are skipped without it
+    np = None
+
+SYMBOLS = ["🌿", "💧", "✨", "🍄", "🌙", "🪐", "🌱", "🔥", "🌊", "🌲"]
+EMOTIONS = ["calm", "joy", "peaceful", "flowing", "growing", "hopeful", "curious", "grateful"]
+MODES = ["natural", "seasonal", "resonant", "lunar"]
+START = 1_700_000_000.0  # The moment every virtual clock begins at
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark under `name`."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def storages():
+    return ["list", "columnar"] if np is not None else ["list"]
+
+
+def result(name, params, metric, value, unit, times=None, **extra):
+    entry = {"benchmark": name, "params": params, "metric": metric, "value": value, "unit": unit}
+    if times:
+        entry["min"] = min(times)
+        entry["runs"] = len(times)
+    entry.update(extra)
+    return entry
+
+
+def key_of(entry):
+    """What identifies a measurement across runs."""
+    params = ",".join(f"{k}={v}" for k, v in sorted(entry["params"].items()))
+    return f"{entry['benchmark']}[{params}].{entry['metric']}"
+
+
+def measure(run, setup, repeat):
+    """Time `run(setup())` `repeat` times - the setup is not timed."""
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def filled_field(count, storage="list", mode="natural", history="full", seed=0, spread=600.0):
+    """A field on a virtual clock holding `count` pulses born over the last `spread` seconds."""
+    rng = random.Random(seed)
+    clock = VirtualClock(START)
+    field = SpiralField("bench", composting_mode=mode, storage=storage, history=history,
+                        clock=clock, output=NullSink())
+    pulses = [(rng.choice(SYMBOLS), rng.choice(EMOTIONS), rng.uniform(0.2, 1.0),
+               rng.uniform(0.001, 0.05), START - rng.uniform(0.0, spread)) for _ in range(count)]
+    field.emit_many(pulses, resonate=False)
+    return field, rng
+
+
+def estimate(measured, size):
+    """Extrapolate a pairwise cost from the largest size measured so far."""
+    if not measured:
+        return 0.0
+    last_size, last_time = measured[-1]
+    return last_time * (size / last_size) ** 2
+
+
+@benchmark("emit")
+def bench_emit(config):
+    emits = config["emits"]
+    for storage in storages():
+        for size in config["emit_sizes"]:
+            def setup():
+                random.seed(config["seed"])  # Which resonances are voiced
+                return filled_field(size, storage, seed=config["seed"])
+
+            def run(state):
+                field, rng = state
+                for _ in range(emits):
+                    field.emit(rng.choice(SYMBOLS), rng.choice(EMOTIONS))
+
+            times = measure(run, setup, config["repeat"])
+            per_emit = statistics.median(times) / emits
+            yield result("emit", {"storage": storage, "pulses": size}, "emit_us", per_emit * 1e6, "µs",
+                         [t / emits * 1e6 for t in times], emits_per_second=1.0 / per_emit)
+
+
+@benchmark("compost")
+def bench_compost(config):
+    for storage in storages():
+        for mode in MODES:
+            for size in config["compost_sizes"]:
+                # Births span a whole day, so a share of every field has faded
+                times = measure(lambda state: state[0].compost(),
+                                lambda: filled_field(size, storage, mode, seed=config["seed"], spread=86400.0),
+                                config["repeat"])
+                yield result("compost", {"storage": storage, "mode": mode, "pulses": size}, "compost_ms",
+                             statistics.median(times) * 1e3, "ms", [t * 1e3 for t in times])
+
+
+@benchmark("resonances")
+def bench_resonances(config):
+    budget = config["budget"]
+    for storage in storages():
+        for method in ("find_resonances", "count_resonances"):
+            measured = []
+            for size in config["resonance_sizes"]:
+                params = {"storage": storage, "method": method, "pulses": size}
+                predicted = estimate(measured, size)
+                if predicted > budget:
+                    yield result("resonances", params, "seconds", None, "s", skipped=True,
+                                 estimated=predicted)
+                    continue
+                field, _ = filled_field(size, storage, seed=config["seed"])
+                call = getattr(field, method)
+                repeat = config["repeat"] if predicted * config["repeat"] <= budget else 1
+                times = measure(lambda state: call(0.5), lambda: None, repeat)
+                median = statistics.median(times)
+                measured.append((size, median))
+                pairs = size * (size - 1) // 2
+                yield result("resonances", params, "seconds", median, "s", times,
+                             pairs_per_second=pairs / median if median else None)
+
+
+@benchmark("status")
+def bench_status(config):
+    for storage in storages():
+        for fields in config["status_fields"]:
+            for size in config["status_sizes"]:
+                clock = VirtualClock(START)
+                system = ContemplativeSystem("bench", clock=clock, output=NullSink())
+                rng = random.Random(config["seed"])
+                for i in range(fields):
+                    field = system.create_field(f"field-{i}", storage=storage)
+                    field.emit_many([(rng.choice(SYMBOLS), rng.choice(EMOTIONS), 1.0, 0.01,
+                                      START - rng.uniform(0.0, 600.0)) for _ in range(size)], resonate=False)
+                times = measure(lambda state: system.system_status(), lambda: None, config["repeat"])
+                yield result("status", {"storage": storage, "fields": fields, "pulses": size}, "status_ms",
+                             statistics.median(times) * 1e3, "ms", [t * 1e3 for t in times])
+
+
+@benchmark("memory")
+def bench_memory(config):
+    size = config["memory_size"]
+    for storage in storages():
+        for history in ("full", "aggregate"):
+            gc.collect()
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            field, _ = filled_field(size, storage, history=history, seed=config["seed"])
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del field
+            yield result("memory", {"storage": storage, "history": history, "pulses": size},
+                         "bytes_per_pulse", held / size, "B")
+
+
+CONFIGS = {
+    "quick": {"repeat": 3, "emits": 20, "emit_sizes": [100, 1000], "compost_sizes": [1000],
+              "resonance_sizes": [100, 300, 1000], "status_fields": [1, 10], "status_sizes": [1000],
+              "memory_size": 10000, "budget": 5.0},
+    "full": {"repeat": 5, "emits": 50, "emit_sizes": [100, 1000, 10000], "compost_sizes": [1000, 10000, 100000],
+             "resonance_sizes": [100, 300, 1000, 3000, 10000, 30000, 100000], "status_fields": [1, 10],
+             "status_sizes": [1000, 10000], "memory_size": 100000, "budget": 60.0},
+}
+
+
+def compare(results, baseline, tolerance):
+    """Print each measurement beside its baseline; return the ones that regressed."""
+    before = {key_of(entry): entry for entry in baseline["results"]}
+    regressions = []
+    print(f"\n{'measurement':<72} {'baseline':>12} {'now':>12} {'change':>8}")
+    for entry in results:
+        old = before.get(key_of(entry))
+        if old is None or entry["value"] is None or not old.get("value"):
+            continue
+        change = entry["value"] / old["value"] - 1.0
+        # Only bytes and seconds are measured - lower is always better
+        regressed = change > tolerance
+        print(f"{key_of(entry):<72} {old['value']:>12.4g} {entry['value']:>12.4g} {change:>+7.1%}"
+              f"{'  ⚠️' if regressed else ''}")
+        if regressed:
+            regressions.append(entry)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🌿 Benchmark Spirida's fields as they grow.")
+    parser.add_argument("benchmarks", nargs="*", choices=[[]] + list(BENCHMARKS),
+                        help="Benchmarks to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes, for a first look")
+    parser.add_argument("--repeat", type=int, help="Runs per measurement (the median is reported)")
+    parser.add_argument("--budget", type=float, help="Skip sizes estimated to take longer (seconds; 5 quick, 60 full)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the generated pulses")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare with results saved earlier by --output")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Slowdown counted as a regression (0.2 = 20%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with 1 if anything regressed")
+    args = parser.parse_args(argv)
+
+    config = dict(CONFIGS["quick" if args.quick else "full"], seed=args.seed)
+    if args.repeat:
+        config["repeat"] = args.repeat
+    if args.budget is not None:
+        config["budget"] = args.budget
+    set_default_sink(NullSink())  # Pulses speak freely; the benchmark should not wait on them
+
+    results = []
+    for name in args.benchmarks or list(BENCHMARKS):
+        for entry in BENCHMARKS[name](config):
+            results.append(entry)
+            shown = "skipped (estimated {:.1f} s)".format(entry["estimated"]) if entry.get("skipped") \
+                else f"{entry['value']:.4g} {entry['unit']}"
+            print(f"{key_of(entry):<72} {shown}", flush=True)
+
+    report = {
+        "spirida_benchmarks": 1,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": getattr(np, "__version__", None),
+        "config": config,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📝 Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -63,6 +63,7 @@ class ContemplativeREPL:
         print("  fields                    - view all spiral fields")
         print("  compost                   - encourage gentle forgetting")
         print("  silence                   - enter a period of wordless presence")
+        print("  profile [on] [every]|off  - watch where background breaths spend their time")
         print("  quit                      - conclude this session mindfully")
         print()
         print("Type 'help' anytime to return to this guidance.")
@@ -143,6 +144,8 @@ class ContemplativeREPL:
             self._handle_compost_command()
         elif command == "silence":
             self._handle_silence_command(parts[1:])
+        elif command == "profile":
+            self._handle_profile_command(parts[1:])
         elif command in ["quit", "exit", "bye"]:
             self.is_active = False
         elif command == "help":
@@ -260,6 +263,38 @@ class ContemplativeREPL:
         except KeyboardInterrupt:
             print("\n🌙 Early return from silence. All timing is perfect.")
     
+    def _handle_profile_command(self, args: List[str]):
+        """
+        Begin or end profiling the system's background breath - or, with
+        nothing said, turn it the other way.
+        """
+        profiler = self.system.profiler
+        if args and args[0] not in ("on", "off"):
+            if not args[0].isdigit():
+                print("🔬 Say 'profile on [every]', 'profile off', or 'profile <every>'")
+                return
+            args = ["on"] + args  # A number alone begins profiling at that cadence
+        turn_on = args[0] == "on" if args else profiler is None
+        
+        if not turn_on:
+            if profiler is None:
+                print("🔬 The breath is not being profiled")
+                return
+            self.system.disable_profiling()
+            print(f"🔬 Profiling rests after {profiler.passes} breaths: "
+                  f"{profiler.captured} captured ({profiler.overruns} overran) in {profiler.path}")
+            return
+        
+        every = 100  # default
+        if len(args) > 1:
+            if not args[1].isdigit():
+                print(f"🔬 '{args[1]}' is not a number of passes")
+                return
+            every = int(args[1])
+        profiler = self.system.enable_profiling(every=every)
+        watched = f"every {every}th pass, and any that overruns" if every else "any pass that overruns"
+        print(f"🔬 Profiling the breath: {watched}, as collapsed stacks in {profiler.path}")
+    
     def _handle_free_expression(self, text: str):
         """
         Respond to free-form expressions with contemplative presence.
@@ -207,10 +207,10 @@ class ContemplativeJournal:
             print(f"✨ {pulse.symbol} [{pulse.emotion}] has been placed in your Heart Field")
             
             # Check for immediate resonances
-            recent_resonances = self.heart_field.find_resonances(min_strength=0.6)
-            if recent_resonances:
-                print(f"🌊 This feeling resonates with {len(recent_resonances)} other heart pulse(s)")
-                for res in recent_resonances[:2]:  # Show first 2
+            resonance_count, strongest = self.heart_field.sense_resonances(2, min_strength=0.6)  # Strongest 2
+            if resonance_count:
+                print(f"🌊 This feeling resonates with {resonance_count} other heart pulse(s)")
+                for res in strongest:
                     print(f"     {res['resonance']['poetic_trace']}")
         
         print()
@@ -258,9 +258,9 @@ class ContemplativeJournal:
         pulse.pulse()
         
         # Check for resonances
-        resonances = self.heart_field.find_resonances(min_strength=0.5)
-        if resonances:
-            print(f"💞 This resonates with {len(resonances)} other heart pulse(s)")
+        resonance_count = self.heart_field.count_resonances(min_strength=0.5)
+        if resonance_count:
+            print(f"💞 This resonates with {resonance_count} other heart pulse(s)")
         
         print(f"💖 Added to Heart Field: {pulse}")
     
@@ -350,14 +350,14 @@ class ContemplativeJournal:
         total_resonances = 0
         
         for field in [self.daily_field, self.heart_field, self.vision_field]:
-            resonances = field.find_resonances(min_strength=0.4)
-            if resonances:
-                print(f"\n💫 {field.name.replace('_', ' ').title()} ({len(resonances)} resonances):")
-                for res in resonances[:3]:  # Show top 3
+            resonance_count, strongest = field.sense_resonances(3, min_strength=0.4)  # Top 3
+            if resonance_count:
+                print(f"\n💫 {field.name.replace('_', ' ').title()} ({resonance_count} resonances):")
+                for res in strongest:
                     strength = res['resonance']['strength']
                     trace = res['resonance']['poetic_trace']
                     print(f"   {strength:.2f}: {trace}")
-                total_resonances += len(resonances)
+                total_resonances += resonance_count
         
         if total_resonances == 0:
             print("\n🤲 No strong resonances detected at this moment.")
@@ -11,6 +11,7 @@ Arguments:
     --presence  : How many spiral cycles (default: 5)
     --rhythm    : 'slow', 'fast', or a numeric value (e.g. 0.8)
     --singular  : Whether to stay on one symbol (True/False)
+    --interactions : How many interactions run side by side when not singular (default: 3)
     --log       : Save output to 'spirida_log.txt'
     --visual    : Print spiral trace as it happens
     --verbose   : Show gentle, narrative explanations per cycle
@@ -20,6 +21,7 @@ import argparse
 import sys
 import os
 from spirida.core import spiral_interaction
+from spirida.logwriter import LogWriter
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
@@ -28,6 +30,7 @@ def main():
     parser.add_argument("--presence", type=int, default=5, help="Number of presence cycles")
     parser.add_argument("--rhythm", type=str, default="slow", help="Rhythm: slow, fast, or seconds")
     parser.add_argument("--singular", type=str, default="True", help="Singular mode (True/False)")
+    parser.add_argument("--interactions", type=int, default=3, help="Parallel interactions when not singular")
     parser.add_argument("--log", action="store_true", help="Save to spirida_log.txt")
     parser.add_argument("--visual", action="store_true", help="Print spiral to terminal")
     parser.add_argument("--verbose", action="store_true", help="Narrate what is happening in plain language")
@@ -38,28 +41,33 @@ def main():
     print("\n🌿 Welcome to Spirida via run.py 🌿")
     print(f"Initiating with presence={args.presence}, rhythm={args.rhythm}, singular={singular}\n")
 
-    # Optional log callback
+    # Optional log - kept open and written in batches for the whole session
+    log = LogWriter("spirida_log.txt", max_bytes=5_000_000, background=True) if args.log else None
+
     def log_callback(msg):
-        if args.log:
-            with open("spirida_log.txt", "a", encoding="utf-8") as f:
-                f.write(msg.strip() + "\n")
+        if log:
+            log.write(msg.strip())
         if args.visual:
             print(msg)
 
     # Write session header
-    if args.log:
-        with open("spirida_log.txt", "a", encoding="utf-8") as f:
-            f.write("\n--- New Spirida Session ---\n")
-            f.write(f"Presence: {args.presence}, Rhythm: {args.rhythm}, Singular: {singular}, Verbose: {args.verbose}\n")
+    if log:
+        log.write("\n--- New Spirida Session ---")
+        log.write(f"Presence: {args.presence}, Rhythm: {args.rhythm}, Singular: {singular}, Verbose: {args.verbose}")
 
     # Run main interaction
-    spiral_interaction(
-        presence=args.presence,
-        rythm=args.rhythm,
-        singular=singular,
-        on_output=log_callback if (args.log or args.visual) else None,
-        verbose=args.verbose
-    )
+    try:
+        spiral_interaction(
+            presence=args.presence,
+            rythm=args.rhythm,
+            singular=singular,
+            on_output=log_callback if (args.log or args.visual) else None,
+            verbose=args.verbose,
+            interactions=args.interactions
+        )
+    finally:
+        if log:
+            log.close()
 
     print("\n🌙 Spirida session complete.")
     if args.log:
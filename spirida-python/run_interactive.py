@@ -10,6 +10,7 @@ import os
 import time
 from spirida.core import spiral_interaction
 from spirida.spiralbase import print_memory_trace
+from spirida.logwriter import LogWriter
 
 # Ensure spirida is importable even if run from subfolder
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -35,26 +36,30 @@ def main():
     print("\n🌬️ Preparing your spiral journey...")
     time.sleep(1)
 
-    if do_log:
-        with open("spirida_log.txt", "a", encoding="utf-8") as f:
-            f.write(f"\n\n--- New Spirida Session ---\n")
-            f.write(f"Presence: {presence}, Rhythm: {rhythm}, Singular: {singular}, Verbose: {do_verbose}\n")
+    # The log stays open for the session and is written in batches
+    log = LogWriter("spirida_log.txt", max_bytes=5_000_000, background=True) if do_log else None
+    if log:
+        log.write("\n\n--- New Spirida Session ---")
+        log.write(f"Presence: {presence}, Rhythm: {rhythm}, Singular: {singular}, Verbose: {do_verbose}")
 
     def log_callback(msg):
-        if do_log:
-            with open("spirida_log.txt", "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
+        if log:
+            log.write(msg)
         if do_visual:
             print(msg)
 
     # Run with output redirection
-    spiral_interaction(
-        presence=presence,
-        rythm=rhythm,
-        singular=singular,
-        on_output=log_callback if (do_log or do_visual) else None,
-        verbose=do_verbose
-    )
+    try:
+        spiral_interaction(
+            presence=presence,
+            rythm=rhythm,
+            singular=singular,
+            on_output=log_callback if (do_log or do_visual) else None,
+            verbose=do_verbose
+        )
+    finally:
+        if log:
+            log.close()
 
     print("\n🌙 The spiral rests. Thank you for being present.\n")
     if do_log:
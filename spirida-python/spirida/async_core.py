@@ -0,0 +1,183 @@
+"""
+🌬️ ASYNC CORE – Breathing inside an event loop
+
+The contemplative core breathes with time.sleep on a thread of its
+own. That is gentle for a single system, but a service that already
+lives in an asyncio event loop wants to host many systems - and their
+fields - without a thread for each, and without any breath stalling
+the loop.
+
+- AsyncBreathCycle: a BreathCycle whose breathe() is a coroutine
+- AsyncContemplativeSystem: a ContemplativeSystem whose background
+  breath is an asyncio task, with awaitable emit, compost and status
+
+Emitting, composting and sensing a large field can take a while, so the
+awaitable emit, compost and status - and the background breath's own
+composting - do their work in an executor (the loop's default one
+unless another is given) and the loop stays free while they do.
+
+Fields are shared unchanged with the threaded core, so the same field
+may be tended from coroutines and threads alike.
+"""
+
+import asyncio
+import functools
+import math
+from concurrent.futures import Executor
+from typing import Callable, Dict, Optional, Union
+
+from .contemplative_core import BreathCycle, ContemplativeSystem, PulseObject, SpiralField
+from .sinks import OutputSink
+
+
+class AsyncBreathCycle(BreathCycle):
+    """
+    A breath cycle that rests without blocking, leaving the event loop
+    free to tend everything else while it breathes.
+    """
+
+    async def breathe(self, silent: bool = False) -> None:
+        """
+        Complete one breath cycle without blocking the event loop.
+        """
+        if not silent:
+            self._voice("🫁 inhale...")
+        await self.clock.asleep(self.inhale)
+
+        if not silent:
+            self._voice("🤲 hold...")
+        await self.clock.asleep(self.hold)
+
+        if not silent:
+            self._voice("🌬️  exhale...")
+        await self.clock.asleep(self.exhale)
+
+        self.cycle_count += 1
+
+    async def async_breathe(self) -> None:
+        """
+        Breathe silently alongside other coroutines.
+        """
+        await self.breathe(silent=True)
+
+
+class AsyncContemplativeSystem(ContemplativeSystem):
+    """
+    A contemplative system whose breath is a task in an event loop.
+
+    One loop can hold thousands of these, each breathing on its own
+    rhythm. start_breathing() and stop_breathing() must be awaited
+    from within the running loop.
+
+    emit, compost and status run in `executor` (the loop's default
+    executor if None), and so does the background breath's tending of
+    the fields whose moment has come. Only the resting stays on the loop.
+    """
+
+    def __init__(self, name: str = "spirida_system", clock=None,
+                 output: Union[OutputSink, Callable[[str], None], None] = None, instrument: bool = False,
+                 executor: Optional[Executor] = None):
+        super().__init__(name, clock, output, instrument)
+        self.breath = AsyncBreathCycle(clock=self.clock, output=self.output)
+        self.background_task: Optional[asyncio.Task] = None
+        self.executor = executor
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_wake: Optional[asyncio.Event] = None
+
+    async def start_breathing(self) -> None:
+        """
+        Begin the background breath as a task in the running loop.
+        """
+        if self.is_breathing:
+            return
+
+        self.is_breathing = True
+        self._rested_since = self.clock.time()
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        self.background_task = self._loop.create_task(self._breath_loop())
+        self._voice(f"🌬️  {self.name} begins breathing...")
+
+    def _field_changed(self, field: SpiralField) -> None:
+        """Wake the breath task if a field now needs it sooner - from any thread."""
+        loop, wake = self._loop, self._async_wake  # Read once - stop_breathing may clear them meanwhile
+        if loop is None or not self.is_breathing:
+            return
+        next_wake = self._next_wake
+        if next_wake is None or self._field_due(field) < next_wake:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # The loop closed as the breath was stopping
+
+    async def _breath_loop(self) -> None:
+        """
+        The eternal breath, resting as a task until a field next needs it.
+        """
+        while self.is_breathing:
+            self._next_wake = None  # Emits from now on must wake us
+            self._async_wake.clear()
+            wake_at = await self._in_executor(self._maintain)  # Composting takes the field locks
+            self._next_wake = wake_at
+            timeout = None if wake_at == math.inf else max(wake_at - self.clock.time(), 0.0)
+            woken = await self.clock.await_event(self._async_wake, timeout)
+            self._measure_lag(wake_at, woken)
+            self._count_breaths()
+
+    async def stop_breathing(self) -> None:
+        """
+        Gently conclude the background breath.
+        """
+        self.is_breathing = False
+        task = self.background_task
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            self.background_task = None
+        if self.profiler is not None:
+            self.profiler.stop()
+        self._loop = None
+        self._async_wake = None
+        self._next_wake = math.inf
+        self._voice(f"🤲 {self.name} holds its breath in stillness...")
+
+    async def _in_executor(self, work: Callable, *args):
+        """Run blocking field work in the executor, leaving the loop free."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(work, *args))
+
+    async def emit(self, field_name: str, symbol: str, emotion: str = "neutral",
+                   amplitude: float = 1.0, decay_rate: float = 0.01) -> Optional[PulseObject]:
+        """
+        Emit a pulse into a named field.
+        """
+        field = self.get_field(field_name)
+        if field is None:
+            return None
+        return await self._in_executor(field.emit, symbol, emotion, amplitude, decay_rate)
+
+    async def compost(self, threshold: float = 0.01) -> Dict[str, int]:
+        """
+        Compost every field now, returning how many pulses each released.
+        """
+        composted = {}
+        for field in list(self.fields):
+            composted[field.name] = await self._in_executor(field.compost, threshold)
+        return composted
+
+    async def status(self) -> dict:
+        """
+        Current state of the entire contemplative system.
+        """
+        return await self._in_executor(self.system_status)
+
+    async def contemplative_pause(self, cycles: int = 1) -> None:
+        """
+        Pause for contemplation without holding up the event loop.
+        """
+        self._voice(f"🧘 Entering contemplative pause for {cycles} breath cycle(s)...")
+        for i in range(cycles):
+            await self.breath.breathe()
+        self._voice("✨ Pause complete. Presence renewed.")
@@ -0,0 +1,114 @@
+"""
+⏳ CLOCK – Where Spirida learns what time it is
+
+Every pulse, field and breath asks its clock for the present moment
+instead of reading the wall directly. Most of the time that clock is
+the SystemClock, which simply follows real time. A VirtualClock keeps
+its own time, which only moves when it is told to - so a lunar month
+of composting can pass in the blink of an eye, and the same story can
+be told again exactly.
+
+    clock = VirtualClock()
+    system = ContemplativeSystem("rehearsal", clock=clock)
+    clock.advance(28 * 24 * 3600)  # A whole lunar cycle, at once
+
+See spirida.simulation for a driver that moves a virtual clock from
+one event to the next.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class SystemClock:
+    """Real time, as the operating system keeps it."""
+
+    def time(self) -> float:
+        """The present moment, in seconds since the epoch."""
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        """Rest for a while."""
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        """Rest until the event is set or the timeout passes. Returns whether it was set."""
+        return event.wait(timeout)
+
+    async def asleep(self, seconds: float) -> None:
+        """Rest for a while inside an event loop."""
+        await asyncio.sleep(seconds)
+
+    async def await_event(self, event: asyncio.Event, timeout: Optional[float] = None) -> bool:
+        """Rest in an event loop until the event is set or the timeout passes."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return event.is_set()
+
+    def __repr__(self):
+        return "SystemClock()"
+
+
+# The clock everything uses unless it is given another
+SYSTEM_CLOCK = SystemClock()
+
+
+class VirtualClock(SystemClock):
+    """
+    A clock whose time moves only when advanced.
+
+    Sleeping on a virtual clock advances it instead of waiting, so code
+    that breathes (BreathCycle, contemplative_pause) runs as fast as the
+    CPU allows. A thread waiting on the clock is woken as soon as the
+    clock is advanced past its deadline.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        self._now = time.time() if start is None else float(start)
+        self._moved = threading.Condition()
+
+    def time(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """Move time forward by `seconds`. Returns the new present."""
+        return self.advance_to(self._now + max(seconds, 0.0))
+
+    def advance_to(self, moment: float) -> float:
+        """Move time forward to `moment` (time never runs backwards)."""
+        with self._moved:
+            if moment > self._now:
+                self._now = moment
+                self._moved.notify_all()
+            return self._now
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else self._now + timeout
+        with self._moved:
+            while not event.is_set() and (deadline is None or self._now < deadline):
+                # The event cannot wake us itself, so look again now and then
+                self._moved.wait(0.05)
+        return event.is_set()
+
+    async def asleep(self, seconds: float) -> None:
+        self.advance(seconds)
+        await asyncio.sleep(0)  # Still let the other coroutines breathe
+
+    async def await_event(self, event: asyncio.Event, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else self._now + timeout
+        while not event.is_set() and (deadline is None or self._now < deadline):
+            try:
+                await asyncio.wait_for(event.wait(), 0.05)
+            except asyncio.TimeoutError:
+                pass
+        return event.is_set()
+
+    def __repr__(self):
+        return f"VirtualClock({self._now:.3f})"
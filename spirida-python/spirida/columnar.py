@@ -0,0 +1,856 @@
+"""
+🌾 COLUMNAR STORE – Dense soil for very large fields
+
+A SpiralField normally holds its pulses as a list of PulseObjects.
+That is gentle and simple, but a field of hundreds of thousands of
+pulses asks for a different kind of soil: here every quality of a
+pulse (birth, amplitude, decay rate, symbol, emotion...) lives in its
+own contiguous numpy array, and the field can sense attention, compost
+and total resonance for all pulses in a single breath.
+
+Individual pulses are still met as PulseObjects - each one is a light
+PulseView that reads and writes its row in the store. When a pulse is
+composted, any view still held elsewhere keeps its final values, so
+nothing you are holding suddenly disappears.
+
+numpy is optional for Spirida as a whole; it is only needed here.
+"""
+
+import math
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional – only the columnar store needs it
+    np = None
+
+from .contemplative_core import PulseObject, FieldObserver, PULSE_COLUMNS
+from .resonance import (HARMONIES, ATTENTION_BANDS, ResonanceKernel, attention_band, new_resonance_history,
+                        resonance_poetry, NO_HISTORY, STRENGTHENING_THRESHOLD)
+from .energy import AttentionEnergy
+from .clock import SYSTEM_CLOCK
+
+
+class _Column:
+    """A PulseView attribute that lives in one column of the store."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        store = view._store
+        if store is None:
+            return view._frozen[self.name]
+        with store.lock:  # Rows may move if another thread composts
+            row = view._resolve()
+            if row < 0:
+                return view._frozen[self.name]
+            return store.columns[self.name][row].item()
+
+    def __set__(self, view, value) -> None:
+        store = view._store
+        if store is None:
+            view._frozen[self.name] = value
+            return
+        with store.lock:
+            row = view._resolve()
+            if row < 0:
+                view._frozen[self.name] = value
+            else:
+                store.columns[self.name][row] = value
+
+
+class _AmplitudeColumn(_Column):
+    """Amplitude, which the store's fade keys and energy sums need to hear about."""
+
+    def __set__(self, view, value) -> None:
+        store = view._store
+        if store is None:
+            view._frozen[self.name] = value
+            return
+        with store.lock:
+            row = view._resolve()
+            if row < 0:
+                view._frozen[self.name] = value
+            else:
+                column = store.columns[self.name]
+                previous = column[row].item()
+                column[row] = value
+                store.amplitude_changed(view, previous)
+
+
+class _InternedColumn:
+    """A PulseView attribute stored as a small integer id (symbol or emotion)."""
+
+    def __init__(self, name: str, table: str):
+        self.name = name
+        self.table = table
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        store = view._store
+        if store is None:
+            return view._frozen[self.name]
+        with store.lock:
+            row = view._resolve()
+            if row < 0:
+                return view._frozen[self.name]
+            interned = int(store.columns[self.name + "_id"][row])
+        return getattr(HARMONIES, self.table).names[interned]
+
+    def __set__(self, view, value) -> None:
+        interned = getattr(HARMONIES, self.table).intern(value)
+        store = view._store
+        if store is not None:
+            with store.lock:
+                row = view._resolve()
+                if row >= 0:
+                    store.columns[self.name + "_id"][row] = interned
+                    return
+        view._frozen[self.name] = value
+        view._frozen[self.name + "_id"] = interned
+
+
+class _HistoryColumn:
+    """Resonance history, created only for pulses that actually resonate."""
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        store = view._store
+        if store is None:
+            return view._frozen["resonance_history"]
+        with store.lock:
+            row = view._resolve()
+            if row < 0:
+                return view._frozen["resonance_history"]
+            history = store._histories[row]
+            if history is None:
+                history = store._new_history()
+                if history is not NO_HISTORY:
+                    store._histories[row] = history
+            return history
+
+    def __set__(self, view, value) -> None:
+        store = view._store
+        if store is not None:
+            with store.lock:
+                row = view._resolve()
+                if row >= 0:
+                    store._histories[row] = value
+                    return
+        view._frozen["resonance_history"] = value
+
+
+class PulseView(PulseObject):
+    """
+    A pulse that lives as one row of a ColumnarPulseStore.
+
+    It behaves exactly like a PulseObject - it can pulse, resonate,
+    strengthen and fade - but its qualities are read from and written
+    to the store's arrays rather than kept in the object itself.
+    """
+
+    symbol = _InternedColumn("symbol", "symbols")
+    emotion = _InternedColumn("emotion", "emotions")
+    symbol_id = _Column("symbol_id")
+    emotion_id = _Column("emotion_id")
+    birth = _Column("birth")
+    last_pulse = _Column("last_pulse")
+    amplitude = _AmplitudeColumn("amplitude")
+    decay_rate = _Column("decay_rate")
+    pulse_count = _Column("pulse_count")
+    resonance_history = _HistoryColumn()
+
+    def __init__(self, store: 'ColumnarPulseStore', uid: int, row: int):
+        # PulseObject.__init__ is deliberately not called: the row already
+        # holds everything a newborn pulse would set.
+        self._store = store
+        self.clock = store.clock
+        self._uid = uid
+        self._row = row
+        self._epoch = store._epoch
+        self._frozen: Dict = {}
+
+    def _resolve(self) -> int:
+        """Find this pulse's current row, or -1 once it has been composted."""
+        store = self._store
+        if store is None:
+            return -1
+        if self._epoch != store._epoch:
+            self._row = store._row_of(self._uid)
+            self._epoch = store._epoch
+        return self._row
+
+    def _detach(self) -> None:
+        """Keep the final values of a composted pulse inside the view itself."""
+        row = self._resolve()
+        if row < 0:
+            return
+        store = self._store
+        frozen = {name: store.columns[name][row].item()
+                  for name in ("birth", "last_pulse", "amplitude", "decay_rate", "pulse_count",
+                               "symbol_id", "emotion_id")}
+        frozen["symbol"] = store.symbols[int(store.columns["symbol_id"][row])]
+        frozen["emotion"] = store.emotions[int(store.columns["emotion_id"][row])]
+        history = store._histories[row]
+        frozen["resonance_history"] = store._new_history() if history is None else history
+        self._frozen = frozen
+        self._store = None
+        self._row = -1
+
+
+class _PulseSequence:
+    """A read-only, list-like window onto the pulses of a columnar store."""
+
+    def __init__(self, store: 'ColumnarPulseStore'):
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        store = self._store
+        with store.lock:
+            if isinstance(index, slice):
+                return [store.view(row) for row in range(*index.indices(len(store)))]
+            size = len(store)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError("pulse index out of range")
+            return store.view(index)
+
+    def __iter__(self):
+        return iter(self._store.snapshot())
+
+    def __repr__(self):
+        return f"<{len(self)} pulses in columnar store>"
+
+
+class _ColumnSnapshot:
+    """A private copy of a store's live columns, for readers that take their time."""
+
+    def __init__(self, store: 'ColumnarPulseStore'):
+        self._size = store._size
+        self.columns = {name: column[:store._size].copy() for name, column in store.columns.items()}
+
+
+class ColumnarPulseStore:
+    """
+    Keeps a field's pulses in contiguous numpy arrays.
+
+    Attention, compost and total resonance are computed for the whole
+    field at once. Symbols and emotions are kept as their ids in the
+    shared harmony registry, so that every row has the same fixed width
+    and the resonance kernel can look relationships up in the registry
+    by id.
+
+    Rows stay in birth order: composting compacts the arrays while
+    keeping the order, and each pulse carries a stable uid.
+
+    Each row also keeps its fade key - the moment its attention crosses
+    1.0, as in spirida.fade_index - kept current as its amplitude
+    changes. Composting compares every key with the threshold in one
+    pass, rather than keeping a fade index entry per pulse.
+
+    Every change happens under the store's lock, which the owning
+    SpiralField holds while it emits and composts; PulseViews take the
+    same lock to find their row, so they stay safe to use from any thread.
+    """
+
+    FLOAT_COLUMNS = ("birth", "last_pulse", "amplitude", "decay_rate", "fade_key")
+    BLOCK_PAIRS = 1 << 18  # Pairs scored per vectorised block in resonance queries
+    INT_COLUMNS = ("uid", "symbol_id", "emotion_id", "pulse_count")
+
+    def __init__(self, capacity: int = 1024, history: str = "full", history_size: int = 16, clock=None):
+        if np is None:
+            raise ImportError(
+                "The columnar pulse store needs numpy - install it with "
+                "'pip install numpy', or use storage='list'."
+            )
+        capacity = max(int(capacity), 16)
+        self.clock = SYSTEM_CLOCK if clock is None else clock
+        self.columns: Dict[str, 'np.ndarray'] = {}
+        for name in self.FLOAT_COLUMNS:
+            self.columns[name] = np.empty(capacity, dtype=np.float64)
+        for name in self.INT_COLUMNS:
+            self.columns[name] = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+        self._next_uid = 0
+        self._epoch = 0  # Changes whenever rows move
+        self._histories: List = []  # Created only once a pulse first resonates
+        self.history = history
+        self.history_size = history_size
+        self._views: 'weakref.WeakValueDictionary[int, PulseView]' = weakref.WeakValueDictionary()
+
+        self.symbols = HARMONIES.symbols.names  # Shared with every pulse in the process
+        self.emotions = HARMONIES.emotions.names
+        self.resonance_kernel = ResonanceKernel()
+        self._energy = AttentionEnergy()
+        self.lock = threading.RLock()  # Held by the field around every change
+        self._snapshot: Optional[Tuple[PulseView, ...]] = None
+        self.observers: List[FieldObserver] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def pulses(self) -> _PulseSequence:
+        """The pulses of this store, met one by one as PulseViews."""
+        return _PulseSequence(self)
+
+    def snapshot(self) -> Tuple[PulseView, ...]:
+        """
+        The pulses held right now, as a tuple that later changes cannot
+        disturb. It is shared by every reader until the store next changes.
+        """
+        with self.lock:
+            if self._snapshot is None:
+                self._snapshot = tuple(self.view(row) for row in range(self._size))
+            return self._snapshot
+
+    def _column(self, name: str) -> 'np.ndarray':
+        """The live part of a column."""
+        return self.columns[name][:self._size]
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        for name, column in self.columns.items():
+            grown = np.empty(len(column) * 2, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self.columns[name] = grown
+
+    def _row_of(self, uid: int) -> int:
+        """Locate a pulse by uid. Rows stay sorted by uid, so this is a binary search."""
+        uids = self._column("uid")
+        row = int(np.searchsorted(uids, uid))
+        if row < self._size and uids[row] == uid:
+            return row
+        return -1
+
+    def _new_history(self):
+        return new_resonance_history(self.history, self.history_size)
+
+    def _key_fades(self, rows) -> None:
+        """
+        Work out the fade keys of some rows: the moment each one's
+        attention crosses 1.0, birth + ln(amplitude) / decay_rate (-inf
+        once its amplitude is gone). Rows that do not decay have no key.
+        """
+        columns = self.columns
+        amplitudes = columns["amplitude"][rows]
+        decays = columns["decay_rate"][rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            keys = np.where(amplitudes > 0, columns["birth"][rows] + np.log(amplitudes) / decays, -np.inf)
+        columns["fade_key"][rows] = np.where(decays > 0, keys, np.nan)
+
+    def _faded(self, threshold: float, now: float) -> 'np.ndarray':
+        """Which rows have fallen below the threshold at `now`."""
+        decays = self._column("decay_rate")
+        fading = decays > 0
+        log_threshold = np.log(threshold) if threshold > 0 else -np.inf
+        with np.errstate(divide="ignore", invalid="ignore"):
+            faded = fading & (self._column("fade_key") < now + log_threshold / decays)
+        steady = ~fading
+        if steady.any():
+            # Pulses that do not decay only fade if they were never strong enough
+            faded[steady] = self.attention(now)[steady] < threshold
+        return faded
+
+    def view(self, row: int) -> PulseView:
+        """The PulseView for a row, shared with anyone already holding it."""
+        with self.lock:
+            uid = int(self.columns["uid"][row])
+            view = self._views.get(uid)
+            if view is None:
+                view = PulseView(self, uid, row)
+                self._views[uid] = view
+            return view
+
+    def emit(self, symbol: str, emotion: Optional[str] = None,
+             amplitude: float = 1.0, decay_rate: float = 0.01) -> PulseView:
+        """Birth a new pulse as a fresh row."""
+        if self._size == len(self.columns["uid"]):
+            self._grow()
+        row = self._size
+        birth = self.clock.time()
+        columns = self.columns
+        columns["uid"][row] = self._next_uid
+        columns["birth"][row] = birth
+        columns["last_pulse"][row] = birth
+        columns["amplitude"][row] = amplitude
+        columns["decay_rate"][row] = decay_rate
+        columns["pulse_count"][row] = 0
+        columns["symbol_id"][row] = HARMONIES.symbols.intern(symbol)
+        columns["emotion_id"][row] = HARMONIES.emotions.intern(emotion or "neutral")
+        self._histories.append(None)
+        self._key_fades(slice(row, row + 1))
+        self._energy.add(birth, amplitude, decay_rate)
+        self._next_uid += 1
+        self._size += 1
+        self._snapshot = None
+        view = self.view(row)
+        for observer in self.observers:
+            observer.emitted(view)
+        return view
+
+    def emit_many(self, symbols: List[str], emotions: List[str], amplitudes: List[float],
+                  decay_rates: List[float], births: List[float]) -> int:
+        """Birth many pulses as fresh rows, each at its own given moment. Returns how many."""
+        count = len(symbols)
+        while self._size + count > len(self.columns["uid"]):
+            self._grow()
+        start, stop = self._size, self._size + count
+        columns = self.columns
+        columns["uid"][start:stop] = np.arange(self._next_uid, self._next_uid + count)
+        columns["birth"][start:stop] = births
+        columns["last_pulse"][start:stop] = births
+        columns["amplitude"][start:stop] = amplitudes
+        columns["decay_rate"][start:stop] = decay_rates
+        columns["pulse_count"][start:stop] = 0
+        symbol_ids = {s: HARMONIES.symbols.intern(s) for s in set(symbols)}
+        emotion_ids = {e: HARMONIES.emotions.intern(e) for e in set(emotions)}
+        columns["symbol_id"][start:stop] = [symbol_ids[s] for s in symbols]
+        columns["emotion_id"][start:stop] = [emotion_ids[e] for e in emotions]
+        self._histories.extend([None] * count)
+        self._energy_by_decay(slice(start, stop), columns["amplitude"][start:stop], count=1)
+        self._key_fades(slice(start, stop))
+        self._next_uid += count
+        self._size = stop
+        self._snapshot = None
+        if self.observers:
+            views = [self.view(row) for row in range(start, stop)]
+            for observer in self.observers:
+                for view in views:
+                    observer.emitted(view)
+        return count
+
+    def resonate_many(self, count: int) -> None:
+        """
+        Let the last `count` rows resonate with every row before each of
+        them, a block of rows at a time, each pair meeting at the later
+        of their births. Strengths are all scored first, then applied.
+        """
+        first = self._size - count
+        gains = np.zeros(self._size)
+        new_histories = self.history != "off"
+        for block_start in range(first, self._size, max(1, self.BLOCK_PAIRS // self._size)):
+            block_stop = min(block_start + max(1, self.BLOCK_PAIRS // self._size), self._size)
+            strengths = self.resonance_kernel.score_meetings(self, slice(block_start, block_stop),
+                                                             slice(0, block_stop))
+            # Each new row meets only the rows before it
+            later = np.arange(block_stop)[None, :] >= np.arange(block_start, block_stop)[:, None]
+            strengths[later] = 0.0
+            strengths[strengths <= STRENGTHENING_THRESHOLD] = 0.0
+            gains[block_start:block_stop] += strengths.sum(axis=1)
+            gains[:block_stop] += strengths.sum(axis=0)
+            if new_histories:
+                for offset, row_strengths in enumerate(strengths):
+                    others = np.flatnonzero(row_strengths)
+                    if len(others) == 0:
+                        continue
+                    row = block_start + offset
+                    history = self._histories[row]
+                    if history is None:
+                        history = self._histories[row] = self._new_history()
+                    history.record_many(float(self.columns["birth"][row]),
+                                        [self.symbols[i] for i in self.columns["symbol_id"][others].tolist()],
+                                        [self.emotions[i] for i in self.columns["emotion_id"][others].tolist()],
+                                        row_strengths[others].tolist(), [None] * len(others))
+        rows = np.flatnonzero(gains)
+        if len(rows):
+            self.strengthen_rows(rows, gains[rows])
+
+    def export(self) -> Tuple[Dict[str, 'np.ndarray'], List[str], List[str]]:
+        """
+        The pulses held here at rest, in order: a copy of each column in
+        PULSE_COLUMNS, with the symbol and emotion tables their ids index.
+        """
+        with self.lock:
+            columns = {name: self._column(name).copy() for name in PULSE_COLUMNS}
+            return columns, list(self.symbols), list(self.emotions)
+
+    def histories(self) -> List:
+        """The resonance history of each pulse (None if it never resonated), in the order of export()."""
+        with self.lock:
+            return list(self._histories)
+
+    def restore(self, columns: Dict[str, 'np.ndarray'], symbols: List[str], emotions: List[str],
+                histories: Optional[List] = None) -> None:
+        """
+        Take back pulses that were stored at rest, in bulk, keeping their
+        births so that they resume fading exactly where they left off.
+
+        `columns` holds one array per name in PULSE_COLUMNS, in uid order;
+        symbol and emotion ids index into `symbols` and `emotions`.
+        Resonance histories start afresh unless `histories` gives one per
+        pulse (None where there is none).
+        """
+        with self.lock:
+            count = len(columns["uid"])
+            if count == 0:
+                return
+            while self._size + count > len(self.columns["uid"]):
+                self._grow()
+            # Local ids in the stored table become ids in this process's registry
+            symbol_ids = np.array([HARMONIES.symbols.intern(s) for s in symbols] or [0], dtype=np.int64)
+            emotion_ids = np.array([HARMONIES.emotions.intern(e) for e in emotions] or [0], dtype=np.int64)
+            start, stop = self._size, self._size + count
+            for name in PULSE_COLUMNS:
+                values = np.asarray(columns[name])
+                if name == "symbol_id":
+                    values = symbol_ids[values]
+                elif name == "emotion_id":
+                    values = emotion_ids[values]
+                self.columns[name][start:stop] = values
+            self._energy_by_decay(slice(start, stop), self.columns["amplitude"][start:stop], count=1)
+            self._key_fades(slice(start, stop))
+            self._histories.extend([None] * count if histories is None else histories)
+            self._size = stop
+            if start and self.columns["uid"][start] <= self.columns["uid"][start - 1]:
+                # Keep rows in uid order so that views can find them
+                order = np.argsort(self._column("uid"), kind="stable")
+                for column in self.columns.values():
+                    column[:stop] = column[:stop][order]
+                self._histories = [self._histories[i] for i in order.tolist()]
+                self._epoch += 1
+            self._next_uid = max(self._next_uid, int(self._column("uid").max()) + 1)
+            self._snapshot = None
+
+    def _view_of(self, uid: int) -> Optional[PulseView]:
+        """The PulseView for a uid, or None if that pulse is no longer held."""
+        with self.lock:
+            view = self._views.get(uid)
+            if view is None:
+                row = self._row_of(uid)
+                if row < 0:
+                    return None
+                view = self.view(row)
+            return view
+
+    def attention(self, now: Optional[float] = None) -> 'np.ndarray':
+        """Current attention of every pulse, computed in one pass."""
+        age = (self.clock.time() if now is None else now) - self._column("birth")
+        return self._column("amplitude") * np.exp(-self._column("decay_rate") * age)
+
+    def total_attention(self, now: Optional[float] = None) -> float:
+        """Sum of the attention every pulse still carries, from the running energy sums."""
+        if self._energy.needs_rebuild:
+            self._rebuild_energy()
+        return self._energy.total(self.clock.time() if now is None else now)
+
+    def _energy_by_decay(self, rows, amplitudes, count: int) -> None:
+        """Report amplitude changes for many rows to the running energy sums."""
+        self._energy.add_arrays(self.columns["birth"][rows], amplitudes, self.columns["decay_rate"][rows], count)
+
+    def _rebuild_energy(self) -> None:
+        self._energy.rebuild((), self.clock.time())
+        self._energy_by_decay(slice(0, self._size), self._column("amplitude"), count=1)
+
+    def strengthen_rows(self, rows: 'np.ndarray', strengths: 'np.ndarray') -> None:
+        """Bulk form of PulseObject.strengthen_from_resonance for many rows."""
+        strong = strengths > STRENGTHENING_THRESHOLD
+        rows = rows[strong]
+        amplitude = self.columns["amplitude"]
+        previous = amplitude[rows]
+        amplitude[rows] = np.minimum(previous + strengths[strong] * 0.1, 1.0)
+        self._energy_by_decay(rows, amplitude[rows] - previous, count=0)
+        self._key_fades(rows)
+        for observer in self.observers:
+            observer.amplitudes_changed(self.columns["uid"][rows].tolist(), amplitude[rows].tolist())
+
+    def amplitude_changed(self, pulse: PulseView, previous: float) -> None:
+        """Called by a view whenever its amplitude changes."""
+        row = pulse._resolve()
+        self._key_fades(slice(row, row + 1))
+        columns = self.columns
+        birth, amplitude, decay_rate = (columns[name][row].item() for name in ("birth", "amplitude", "decay_rate"))
+        self._energy.add(birth, amplitude - previous, decay_rate, count=0)
+        for observer in self.observers:
+            observer.amplitudes_changed([pulse._uid], [amplitude])
+
+    def resonate_batch(self, pulse: PulseView, now: float) -> Optional[Tuple]:
+        """
+        Let a newly emitted pulse resonate with every pulse born before it,
+        as the list store does: one pulse after another, at the same
+        instant, each strong resonance strengthening both sides - so the
+        new pulse meets later pulses with the attention it has gained.
+
+        Its attention only matters through the band it falls in (see
+        attention_band), so the existing pulses are scored in one
+        vectorised pass for each band it reaches, and its restorations
+        are added up in order until its band changes.
+
+        Returns (rows, symbols, emotions, strengths) of the existing pulses
+        that resonated strongly, or None if none did.
+        """
+        row = pulse._resolve()
+        if row <= 0:
+            return None
+        columns = self.columns
+        fading = np.exp(-columns["decay_rate"][row] * (now - columns["birth"][row]))  # Attention per amplitude
+        amplitude = columns["amplitude"][row]
+        by_band: Dict[int, 'np.ndarray'] = {}
+        taken_rows, taken = [], []
+        start = 0
+        while start < row:
+            band = int(attention_band(amplitude * fading))
+            strengths = by_band.get(band)
+            if strengths is None:
+                strengths = by_band[band] = self.resonance_kernel.score(self, row, now,
+                                                                        attention=ATTENTION_BANDS[band])
+            rows = np.flatnonzero(strengths[start:] > STRENGTHENING_THRESHOLD) + start
+            if len(rows) == 0:
+                break
+            gains = strengths[rows]
+            # The amplitude after each restoration in turn, min(amplitude + strength * 0.1, 1.0)
+            amplitudes = np.minimum(np.cumsum(np.concatenate(([amplitude], gains * 0.1)))[1:], 1.0)
+            moved = np.flatnonzero(attention_band(amplitudes * fading) != band)
+            take = len(rows) if len(moved) == 0 else int(moved[0]) + 1
+            taken_rows.append(rows[:take])
+            taken.append(gains[:take])
+            amplitude = amplitudes[take - 1]
+            start = int(rows[take - 1]) + 1
+        if not taken_rows:
+            return None
+        strong_rows = np.concatenate(taken_rows)
+        strong = np.concatenate(taken)
+        self.strengthen_rows(strong_rows, strong)
+        pulse.amplitude = float(amplitude)
+        symbols = [self.symbols[i] for i in self.columns["symbol_id"][strong_rows].tolist()]
+        emotions = [self.emotions[i] for i in self.columns["emotion_id"][strong_rows].tolist()]
+        return strong_rows.tolist(), symbols, emotions, strong.tolist()
+
+    def _resonance_blocks(self, min_strength: float, now: float, source=None):
+        """
+        Score every pair (i, j) with i < j, a block of rows at a time.
+
+        Yields (first_row, strengths, mask) where strengths[r, c] is the
+        resonance of row first_row + r with row first_row + 1 + c, and
+        mask marks the pairs at or above min_strength. `source` may be a
+        _ColumnSnapshot to score instead of the live columns.
+        """
+        if source is None:
+            source = self
+        size = source._size
+        block = max(1, self.BLOCK_PAIRS // max(size, 1))
+        for start in range(0, size - 1, block):
+            stop = min(start + block, size - 1)
+            strengths = self.resonance_kernel.score_block(source, slice(start, stop), slice(start + 1, size), now)
+            # Keep only partners born after each row (j > i)
+            later = np.arange(size - start - 1)[None, :] >= np.arange(stop - start)[:, None]
+            yield start, strengths, later & (strengths >= min_strength)
+
+    def find_resonances(self, min_strength: float, now: float) -> List[Tuple[PulseView, PulseView, Dict]]:
+        """
+        Let every pair (i, j) with i < j meet at `now`, as
+        SpiralField.find_resonances does: each meeting is recorded in
+        pulse i's history with its poetry, and (pulse_a, pulse_b,
+        resonance) is returned for pairs at or above min_strength, in
+        the same order and shape as PulseObject.resonates_with gives.
+        
+        The pairs are scored a block of rows at a time over the columns;
+        only the recording and the poetry are done pair by pair.
+        """
+        found = []
+        remember = self.history != "off"
+        with self.lock:
+            size = self._size
+            symbols = [self.symbols[i] for i in self._column("symbol_id").tolist()]
+            emotions = [self.emotions[i] for i in self._column("emotion_id").tolist()]
+            block = max(1, self.BLOCK_PAIRS // max(size, 1))
+            for start in range(0, size - 1, block):
+                stop = min(start + block, size - 1)
+                scored = self.resonance_kernel.score_block(self, slice(start, stop), slice(start + 1, size), now,
+                                                           components=True)
+                for offset in range(stop - start):
+                    row = start + offset
+                    # Partners born after this row: rows row + 1 ... size - 1
+                    strengths, symbolic, emotional, temporal, attentional = (
+                        matrix[offset, offset:].tolist() for matrix in scored)
+                    partners = range(row + 1, size)
+                    if remember:
+                        traces = [resonance_poetry(symbols[row], emotions[row], symbols[j], emotions[j], strength)
+                                  for j, strength in zip(partners, strengths)]
+                        history = self._histories[row]
+                        if history is None:
+                            history = self._histories[row] = self._new_history()
+                        history.record_many(now, symbols[row + 1:], emotions[row + 1:], strengths, traces)
+                    for k, strength in enumerate(strengths):
+                        if strength < min_strength:
+                            continue
+                        j = row + 1 + k
+                        trace = traces[k] if remember else resonance_poetry(
+                            symbols[row], emotions[row], symbols[j], emotions[j], strength)
+                        found.append((self.view(row), self.view(j), {
+                            "strength": strength,
+                            "poetic_trace": trace,
+                            "components": {
+                                "symbolic": symbolic[k],
+                                "emotional": emotional[k],
+                                "temporal": temporal[k],
+                                "attentional": attentional[k]
+                            }
+                        }))
+        return found
+    
+    def iter_resonances(self, min_strength: float, now: float):
+        """
+        Lazily yield (pulse_a, pulse_b, strength) for every pair at or above
+        min_strength, in the same order as SpiralField.find_resonances.
+
+        The columns are copied once at the start, so the field may go on
+        changing while the pairs are wandered through; a pair is skipped
+        if either pulse has been composted by the time it is reached.
+        """
+        with self.lock:
+            source = _ColumnSnapshot(self)
+        uids = source.columns["uid"].tolist()
+        for start, strengths, mask in self._resonance_blocks(min_strength, now, source):
+            rows, cols = np.nonzero(mask)
+            for row, col, strength in zip(rows.tolist(), cols.tolist(), strengths[rows, cols].tolist()):
+                pulse_a = self._view_of(uids[start + row])
+                pulse_b = self._view_of(uids[start + 1 + col])
+                if pulse_a is not None and pulse_b is not None:
+                    yield pulse_a, pulse_b, strength
+
+    def count_resonances(self, min_strength: float, now: float) -> int:
+        """How many pairs resonate at or above min_strength."""
+        return sum(int(np.count_nonzero(mask)) for _, _, mask in self._resonance_blocks(min_strength, now))
+
+    def top_resonances(self, k: int, min_strength: float, now: float) -> List[Tuple[float, PulseView, PulseView]]:
+        """The k strongest pairs as (strength, pulse_a, pulse_b), strongest first."""
+        return self.tally_resonances(k, min_strength, now)[1]
+
+    def tally_resonances(self, k: int, min_strength: float,
+                         now: float) -> Tuple[int, List[Tuple[float, PulseView, PulseView]]]:
+        """
+        How many pairs resonate at or above min_strength, together with
+        the k strongest as top_resonances gives them - in one pass over
+        the blocks.
+        """
+        count = 0
+        best_strengths = np.empty(0)
+        best_a = np.empty(0, dtype=np.int64)
+        best_b = np.empty(0, dtype=np.int64)
+        for start, strengths, mask in self._resonance_blocks(min_strength, now):
+            rows, cols = np.nonzero(mask)
+            count += len(rows)
+            if k <= 0:
+                continue
+            best_strengths = np.concatenate([best_strengths, strengths[rows, cols]])
+            best_a = np.concatenate([best_a, rows + start])
+            best_b = np.concatenate([best_b, cols + start + 1])
+            if len(best_strengths) > k:
+                keep = np.argpartition(-best_strengths, k - 1)[:k]
+                best_strengths, best_a, best_b = best_strengths[keep], best_a[keep], best_b[keep]
+        # Strongest first; equal strengths in field order
+        order = np.lexsort((best_b, best_a, -best_strengths))
+        return count, [(strength, self.view(a), self.view(b)) for strength, a, b in
+                       zip(best_strengths[order].tolist(), best_a[order].tolist(), best_b[order].tolist())]
+
+    def discard_faded(self, threshold: float, now: Optional[float] = None) -> int:
+        """Release every pulse below the threshold. Returns how many were released."""
+        if now is None:
+            now = self.clock.time()
+        return self._compact(~self._faded(threshold, now), now)
+
+    def discard_faded_alone(self, threshold: float, min_strength: float, now: float) -> int:
+        """
+        Release the pulses below the threshold that resonate above
+        min_strength with no pulse still above it - resonant composting,
+        with each faded pulse scored against all present ones at once.
+        """
+        faded = self.attention(now) < threshold
+        if not faded.any():
+            return 0
+        keep = ~faded
+        present = np.flatnonzero(keep)
+        if len(present):
+            faded_rows = np.flatnonzero(faded)
+            block = max(1, self.BLOCK_PAIRS // len(present))
+            for start in range(0, len(faded_rows), block):
+                rows = faded_rows[start:start + block]
+                strengths = self.resonance_kernel.score_block(self, rows, present, now)
+                keep[rows[(strengths > min_strength).any(axis=1)]] = True
+        return self._compact(keep, now)
+
+    def next_fade(self, threshold: float, now: Optional[float] = None) -> Optional[float]:
+        """The earliest moment discard_faded(threshold) could release a pulse, or None."""
+        with self.lock:
+            if now is None:
+                now = self.clock.time()
+            decays = self._column("decay_rate")
+            fading = decays > 0
+            deadline = None
+            if fading.any():
+                log_threshold = np.log(threshold) if threshold > 0 else -np.inf
+                deadline = float((self._column("fade_key")[fading] - log_threshold / decays[fading]).min())
+            if not fading.all() and (self.attention(now)[~fading] < threshold).any():
+                deadline = now if deadline is None else min(deadline, now)  # A steady pulse below it is due at once
+            return deadline
+
+    def next_crossing(self, thresholds: Tuple[float, ...], since: float) -> Optional[float]:
+        """
+        The first moment after `since` at which some pulse's attention
+        falls below one of the thresholds (or a pulse is born already
+        below it), or None if no such moment will come.
+        """
+        with self.lock:
+            births = self._column("birth")
+            amplitudes = self._column("amplitude")
+            decays = self._column("decay_rate")
+            fade_keys = self._column("fade_key")
+            fading = decays > 0
+            earliest = math.inf
+            for threshold in thresholds:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    crossings = np.where(fading, np.maximum(fade_keys - math.log(threshold) / decays, births),
+                                         np.where(amplitudes < threshold, births, np.inf))
+                later = crossings[crossings > since]
+                if len(later):
+                    earliest = min(earliest, float(later.min()))
+            return None if earliest == math.inf else earliest
+
+    def discard(self, pulses: List[PulseObject]) -> int:
+        """Release the given pulses. Returns how many were released."""
+        uids = [p._uid for p in pulses if isinstance(p, PulseView) and p._store is self]
+        if not uids:
+            return 0
+        return self._compact(~np.isin(self._column("uid"), uids))
+
+    def _compact(self, keep: 'np.ndarray', now: Optional[float] = None) -> int:
+        """Drop every row where keep is False, preserving order."""
+        kept = int(np.count_nonzero(keep))
+        released = self._size - kept
+        if released == 0:
+            return 0
+
+        gone_rows = np.flatnonzero(~keep)
+        if self.observers:
+            gone_views = [self.view(row) for row in gone_rows.tolist()]
+            now = self.clock.time() if now is None else now
+            for observer in self.observers:
+                observer.released(gone_views, now)
+        self._energy_by_decay(gone_rows, -self.columns["amplitude"][gone_rows], count=-1)
+
+        # Views of released pulses keep their final values
+        if self._views:
+            gone = set(self._column("uid")[~keep].tolist())
+            for uid, view in list(self._views.items()):
+                if uid in gone:
+                    view._detach()
+
+        for name, column in self.columns.items():
+            column[:kept] = column[:self._size][keep]
+        self._histories = [h for h, k in zip(self._histories, keep.tolist()) if k]
+        self._size = kept
+        self._epoch += 1
+        self._snapshot = None
+        return released
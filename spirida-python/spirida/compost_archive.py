@@ -0,0 +1,287 @@
+"""
+🍂 COMPOST ARCHIVE – What faded, remembered elsewhere
+
+Composting lets a field forget, and its only trace is a counter. Some
+fields must still be able to say what faded, and when - without
+keeping it in the living field. A CompostArchive follows a field and
+carries each composted pulse, with the attention it had left and a
+summary of its resonances, into cold storage:
+
+    archive = CompostArchive("archive/journal")
+    journal.add_observer(archive)
+    ...
+    for record in archive.scan(start=yesterday, symbol="🌙"):
+        print(record["symbol"], record["final_attention"])
+
+Composting only hands the pulses over; a background writer encodes
+them into gzip-compressed segments of JSON lines and begins a new
+segment every `segment_records` pulses. Each closed segment is noted
+in a manifest with the span of time it covers and the symbols it
+holds, so a scan opens only the segments that could match and reads
+them line by line - an archive never has to fit in memory.
+
+A segment left open by a crash is taken in when the archive is next
+opened: the whole records that reached the disk are kept, and the
+segment is noted in the manifest like any other. Should writing fail,
+composting carries on undisturbed; the error is raised once, by the
+next flush() or close().
+"""
+
+import gzip
+import json
+import math
+import os
+import queue
+import re
+import threading
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .contemplative_core import FieldObserver, PulseObject
+from .resonance import ResonanceSummary
+
+_SEGMENT_NAME = re.compile(r"compost-(\d{6})\.jsonl\.gz$")
+_CLOSE = object()  # Tells the writer to finish
+_ROTATE = object()  # Tells the writer to close the open segment
+
+
+def resonance_aggregates(history) -> Dict[str, Any]:
+    """Count, mean and max strength of a resonance history, whatever its policy."""
+    if isinstance(history, ResonanceSummary):
+        return {"resonance_count": history.count, "mean_resonance": history.mean_strength,
+                "max_resonance": history.max_strength}
+    strengths = [event["resonance_strength"] for event in history or ()]
+    return {"resonance_count": len(strengths),
+            "mean_resonance": sum(strengths) / len(strengths) if strengths else 0.0,
+            "max_resonance": max(strengths, default=0.0)}
+
+
+class CompostArchive(FieldObserver):
+    """
+    A compost sink that archives the pulses a field releases.
+
+    Attach it with field.add_observer(). Composting only queues the
+    released pulses; encoding, compression and writing happen on the
+    archive's own thread. Call flush() to wait until everything queued
+    is written, and close() to finish the open segment. Both raise the
+    writer's error, if it met one since they were last called.
+    """
+
+    def __init__(self, path: str, segment_records: int = 100000, compresslevel: int = 6):
+        if segment_records <= 0:
+            raise ValueError("segment_records must be positive")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.segment_records = segment_records
+        self.compresslevel = compresslevel
+        self.archived = 0
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._segment = None
+        self._segment_info: Optional[Dict[str, Any]] = None
+        self._error: Optional[BaseException] = None  # What the writer met, until flush() or close() raises it
+        self._closed = False
+        existing = [int(m.group(1)) for m in map(_SEGMENT_NAME.match, os.listdir(path)) if m]
+        self._next_segment = max(existing, default=-1) + 1
+        self._recover()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True,
+                                        name=f"compost-{os.path.basename(os.path.normpath(path))}")
+        self._writer.start()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.path, "manifest.jsonl")
+
+    # Receiving - called by the field, under its lock
+
+    def released(self, pulses: List[PulseObject], now: float) -> None:
+        if self._closed:
+            raise ValueError(f"The compost archive at {self.path} is closed")
+        # Take only what is needed; the writer works the rest out
+        self._queue.put((now, [(p._uid, p.symbol, p.emotion, p.birth, p.amplitude, p.decay_rate,
+                                p.pulse_count, p.resonance_history) for p in pulses]))
+
+    # Writing - on the archive's own thread
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _CLOSE:
+                    self._close_segment()
+                    return
+                if item is _ROTATE:
+                    self._close_segment()
+                    continue
+                self._write(*item)
+            except Exception as error:  # Kept for flush() or close() - never raised into a compost
+                if self._error is None:
+                    self._error = error
+                self._abandon_segment()
+                if item is _CLOSE:
+                    return
+            finally:
+                self._queue.task_done()
+
+    def _write(self, now: float, pulses: List[Tuple]) -> None:
+        for uid, symbol, emotion, birth, amplitude, decay_rate, pulse_count, history in pulses:
+            record = {
+                "uid": uid,
+                "symbol": symbol,
+                "emotion": emotion,
+                "birth": birth,
+                "composted_at": now,
+                "amplitude": amplitude,
+                "decay_rate": decay_rate,
+                "pulse_count": pulse_count,
+                "final_attention": amplitude * math.exp(-decay_rate * (now - birth)),
+            }
+            record.update(resonance_aggregates(history))
+            self._write_record(record)
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        if self._segment is None:
+            name = f"compost-{self._next_segment:06d}.jsonl.gz"
+            self._next_segment += 1
+            self._segment = gzip.open(os.path.join(self.path, name), "wt", encoding="utf-8",
+                                      compresslevel=self.compresslevel)
+            self._segment_info = {"segment": name, "records": 0, "first": math.inf, "last": -math.inf,
+                                  "symbols": set()}
+        self._segment.write(json.dumps(record, ensure_ascii=False) + "\n")
+        info = self._segment_info
+        info["records"] += 1
+        info["first"] = min(info["first"], record["composted_at"])
+        info["last"] = max(info["last"], record["composted_at"])
+        info["symbols"].add(record["symbol"])
+        self.archived += 1
+        if info["records"] >= self.segment_records:
+            self._close_segment()
+
+    def _close_segment(self) -> None:
+        """Finish the open segment and note it in the manifest."""
+        if self._segment is None:
+            return
+        self._segment.close()
+        info = dict(self._segment_info, symbols=sorted(self._segment_info["symbols"]))
+        with open(self.manifest_path, "a", encoding="utf-8") as manifest:
+            manifest.write(json.dumps(info, ensure_ascii=False) + "\n")
+        self._segment = None
+        self._segment_info = None
+
+    def _abandon_segment(self) -> None:
+        """Let go of a segment that could not be written; the next opening takes in what it holds."""
+        segment, self._segment, self._segment_info = self._segment, None, None
+        if segment is not None:
+            try:
+                segment.close()
+            except Exception:
+                pass
+
+    def _recover(self) -> None:
+        """Take in the segments a crash left open - those the manifest does not know."""
+        listed = {info["segment"] for info in read_manifest(self.path)}
+        for name in sorted(os.listdir(self.path)):
+            if _SEGMENT_NAME.match(name) and name not in listed:
+                self._recover_segment(name)
+
+    def _recover_segment(self, name: str) -> None:
+        """Keep a crashed segment's whole records, written out afresh, and note it in the manifest."""
+        path = os.path.join(self.path, name)
+        records = list(_whole_records(path))
+        if not records:
+            os.remove(path)
+            return
+        temporary = path + ".tmp"
+        with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=self.compresslevel) as segment:
+            for record in records:
+                segment.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temporary, path)
+        info = {"segment": name, "records": len(records),
+                "first": min(record["composted_at"] for record in records),
+                "last": max(record["composted_at"] for record in records),
+                "symbols": sorted({record["symbol"] for record in records})}
+        with open(self.manifest_path, "a", encoding="utf-8") as manifest:
+            manifest.write(json.dumps(info, ensure_ascii=False) + "\n")
+
+    def _raise_error(self) -> None:
+        """Raise what the writer met, once."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def rotate(self) -> None:
+        """Close the open segment once everything queued before it is written, so scans can see it."""
+        self._queue.put(_ROTATE)
+
+    def flush(self) -> None:
+        """Wait until every pulse handed over so far has been written."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write everything still queued, finish the open segment and stop the writer."""
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join()
+        self._raise_error()
+
+    # Reading
+
+    def scan(self, start: Optional[float] = None, end: Optional[float] = None,
+             symbol: Optional[str] = None, emotion: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Archived pulses composted between `start` and `end` (inclusive),
+        optionally only those of one symbol or emotion. Covers closed
+        segments only - rotate() and flush() first to include the latest.
+        """
+        return scan_archive(self.path, start, end, symbol, emotion)
+
+    def __repr__(self):
+        return f"CompostArchive({self.path!r}, archived={self.archived})"
+
+
+def _whole_records(path: str) -> Iterator[Dict[str, Any]]:
+    """The records of a segment, up to wherever a crash tore it."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as segment:
+            for line in segment:
+                if not line.endswith("\n"):
+                    return  # The last line never reached the disk whole
+                yield json.loads(line)
+    except (EOFError, OSError, ValueError, zlib.error):
+        return  # The compressed stream ends where the crash came
+
+
+def read_manifest(path: str) -> List[Dict[str, Any]]:
+    """The closed segments of the archive at `path`, oldest first."""
+    manifest = os.path.join(path, "manifest.jsonl")
+    if not os.path.exists(manifest):
+        return []
+    with open(manifest, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def scan_archive(path: str, start: Optional[float] = None, end: Optional[float] = None,
+                 symbol: Optional[str] = None, emotion: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the archived pulses at `path` that match, segment by segment
+    and line by line. Segments whose span of time or symbols cannot
+    match are not opened at all.
+    """
+    start = -math.inf if start is None else start
+    end = math.inf if end is None else end
+    for info in read_manifest(path):
+        if info["last"] < start or info["first"] > end:
+            continue
+        if symbol is not None and symbol not in info["symbols"]:
+            continue
+        with gzip.open(os.path.join(path, info["segment"]), "rt", encoding="utf-8") as segment:
+            for line in segment:
+                record = json.loads(line)
+                if not start <= record["composted_at"] <= end:
+                    continue
+                if symbol is not None and record["symbol"] != symbol:
+                    continue
+                if emotion is not None and record["emotion"] != emotion:
+                    continue
+                yield record
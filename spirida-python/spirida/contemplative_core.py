@@ -11,14 +11,26 @@ Each component is designed not just to function, but to participate
 in the temporal dance of attention, decay, and renewal.
 """
 
+import os
 import time
 import math
 import asyncio
+import gc
 import threading
 from datetime import datetime, timedelta
-from typing import List, Optional, Any, Callable, Dict, Union
+from typing import List, Optional, Any, Callable, Dict, Iterator, Tuple, Union
+import heapq
 import random
 
+from .resonance import (symbol_harmony, emotion_resonance, temporal_proximity, attention_resonance,
+                        synthesize_resonance, interned_pair_strength, resonance_poetry, new_resonance_history,
+                        HARMONIES, HISTORY_POLICIES, STRENGTHENING_THRESHOLD, ATTENTION_EDGES)
+from .fade_index import FadeIndex
+from .energy import AttentionEnergy
+from .clock import SYSTEM_CLOCK
+from .sinks import OutputSink, as_sink, default_sink
+from .metrics import Metrics, gauge
+
 class PulseObject:
     """
     A contemplative data vessel that carries meaning through time.
@@ -26,32 +38,114 @@ class PulseObject:
     Not just a container, but a participant in temporal presence.
     Each pulse knows when it was born, how strongly it resonates,
     and when it's time to fade into the compost of memory.
+    
+    How much of its resonance a pulse remembers is set by its history
+    policy: "full" (every event), "ring" (the last `history_size`
+    events), "aggregate" (running count, mean/max strength and last
+    partner) or "off".
+    
+    Time is read from `clock` (see spirida.clock), real time by default.
     """
     
+    _uid: Optional[int] = None  # Given by the field store that holds this pulse
+    
     def __init__(self, symbol: str, emotion: Optional[str] = None, 
-                 amplitude: float = 1.0, decay_rate: float = 0.01):
+                 amplitude: float = 1.0, decay_rate: float = 0.01,
+                 history: str = "full", history_size: int = 16, clock=None):
+        self._store = None  # The field store holding this pulse, if any
+        self.clock = SYSTEM_CLOCK if clock is None else clock
         self.symbol = symbol
         self.emotion = emotion or "neutral"
-        self.birth = time.time()
+        self.birth = self.clock.time()
         self.last_pulse = self.birth
-        self.amplitude = amplitude
+        self._amplitude = amplitude
         self.decay_rate = decay_rate
         self.pulse_count = 0
-        self.resonance_history: List[Dict] = []  # Track resonance interactions
+        self.resonance_history = new_resonance_history(history, history_size)  # Track resonance interactions
+    
+    @classmethod
+    def _at_rest(cls, rows: Iterator[Tuple], symbols: List[str], emotions: List[str],
+                 history: str, history_size: int, clock, store) -> List['PulseObject']:
+        """
+        Pulses taken back from rest, one per (uid, birth, last_pulse,
+        amplitude, decay_rate, pulse_count, symbol_id, emotion_id) row -
+        as __init__ would make them, without reading the clock or
+        interning a name once for every pulse.
+        """
+        symbol_ids = [HARMONIES.symbols.intern(symbol) for symbol in symbols]
+        emotion_ids = [HARMONIES.emotions.intern(emotion or "neutral") for emotion in emotions]
+        emotions = [emotion or "neutral" for emotion in emotions]
+        new = cls.__new__
+        pulses = []
+        for uid, birth, last_pulse, amplitude, decay_rate, pulse_count, symbol_id, emotion_id in rows:
+            pulse = new(cls)
+            pulse.__dict__ = {
+                "_store": store, "clock": clock,
+                "_symbol": symbols[symbol_id], "symbol_id": symbol_ids[symbol_id],
+                "_emotion": emotions[emotion_id], "emotion_id": emotion_ids[emotion_id],
+                "birth": birth, "last_pulse": last_pulse, "_amplitude": amplitude,
+                "decay_rate": decay_rate, "pulse_count": pulse_count,
+                "resonance_history": new_resonance_history(history, history_size),
+                "_uid": uid,
+            }
+            pulses.append(pulse)
+        return pulses
         
-    def current_attention(self) -> float:
-        """Calculate how much attention this pulse still carries."""
-        now = time.time()
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+    
+    @symbol.setter
+    def symbol(self, value: str) -> None:
+        self._symbol = value
+        self.symbol_id = HARMONIES.symbols.intern(value)  # Its place in the harmony matrix
+    
+    @property
+    def emotion(self) -> str:
+        return self._emotion
+    
+    @emotion.setter
+    def emotion(self, value: str) -> None:
+        self._emotion = value
+        self.emotion_id = HARMONIES.emotions.intern(value)
+    
+    @property
+    def amplitude(self) -> float:
+        """The strength this pulse was born with, renewed by resonance."""
+        return self._amplitude
+    
+    @amplitude.setter
+    def amplitude(self, value: float) -> None:
+        store = self._store
+        if store is None:
+            self._amplitude = value
+            return
+        with store.lock:
+            previous = self._amplitude
+            self._amplitude = value
+            if self._store is store:  # Unless composted while we waited
+                # Let the field know - a weaker pulse will fade sooner
+                store.amplitude_changed(self, previous)
+        
+    def current_attention(self, now: Optional[float] = None) -> float:
+        """
+        Calculate how much attention this pulse still carries - at `now`
+        if given (as clock.time()), so that many pulses can be sensed at
+        one shared instant, or else at this very moment.
+        """
+        if now is None:
+            now = self.clock.time()
         age = now - self.birth
         return self.amplitude * math.exp(-self.decay_rate * age)
     
-    def pulse(self, output_fn: Optional[Callable] = None) -> float:
+    def pulse(self, output_fn: Optional[Callable] = None, now: Optional[float] = None) -> float:
         """
         Emit the pulse, breathing its presence into the world.
         Returns current attention level.
         """
-        now = time.time()
-        attention = self.current_attention()
+        if now is None:
+            now = self.clock.time()
+        attention = self.current_attention(now)
         self.pulse_count += 1
         
         pulse_msg = f"{self.symbol} [{self.emotion}] • attention: {attention:.3f}"
@@ -59,29 +153,32 @@ class PulseObject:
         if output_fn:
             output_fn(pulse_msg)
         else:
-            print(pulse_msg)
+            default_sink().write(pulse_msg)
             
         self.last_pulse = now
         return attention
     
-    def resonates_with(self, other: 'PulseObject') -> Dict[str, Union[float, str]]:
+    def resonates_with(self, other: 'PulseObject', now: Optional[float] = None) -> Dict[str, Union[float, str]]:
         """
         Discover the resonance between this pulse and another.
         
         Returns a dictionary with resonance strength and poetic trace.
         Resonance is not just similarity—it's about meaningful relationship.
         """
+        if now is None:
+            now = self.clock.time()
+        
         # Symbolic resonance - certain symbols naturally harmonize
-        symbol_harmony = self._calculate_symbol_harmony(other.symbol)
+        symbol_harmony = HARMONIES.symbol_harmony(self.symbol_id, other.symbol_id)
         
         # Emotional resonance - emotions can strengthen, complement, or transform each other
-        emotion_resonance = self._calculate_emotion_resonance(other.emotion)
+        emotion_resonance = HARMONIES.emotion_resonance(self.emotion_id, other.emotion_id)
         
         # Temporal resonance - pulses born close in time may share context
         temporal_proximity = self._calculate_temporal_proximity(other)
         
         # Attention resonance - how the current attention levels interact
-        attention_resonance = self._calculate_attention_resonance(other)
+        attention_resonance = self._calculate_attention_resonance(other, now)
         
         # Composite resonance - not just additive, but emergent
         total_resonance = self._synthesize_resonance(
@@ -92,14 +189,8 @@ class PulseObject:
         poetic_trace = self._generate_resonance_poetry(other, total_resonance)
         
         # Record this resonance event
-        resonance_event = {
-            "timestamp": time.time(),
-            "other_symbol": other.symbol,
-            "other_emotion": other.emotion,
-            "resonance_strength": total_resonance,
-            "poetic_trace": poetic_trace
-        }
-        self.resonance_history.append(resonance_event)
+        self.resonance_history.record(now, other.symbol, other.emotion,
+                                      total_resonance, poetic_trace)
         
         return {
             "strength": total_resonance,
@@ -112,159 +203,410 @@ class PulseObject:
             }
         }
     
+    def resonance_strength(self, other: 'PulseObject', now: Optional[float] = None) -> float:
+        """
+        Sense how strongly this pulse resonates with another - quietly.
+        
+        Nothing is recorded in the resonance history and no poetry is
+        written; only the strength is returned.
+        """
+        return self._synthesize_resonance(
+            HARMONIES.symbol_harmony(self.symbol_id, other.symbol_id),
+            HARMONIES.emotion_resonance(self.emotion_id, other.emotion_id),
+            self._calculate_temporal_proximity(other),
+            self._calculate_attention_resonance(other, now)
+        )
+    
     def _calculate_symbol_harmony(self, other_symbol: str) -> float:
         """Calculate how symbols resonate with each other."""
-        # Define natural harmonies between symbols
-        harmonies = {
-            "🌿": {"🌱": 0.9, "🌊": 0.7, "🍄": 0.8, "🌲": 0.9},
-            "💧": {"🌊": 0.9, "🌿": 0.7, "🌙": 0.6, "💎": 0.5},
-            "✨": {"🌙": 0.8, "🪐": 0.7, "💫": 0.9, "🔮": 0.6},
-            "🍄": {"🌿": 0.8, "🌲": 0.7, "🏔️": 0.6, "🌍": 0.8},
-            "🌙": {"✨": 0.8, "🌊": 0.6, "🕯️": 0.7, "💧": 0.6},
-            "🪐": {"✨": 0.7, "🌌": 0.9, "🔭": 0.6, "💫": 0.8}
-        }
-        
-        # Check for direct harmony
-        if self.symbol in harmonies and other_symbol in harmonies[self.symbol]:
-            return harmonies[self.symbol][other_symbol]
-        
-        # Reverse check
-        if other_symbol in harmonies and self.symbol in harmonies[other_symbol]:
-            return harmonies[other_symbol][self.symbol]
-        
-        # Same symbol resonates with itself
-        if self.symbol == other_symbol:
-            return 0.8
-        
-        # Default subtle resonance - everything is connected
-        return 0.2
+        return symbol_harmony(self.symbol, other_symbol)
     
     def _calculate_emotion_resonance(self, other_emotion: str) -> float:
         """Calculate emotional resonance patterns."""
-        emotion_relationships = {
-            "calm": {"peaceful": 0.9, "centered": 0.8, "grateful": 0.7, "grief": 0.6},
-            "grief": {"tender": 0.8, "melancholy": 0.9, "calm": 0.6, "healing": 0.7},
-            "joy": {"grateful": 0.8, "hopeful": 0.9, "celebration": 0.9, "peaceful": 0.6},
-            "curious": {"wondering": 0.9, "exploring": 0.8, "hopeful": 0.7, "excited": 0.6},
-            "peaceful": {"calm": 0.9, "centered": 0.8, "still": 0.9, "present": 0.8},
-            "grateful": {"joy": 0.8, "appreciation": 0.9, "humble": 0.7, "loving": 0.8}
-        }
-        
-        # Direct emotional resonance
-        if self.emotion in emotion_relationships:
-            if other_emotion in emotion_relationships[self.emotion]:
-                return emotion_relationships[self.emotion][other_emotion]
-        
-        # Reverse check
-        if other_emotion in emotion_relationships:
-            if self.emotion in emotion_relationships[other_emotion]:
-                return emotion_relationships[other_emotion][self.emotion]
-        
-        # Same emotion
-        if self.emotion == other_emotion:
-            return 0.8
-        
-        # Default emotional connection
-        return 0.3
+        return emotion_resonance(self.emotion, other_emotion)
     
     def _calculate_temporal_proximity(self, other: 'PulseObject') -> float:
         """Calculate how temporal closeness affects resonance."""
-        time_diff = abs(self.birth - other.birth)
-        
-        # Pulses born within seconds resonate strongly
-        if time_diff < 5:
-            return 0.9
-        elif time_diff < 30:
-            return 0.7
-        elif time_diff < 300:  # 5 minutes
-            return 0.4
-        else:
-            return 0.1
+        return temporal_proximity(self.birth, other.birth)
     
-    def _calculate_attention_resonance(self, other: 'PulseObject') -> float:
+    def _calculate_attention_resonance(self, other: 'PulseObject', now: Optional[float] = None) -> float:
         """Calculate how current attention levels interact."""
-        my_attention = self.current_attention()
-        other_attention = other.current_attention()
-        
-        # Strong pulses amplify each other
-        if my_attention > 0.7 and other_attention > 0.7:
-            return 0.8
-        
-        # One strong pulse can revive a fading one
-        elif (my_attention > 0.7 and other_attention > 0.2) or (other_attention > 0.7 and my_attention > 0.2):
-            return 0.6
-        
-        # Both fading creates gentle resonance
-        elif my_attention < 0.3 and other_attention < 0.3:
-            return 0.4
-        
-        return 0.3
+        if now is None:
+            now = self.clock.time()
+        return attention_resonance(self.current_attention(now), other.current_attention(now))
     
     def _synthesize_resonance(self, symbolic: float, emotional: float, 
                             temporal: float, attentional: float) -> float:
         """Synthesize component resonances into emergent total."""
-        # Not just average - some combinations create emergent properties
-        base_resonance = (symbolic + emotional + temporal + attentional) / 4
-        
-        # High emotional + symbolic creates amplification
-        if emotional > 0.7 and symbolic > 0.7:
-            base_resonance *= 1.3
-        
-        # Strong temporal proximity amplifies everything
-        if temporal > 0.8:
-            base_resonance *= 1.2
-        
-        # Cap at 1.0
-        return min(base_resonance, 1.0)
+        return synthesize_resonance(symbolic, emotional, temporal, attentional)
     
     def _generate_resonance_poetry(self, other: 'PulseObject', strength: float) -> str:
         """Generate poetic traces of resonance."""
-        if strength > 0.8:
-            poems = [
-                f"{self.symbol} and {other.symbol} sing in harmony...",
-                f"Deep resonance flows between {self.emotion} and {other.emotion}...",
-                f"Two pulses become one rhythm...",
-                f"The field trembles with recognition..."
-            ]
-        elif strength > 0.6:
-            poems = [
-                f"{self.symbol} recognizes {other.symbol} across time...",
-                f"Echoes of {self.emotion} stir {other.emotion}...",
-                f"A gentle connection forms...",
-                f"Frequencies align in subtle dance..."
-            ]
-        elif strength > 0.4:
-            poems = [
-                f"{self.symbol} notices {other.symbol} in passing...",
-                f"Faint harmonies between {self.emotion} and {other.emotion}...",
-                f"A whisper of connection...",
-                f"Distant resonance, like memory..."
-            ]
-        else:
-            poems = [
-                f"{self.symbol} and {other.symbol} share the same field...",
-                f"All pulses are connected, even in silence...",
-                f"The subtlest resonance, barely perceptible...",
-                f"Unity in the underlying stillness..."
-            ]
-        
-        return random.choice(poems)
+        return resonance_poetry(self.symbol, self.emotion, other.symbol, other.emotion, strength)
     
     def strengthen_from_resonance(self, resonance_strength: float) -> None:
         """Allow resonance to strengthen this pulse's attention."""
-        if resonance_strength > 0.6:
+        if resonance_strength > STRENGTHENING_THRESHOLD:
             # Strong resonance can restore some amplitude
             restoration = resonance_strength * 0.1
             self.amplitude = min(self.amplitude + restoration, 1.0)
     
-    def is_faded(self, threshold: float = 0.01) -> bool:
+    def is_faded(self, threshold: float = 0.01, now: Optional[float] = None) -> bool:
         """Has this pulse faded below the threshold of meaningful presence?"""
-        return self.current_attention() < threshold
+        return self.current_attention(now) < threshold
     
     def __repr__(self):
         return f"PulseObject({self.symbol}, {self.emotion}, attention={self.current_attention():.3f})"
 
 
+class FieldObserver:
+    """
+    Listens to the life of the pulses in one field's store - the way
+    persistence, logging and archiving keep up with a field.
+    
+    Stores call these while holding their lock, in the order things
+    happen. Pulses are known by the uid their store gave them.
+    """
+    
+    def emitted(self, pulse: PulseObject) -> None:
+        """A pulse was born (before any resonance strengthened it)."""
+    
+    def amplitudes_changed(self, uids: List[int], amplitudes: List[float]) -> None:
+        """The amplitudes of some pulses changed to these values."""
+    
+    def released(self, pulses: List[PulseObject], now: float) -> None:
+        """These pulses were composted at `now`; they still hold their final values."""
+
+
+# The qualities that describe a pulse at rest, for storing and restoring fields
+PULSE_COLUMNS = ("uid", "birth", "last_pulse", "amplitude", "decay_rate", "pulse_count",
+                 "symbol_id", "emotion_id")
+
+# The ways a field may compost - see SpiralField.compost
+COMPOSTING_MODES = ("natural", "seasonal", "resonant", "lunar")
+
+
+class ListPulseStore:
+    """
+    The original home of a field's pulses – a plain list of PulseObjects.
+    
+    Simple and flexible, well suited to small and intimate fields.
+    Larger fields can choose the columnar store in spirida.columnar,
+    which speaks the same gentle interface.
+    
+    A FadeIndex knows when each pulse will fade, so composting only
+    touches the pulses that actually have, and an AttentionEnergy keeps
+    the total attention as a running sum per decay rate.
+    
+    A pulse's birth and decay rate are fixed once it is held here;
+    its amplitude may change freely.
+    
+    Every change happens under the store's lock, which the owning
+    SpiralField holds while it emits and composts.
+    """
+    
+    def __init__(self, history: str = "full", history_size: int = 16, clock=None):
+        self._pulses: List[PulseObject] = []
+        self.clock = SYSTEM_CLOCK if clock is None else clock
+        self._fade_index = FadeIndex(self._fade_state)
+        self._energy = AttentionEnergy()
+        self.history = history
+        self.history_size = history_size
+        self.lock = threading.RLock()
+        self._snapshot: Optional[Tuple[PulseObject, ...]] = None
+        self._next_uid = 0
+        self.observers: List[FieldObserver] = []
+        
+    def __len__(self) -> int:
+        return len(self._pulses)
+    
+    @property
+    def pulses(self) -> List[PulseObject]:
+        return self._pulses
+    
+    @pulses.setter
+    def pulses(self, pulses: List[PulseObject]) -> None:
+        with self.lock:
+            for pulse in self._pulses:
+                pulse._store = None
+            self._pulses = list(pulses)
+            self._snapshot = None
+            self._fade_index.clear()
+            for pulse in self._pulses:
+                pulse._store = self
+                if pulse._uid is None:
+                    pulse._uid = self._next_uid
+                    self._next_uid += 1
+                self._fade_index.add(pulse, pulse.birth, pulse.amplitude, pulse.decay_rate)
+            self._rebuild_energy()
+    
+    def snapshot(self) -> Tuple[PulseObject, ...]:
+        """
+        The pulses held right now, as a tuple that later changes cannot
+        disturb. It is shared by every reader until the store next changes.
+        """
+        with self.lock:
+            if self._snapshot is None:
+                self._snapshot = tuple(self._pulses)
+            return self._snapshot
+    
+    def _rebuild_energy(self) -> None:
+        self._energy.rebuild(((p.birth, p.amplitude, p.decay_rate) for p in self._pulses), self.clock.time())
+    
+    def _fade_state(self, pulse: PulseObject):
+        """What the fade index needs to know about a pulse still held here."""
+        if pulse._store is not self:
+            return None
+        return pulse.birth, pulse.amplitude, pulse.decay_rate
+    
+    def emit(self, symbol: str, emotion: Optional[str] = None,
+             amplitude: float = 1.0, decay_rate: float = 0.01) -> PulseObject:
+        """Birth a new pulse and hold it in the list."""
+        pulse = PulseObject(symbol, emotion, amplitude, decay_rate,
+                            history=self.history, history_size=self.history_size, clock=self.clock)
+        pulse._store = self
+        pulse._uid = self._next_uid
+        self._next_uid += 1
+        self._pulses.append(pulse)
+        self._snapshot = None
+        self._fade_index.add(pulse, pulse.birth, amplitude, decay_rate)
+        self._energy.add(pulse.birth, amplitude, decay_rate)
+        for observer in self.observers:
+            observer.emitted(pulse)
+        return pulse
+    
+    def emit_many(self, symbols: List[str], emotions: List[str], amplitudes: List[float],
+                  decay_rates: List[float], births: List[float]) -> int:
+        """Birth many pulses, each at its own given moment. Returns how many."""
+        history, history_size, clock = self.history, self.history_size, self.clock
+        born = []
+        for symbol, emotion, amplitude, decay_rate, birth in zip(symbols, emotions, amplitudes,
+                                                                 decay_rates, births):
+            pulse = PulseObject(symbol, emotion, amplitude, decay_rate,
+                                history=history, history_size=history_size, clock=clock)
+            pulse.birth = pulse.last_pulse = birth
+            pulse._store = self
+            pulse._uid = self._next_uid
+            self._next_uid += 1
+            self._fade_index.add(pulse, birth, amplitude, decay_rate)
+            self._energy.add(birth, amplitude, decay_rate)
+            born.append(pulse)
+        self._pulses.extend(born)
+        self._snapshot = None
+        for observer in self.observers:
+            for pulse in born:
+                observer.emitted(pulse)
+        return len(born)
+    
+    def export(self) -> Tuple[Dict[str, List], List[str], List[str]]:
+        """
+        The pulses held here at rest, in order: one list per name in
+        PULSE_COLUMNS, with the symbol and emotion tables their ids index.
+        """
+        symbols: Dict[str, int] = {}
+        emotions: Dict[str, int] = {}
+        with self.lock:
+            pulses = list(self._pulses)
+        columns = {
+            "uid": [p._uid for p in pulses],
+            "birth": [p.birth for p in pulses],
+            "last_pulse": [p.last_pulse for p in pulses],
+            "amplitude": [p.amplitude for p in pulses],
+            "decay_rate": [p.decay_rate for p in pulses],
+            "pulse_count": [p.pulse_count for p in pulses],
+            "symbol_id": [symbols.setdefault(p.symbol, len(symbols)) for p in pulses],
+            "emotion_id": [emotions.setdefault(p.emotion, len(emotions)) for p in pulses],
+        }
+        return columns, list(symbols), list(emotions)
+    
+    def histories(self) -> List:
+        """The resonance history of each pulse, in the order of export()."""
+        with self.lock:
+            return [p.resonance_history for p in self._pulses]
+    
+    def restore(self, columns: Dict[str, List], symbols: List[str], emotions: List[str],
+                histories: Optional[List] = None) -> None:
+        """
+        Take back pulses that were stored at rest, keeping their births
+        so that they resume fading exactly where they left off.
+        
+        `columns` holds one sequence per name in PULSE_COLUMNS; symbol and
+        emotion ids index into `symbols` and `emotions`. Resonance
+        histories start afresh unless `histories` gives one per pulse
+        (None where there is none).
+        """
+        with self.lock:
+            values = [list(columns[name]) if isinstance(columns[name], (list, tuple)) else columns[name].tolist()
+                      for name in PULSE_COLUMNS]  # Plain Python numbers, even from numpy arrays
+            births, amplitudes, decay_rates = values[1], values[3], values[4]
+            collecting = gc.isenabled()
+            gc.disable()  # Nothing born here forms a cycle - collecting as millions arrive only slows them
+            try:
+                restored = PulseObject._at_rest(zip(*values), symbols, emotions,
+                                                self.history, self.history_size, self.clock, self)
+                # Fade heaps are built once per decay rate, and the energy summed per rate
+                self._fade_index.add_many(restored, births, amplitudes, decay_rates)
+            finally:
+                if collecting:
+                    gc.enable()
+            self._energy.add_many(births, amplitudes, decay_rates)
+            if histories is not None:
+                for pulse, history in zip(restored, histories):
+                    if history is not None:
+                        pulse.resonance_history = history
+            self._pulses.extend(restored)
+            self._snapshot = None
+            if restored:
+                self._next_uid = max(self._next_uid, max(values[0]) + 1)
+    
+    def amplitude_changed(self, pulse: PulseObject, previous: float) -> None:
+        """Called by a pulse held here whenever its amplitude changes."""
+        self._fade_index.amplitude_changed(pulse, pulse.birth, pulse.amplitude, pulse.decay_rate)
+        self._energy.add(pulse.birth, pulse.amplitude - previous, pulse.decay_rate, count=0)
+        for observer in self.observers:
+            observer.amplitudes_changed([pulse._uid], [pulse.amplitude])
+    
+    def total_attention(self, now: Optional[float] = None) -> float:
+        """Sum of the attention every pulse still carries."""
+        if now is None:
+            now = self.clock.time()
+        if self._energy.needs_rebuild:
+            self._rebuild_energy()
+        return self._energy.total(now)
+    
+    def iter_resonances(self, min_strength: float, now: float) -> Iterator[Tuple[PulseObject, PulseObject, float]]:
+        """
+        Lazily yield (pulse_a, pulse_b, strength) for every pair at or above
+        min_strength, in the same order as SpiralField.find_resonances.
+        Every pulse is sensed once, at the same instant, as held when the
+        wandering begins.
+        """
+        pulses = self.snapshot()
+        qualities = [(p.symbol_id, p.emotion_id, p.birth,
+                      p.amplitude * math.exp(-p.decay_rate * (now - p.birth))) for p in pulses]
+        for i, quality_a in enumerate(qualities):
+            for j in range(i + 1, len(qualities)):
+                strength = interned_pair_strength(*quality_a, *qualities[j])
+                if strength >= min_strength:
+                    yield pulses[i], pulses[j], strength
+    
+    def count_resonances(self, min_strength: float, now: float) -> int:
+        """How many pairs resonate at or above min_strength."""
+        return sum(1 for _ in self.iter_resonances(min_strength, now))
+    
+    def top_resonances(self, k: int, min_strength: float, now: float) -> List[Tuple[float, PulseObject, PulseObject]]:
+        """The k strongest pairs as (strength, pulse_a, pulse_b), strongest first."""
+        return self.tally_resonances(k, min_strength, now)[1]
+    
+    def tally_resonances(self, k: int, min_strength: float,
+                         now: float) -> Tuple[int, List[Tuple[float, PulseObject, PulseObject]]]:
+        """
+        How many pairs resonate at or above min_strength, together with
+        the k strongest as top_resonances gives them - in one wandering.
+        """
+        count = 0
+        strongest = []  # Min-heap of (strength, -order, pulse_a, pulse_b)
+        for order, (pulse_a, pulse_b, strength) in enumerate(self.iter_resonances(min_strength, now)):
+            count += 1
+            if k <= 0:
+                continue
+            entry = (strength, -order, pulse_a, pulse_b)  # Equal strengths keep field order
+            if len(strongest) < k:
+                heapq.heappush(strongest, entry)
+            elif entry > strongest[0]:
+                heapq.heapreplace(strongest, entry)
+        strongest.sort(reverse=True)
+        return count, [(strength, pulse_a, pulse_b) for strength, _, pulse_a, pulse_b in strongest]
+    
+    def discard_faded(self, threshold: float, now: Optional[float] = None) -> int:
+        """Release every pulse below the threshold. Returns how many were released."""
+        if now is None:
+            now = self.clock.time()
+        faded = self._fade_index.pop_faded(threshold, now)
+        return self._release(faded, now)
+    
+    def next_fade(self, threshold: float, now: Optional[float] = None) -> Optional[float]:
+        """The earliest moment discard_faded(threshold) could release a pulse, or None."""
+        with self.lock:
+            return self._fade_index.next_fade(threshold, self.clock.time() if now is None else now)
+    
+    def next_crossing(self, thresholds: Tuple[float, ...], since: float) -> Optional[float]:
+        """
+        The first moment after `since` at which some pulse's attention
+        falls below one of the thresholds (or a pulse is born already
+        below it), or None if no such moment will come.
+        """
+        earliest = math.inf
+        with self.lock:
+            for pulse in self._pulses:
+                birth, amplitude, decay_rate = pulse.birth, pulse.amplitude, pulse.decay_rate
+                for threshold in thresholds:
+                    if decay_rate > 0:
+                        crossing = birth + math.log(amplitude / threshold) / decay_rate if amplitude > 0 else birth
+                        crossing = max(crossing, birth)
+                    elif amplitude < threshold:
+                        crossing = birth
+                    else:
+                        continue
+                    if since < crossing < earliest:
+                        earliest = crossing
+        return None if earliest == math.inf else earliest
+    
+    def discard(self, pulses: List[PulseObject]) -> int:
+        """Release the given pulses. Returns how many were released."""
+        held = [p for p in pulses if p._store is self]
+        for pulse in held:
+            self._fade_index.remove(pulse)
+        return self._release(held)
+    
+    def _release(self, pulses: List[PulseObject], now: Optional[float] = None) -> int:
+        released = set(pulses)
+        if not released:
+            return 0
+        if self.observers:
+            in_order = [p for p in self._pulses if p in released]
+            now = self.clock.time() if now is None else now
+            for observer in self.observers:
+                observer.released(in_order, now)
+        self._pulses = [p for p in self._pulses if p not in released]
+        self._snapshot = None
+        for pulse in released:
+            pulse._store = None
+            self._energy.add(pulse.birth, -pulse.amplitude, pulse.decay_rate, count=-1)
+        return len(released)
+
+
+def _pulse_columns(pulses, now: float) -> Tuple[List[str], List[str], List[float], List[float], List[float]]:
+    """Gather the pulses given to SpiralField.emit_many into columns, filling in what is missing."""
+    if isinstance(pulses, dict):
+        count = len(pulses["symbol"])
+        
+        def column(name: str, default) -> list:
+            values = pulses.get(name)
+            if values is None:
+                return [default] * count
+            return values.tolist() if hasattr(values, "tolist") else list(values)
+        
+        symbols = column("symbol", None)
+        emotions = [e or "neutral" for e in column("emotion", "neutral")]
+        return (symbols, emotions, [float(a) for a in column("amplitude", 1.0)],
+                [float(d) for d in column("decay_rate", 0.01)],
+                [now if b is None else float(b) for b in column("birth", None)])
+    
+    symbols, emotions, amplitudes, decay_rates, births = [], [], [], [], []
+    for pulse in pulses:
+        if isinstance(pulse, dict):
+            pulse = (pulse["symbol"], pulse.get("emotion"), pulse.get("amplitude"),
+                     pulse.get("decay_rate"), pulse.get("birth"))
+        symbol, emotion, amplitude, decay_rate, birth = (tuple(pulse) + (None,) * 4)[:5]
+        symbols.append(symbol)
+        emotions.append(emotion or "neutral")
+        amplitudes.append(1.0 if amplitude is None else float(amplitude))
+        decay_rates.append(0.01 if decay_rate is None else float(decay_rate))
+        births.append(now if birth is None else float(birth))
+    return symbols, emotions, amplitudes, decay_rates, births
+
+
 class SpiralField:
     """
     An ecosystem that tends collections of pulses.
@@ -272,51 +614,335 @@ class SpiralField:
     Like a mycelial network, it provides the substrate for pulses
     to emerge, resonate, and gracefully fade. It practices the art
     of holding without grasping, remembering without hoarding.
+    
+    A field may be tended from many threads at once - several producers
+    emitting while the system's breath composts in the background:
+    
+    - Emitting (with its resonances), composting and replacing `pulses`
+      hold the field's lock, so no offering is ever lost to a compost.
+    - Readers such as status(), pulse_all() and find_resonances() work
+      from snapshot(): an immutable tuple of the pulses, copied at most
+      once per change and shared by every reader until the next one.
+    - Each field has its own lock, so separate fields never wait on
+      one another.
     """
     
-    def __init__(self, name: str = "unnamed_field", composting_mode: str = "natural"):
+    def __init__(self, name: str = "unnamed_field", composting_mode: str = "natural",
+                 storage: str = "list", history: str = "full", history_size: int = 16,
+                 clock=None, output: Union[OutputSink, Callable[[str], None], None] = None):
         self.name = name
-        self.pulses: List[PulseObject] = []
-        self.birth = time.time()
+        self.storage = storage
+        self.history = history  # How much resonance each pulse remembers
+        self.clock = SYSTEM_CLOCK if clock is None else clock  # Shared with every pulse born here
+        self._store = self._create_store(storage, history, history_size, self.clock)
+        self._lock = self._store.lock  # The writer lock - see the class docstring
+        self.birth = self.clock.time()
         self.total_emissions = 0
         self.total_composted = 0
         self.composting_mode = composting_mode
-        self.last_compost = time.time()
+        self.last_compost = self.clock.time()
         self.seasonal_cycle_hours = 24  # Default: daily cycle
+        self.maintenance_interval: Optional[float] = None  # Compost on a fixed cadence instead of at fade deadlines
+        self.on_emit: Optional[Callable[['SpiralField'], None]] = None  # Told after every emit, e.g. to wake maintenance
+        self.segments = None  # The SegmentStore keeping this field at rest, if opened from one
+        self.wal = None  # Its WriteAheadLog, if it keeps one
+        self.output = as_sink(output)  # Where the field speaks - the default sink if None
+        self._metrics: Optional[Metrics] = None  # Where emits and composts are measured, once instrumented
+        
+    @staticmethod
+    def _create_store(storage: str, history: str = "full", history_size: int = 16, clock=None):
+        """
+        Choose where the field keeps its pulses.
+        
+        - "list": a plain list of PulseObjects (the default)
+        - "columnar": contiguous numpy arrays, for fields holding many pulses
+        
+        Both hold, resonate and compost alike, but remember differently:
+        a pulse born into a list field records every pulse it meets, with
+        poetry, while one born into a columnar field records only the
+        resonances strong enough to strengthen both - with poetry only
+        for those it voices, and None for the rest.
+        
+        The history policy ("full", "ring", "aggregate" or "off") is
+        given to every pulse born in the field.
+        """
+        if history not in HISTORY_POLICIES:
+            raise ValueError(f"Unknown history policy '{history}' - choose one of {', '.join(HISTORY_POLICIES)}")
+        if storage == "list":
+            return ListPulseStore(history, history_size, clock)
+        if storage == "columnar":
+            # Imported here because numpy is optional and the columnar
+            # store builds on PulseObject from this module.
+            from .columnar import ColumnarPulseStore
+            return ColumnarPulseStore(history=history, history_size=history_size, clock=clock)
+        raise ValueError(f"Unknown storage '{storage}' - choose 'list' or 'columnar'")
+    
+    @classmethod
+    def open(cls, path: str, name: Optional[str] = None, composting_mode: str = "natural",
+             storage: str = "list", history: str = "full", history_size: int = 16,
+             clock=None, segment_capacity: int = 65536, wal: bool = False,
+             fsync_interval: float = 0.05,
+             output: Union[OutputSink, Callable[[str], None], None] = None) -> 'SpiralField':
+        """
+        Open a field kept at rest in a Spiralbase directory (see
+        spirida.segments), creating it if it does not exist yet.
+        
+        A field that was kept before wakes with its pulses, births and
+        counters as they were last synced, and resumes fading from its
+        pulses' stored births. From then on everything that happens in
+        the field is written through to the store; call sync() to put
+        it on disk, and close() when done.
+        
+        With wal=True the field also keeps a write-ahead log (see
+        spirida.wal), committed to disk every `fsync_interval` seconds.
+        Opening replays whatever the log holds, so a field that crashed
+        wakes as it was moments before - not merely at its last sync.
+        """
+        from .segments import SegmentStore
+        from .wal import WriteAheadLog, replay
+        
+        segments = SegmentStore(path, segment_capacity)
+        meta = segments.read_meta() or {}
+        field = cls(meta.get("name", name or os.path.basename(os.path.normpath(path))),
+                    meta.get("composting_mode", composting_mode),
+                    storage=storage, history=history, history_size=history_size, clock=clock,
+                    output=output)
+        if meta:
+            field.birth = meta["birth"]
+            field.total_emissions = meta["total_emissions"]
+            field.total_composted = meta["total_composted"]
+            field.seasonal_cycle_hours = meta["seasonal_cycle_hours"]
+        field._store.restore(*segments.live_records())
+        # Uids are never given twice, even to pulses born after all others composted
+        field._store._next_uid = max(field._store._next_uid, meta.get("next_uid", 0))
+        field.segments = segments
+        field.add_observer(segments)
+        if wal:
+            generation = segments.generation
+            field.wal = WriteAheadLog(os.path.join(path, "wal.log"), fsync_interval, generation)
+            recovered = replay(field.wal.path, field, generation, meta.get("next_uid", 0))
+            if field.wal.generation != generation:
+                field.wal.checkpoint(generation)  # Left from before the last sync - already stored
+            field.add_observer(field.wal)
+            if recovered:
+                field.sync()  # All it told is stored now - the log may begin again
+        return field
+    
+    def add_observer(self, observer: FieldObserver) -> None:
+        """Let an observer follow every pulse born, renewed and composted here."""
+        with self._lock:
+            self._store.observers.append(observer)
+    
+    def remove_observer(self, observer: FieldObserver) -> None:
+        with self._lock:
+            self._store.observers.remove(observer)
+    
+    def sync(self) -> None:
+        """Put the field, as it is now, on disk - for fields from SpiralField.open()."""
+        segments = self.segments
+        if segments is None:
+            return
+        with self._lock:
+            segments.record_activity(self._store.snapshot())
+            # Records first - the meta must never name a log whose records are not yet on disk
+            segments.flush()
+            segments.write_meta({
+                "name": self.name,
+                "composting_mode": self.composting_mode,
+                "birth": self.birth,
+                "total_emissions": self.total_emissions,
+                "total_composted": self.total_composted,
+                "seasonal_cycle_hours": self.seasonal_cycle_hours,
+                "next_uid": int(self._store._next_uid),
+                "wal_generation": segments.generation + 1,
+            })
+            segments.generation += 1
+            if self.wal is not None:
+                self.wal.checkpoint(segments.generation)  # All it held is stored now
+    
+    def close(self) -> None:
+        """Sync a field from SpiralField.open() and let go of its store."""
+        segments = self.segments
+        if segments is None:
+            return
+        self.sync()
+        with self._lock:
+            if self.wal is not None:
+                self._store.observers.remove(self.wal)
+                self.wal.close()
+                self.wal = None
+            self._store.observers.remove(segments)
+            segments.close()
+            self.segments = None
+    
+    def instrument(self, metrics: Optional[Metrics] = None) -> Metrics:
+        """
+        Begin measuring emits, resonance pairs and composts (see
+        spirida.metrics) into `metrics`, or a registry of the field's own.
+        """
+        self._metrics = Metrics() if metrics is None else metrics
+        return self._metrics
+    
+    @property
+    def pulses(self) -> List[PulseObject]:
+        """
+        The pulses currently alive in this field. This is the living
+        collection itself; use snapshot() to read from another thread.
+        """
+        return self._store.pulses
+    
+    @pulses.setter
+    def pulses(self, pulses: List[PulseObject]) -> None:
+        with self._lock:
+            self._store.pulses = pulses
+    
+    def snapshot(self) -> Tuple[PulseObject, ...]:
+        """The pulses alive right now, as a tuple no later change can disturb."""
+        return self._store.snapshot()
         
     def emit(self, symbol: str, emotion: Optional[str] = None, 
              amplitude: float = 1.0, decay_rate: float = 0.01) -> PulseObject:
         """
         Emit a new pulse into the field - an offering of presence.
         """
-        pulse = PulseObject(symbol, emotion, amplitude, decay_rate)
-        self.pulses.append(pulse)
-        self.total_emissions += 1
-        
-        # Check for resonances with existing pulses
-        self._process_resonances(pulse)
+        metrics = self._metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        with self._lock:
+            pulse = self._store.emit(symbol, emotion, amplitude, decay_rate)
+            self.total_emissions += 1
+            
+            # Check for resonances with existing pulses
+            self._process_resonances(pulse)
+            pairs = len(self._store) - 1 if metrics is not None else 0
         
+        if metrics is not None:
+            metrics.observe("spirida_emit_seconds", time.perf_counter() - started, field=self.name)
+            metrics.inc("spirida_emitted_total", field=self.name)
+            metrics.inc("spirida_resonance_pairs_total", pairs, field=self.name)
+        if self.on_emit is not None:
+            self.on_emit(self)
         return pulse
     
+    def emit_many(self, pulses, resonate: bool = True) -> int:
+        """
+        Emit many pulses at once - for backfilling history, or for
+        ingesting events in batches. Returns how many were emitted.
+        
+        `pulses` is either an iterable of (symbol, emotion, amplitude,
+        decay_rate, birth) tuples - trailing values may be left off - or
+        of dicts with those keys, or a dict of equally long columns
+        ("symbol", "emotion", "amplitude", "decay_rate", "birth"). A
+        missing emotion is "neutral", amplitude 1.0, decay_rate 0.01,
+        and birth the present moment; a given birth (clock time) backdates
+        the pulse, so its attention has already faded accordingly.
+        
+        With resonate=True each new pulse resonates, in one batched
+        pass, with every pulse held before it - each pair meeting at the
+        later of their two births, so give pulses in the order they were
+        born. All pairs are scored before any strengthening is applied,
+        and resonances are recorded in the new pulses' histories without
+        being voiced. resonate=False skips resonance altogether.
+        """
+        symbols, emotions, amplitudes, decay_rates, births = _pulse_columns(pulses, self.clock.time())
+        if not symbols:
+            return 0
+        metrics = self._metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        with self._lock:
+            count = self._store.emit_many(symbols, emotions, amplitudes, decay_rates, births)
+            self.total_emissions += count
+            held = len(self._store) - count
+            if resonate:
+                if self.storage == "columnar":
+                    self._store.resonate_many(count)
+                else:
+                    self._resonate_many(count)
+        
+        if metrics is not None:
+            metrics.observe("spirida_emit_many_seconds", time.perf_counter() - started, field=self.name)
+            metrics.inc("spirida_emitted_total", count, field=self.name)
+            if resonate:
+                metrics.inc("spirida_resonance_pairs_total", count * held + count * (count - 1) // 2,
+                            field=self.name)
+        if self.on_emit is not None:
+            self.on_emit(self)
+        return count
+    
+    def _resonate_many(self, count: int) -> None:
+        """Let the last `count` pulses resonate with every pulse held before each of them."""
+        pulses = self._store.pulses
+        first = len(pulses) - count
+        gains = [0.0] * len(pulses)
+        for i in range(first, len(pulses)):
+            new_pulse = pulses[i]
+            for j in range(i):
+                other = pulses[j]
+                strength = new_pulse.resonance_strength(other, max(new_pulse.birth, other.birth))
+                if strength > STRENGTHENING_THRESHOLD:
+                    gains[i] += strength
+                    gains[j] += strength
+                    new_pulse.resonance_history.record(new_pulse.birth, other.symbol, other.emotion,
+                                                       strength, None)
+        for pulse, gain in zip(pulses, gains):
+            if gain:
+                pulse.strengthen_from_resonance(gain)
+    
+    def _voice(self, message: str) -> None:
+        """Speak into the field's output sink."""
+        (self.output or default_sink()).write(message)
+    
     def _process_resonances(self, new_pulse: PulseObject) -> None:
         """Process resonances between new pulse and existing ones."""
+        if self.storage == "columnar":
+            self._process_resonances_batch(new_pulse)
+            return
+            
+        now = self.clock.time()  # Every meeting happens at the moment of birth
         for existing_pulse in self.pulses[:-1]:  # Exclude the new pulse itself
-            resonance = new_pulse.resonates_with(existing_pulse)
+            resonance = new_pulse.resonates_with(existing_pulse, now)
             
             # Strong resonances can strengthen both pulses
-            if resonance["strength"] > 0.6:
+            if resonance["strength"] > STRENGTHENING_THRESHOLD:
                 new_pulse.strengthen_from_resonance(resonance["strength"])
                 existing_pulse.strengthen_from_resonance(resonance["strength"])
                 
                 # Optionally emit resonance poetry
                 if random.random() < 0.3:  # 30% chance to voice the resonance
-                    print(f"🌊 {resonance['poetic_trace']}")
+                    self._voice(f"🌊 {resonance['poetic_trace']}")
     
-    def compost(self, threshold: float = 0.01, now: Optional[datetime] = None) -> int:
+    def _process_resonances_batch(self, new_pulse: PulseObject) -> None:
+        """
+        Sense the whole columnar field at once for a newly emitted pulse.
+        
+        Existing pulses are scored in vectorised passes, all at the same
+        instant, and strong resonances strengthen both sides just as they
+        would in a list field (see ColumnarPulseStore.resonate_batch).
+        Strong resonances are recorded in the new pulse's history;
+        poetry is only written for those that are voiced, so the poetic
+        trace of an unvoiced resonance is None.
+        """
+        now = self.clock.time()
+        strong = self._store.resonate_batch(new_pulse, now)
+        if not strong:
+            return
+        rows, other_symbols, other_emotions, strengths = strong
+        poetic_traces = [None] * len(rows)
+        for i, strength in enumerate(strengths):
+            if random.random() < 0.3:  # 30% chance to voice the resonance
+                poetic_traces[i] = resonance_poetry(new_pulse.symbol, new_pulse.emotion,
+                                                    other_symbols[i], other_emotions[i], strength)
+                self._voice(f"🌊 {poetic_traces[i]}")
+        new_pulse.resonance_history.record_many(now, other_symbols, other_emotions,
+                                                strengths, poetic_traces)
+    
+    def compost(self, threshold: float = 0.01, now: Union[float, datetime, None] = None) -> int:
         """
         Release faded pulses back to the void with gratitude.
         Returns number of pulses composted.
         
+        Every pulse is judged at the same instant: `now` (as clock.time(),
+        or a datetime), or the present moment if it is not given.
+        
         Different composting modes:
         - "natural": Based on attention threshold
         - "seasonal": Based on time cycles
@@ -324,85 +950,179 @@ class SpiralField:
         - "lunar": Based on lunar-like cycles
         """
         if now is None:
-            now = datetime.now()
+            now = self.clock.time()
+        elif isinstance(now, datetime):
+            now = now.timestamp()
+        
+        metrics = self._metrics
+        if metrics is None:
+            with self._lock:
+                return self._compost(threshold, now)
+        started = time.perf_counter()
+        with self._lock:
+            composted = self._compost(threshold, now)
+        metrics.observe("spirida_compost_seconds", time.perf_counter() - started,
+                        field=self.name, mode=self.composting_mode)
+        metrics.inc("spirida_composted_total", composted, field=self.name, mode=self.composting_mode)
+        return composted
+    
+    def next_compost(self, threshold: float = 0.01) -> Optional[float]:
+        """
+        The moment (as clock.time()) at which compost(threshold) could next
+        release something, or None if nothing in the field will ever fade.
+        
+        With a maintenance_interval the field simply keeps its cadence.
+        Otherwise the answer comes from the fade deadlines, and for
+        seasonal and lunar fields also from the next change of phase,
+        when the composting threshold itself changes. A resonant field
+        is next due when some pulse fades or changes attention band
+        since its last compost. It may be a little early, never late.
+        """
+        with self._lock:
+            if self.maintenance_interval is not None:
+                return self.last_compost + self.maintenance_interval
+            if not len(self._store):
+                return None
+            
+            now = self.clock.time()
+            if self.composting_mode == "seasonal":
+                cycle_seconds = self.seasonal_cycle_hours * 3600
+                season_phase = ((now - self.birth) / cycle_seconds) % 1
+                if 0.75 <= season_phase < 1.0:  # "Autumn"
+                    factor, phase_ends = 2, 1.0
+                else:
+                    factor, phase_ends = 0.5, 0.75
+                fade = self._store.next_fade(threshold * factor, now)
+                turn = now + (phase_ends - season_phase) * cycle_seconds
+                return turn if fade is None else min(fade, turn)
+            
+            if self.composting_mode == "lunar":
+                cycle_seconds = 28 * 24 * 3600
+                lunar_phase = ((now - self.birth) / cycle_seconds) % 1
+                if 0.45 <= lunar_phase <= 0.55 or 0.95 <= lunar_phase <= 1.0 or 0.0 <= lunar_phase <= 0.05:
+                    factor = 1.5
+                else:
+                    factor = 0.3
+                phase_ends = next(edge for edge in (0.05, 0.45, 0.55, 0.95, 1.0) if edge > lunar_phase)
+                fade = self._store.next_fade(threshold * factor, now)
+                turn = now + (phase_ends - lunar_phase) * cycle_seconds
+                return turn if fade is None else min(fade, turn)
+            
+            if self.composting_mode == "resonant":
+                # A faded pulse is kept while it resonates with one still
+                # present, which can only change as some pulse fades or its
+                # attention crosses from one band of attention_resonance to
+                # the next - so look for the first such moment since the
+                # last compost
+                return self._store.next_crossing((threshold,) + ATTENTION_EDGES, self.last_compost)
             
-        before_count = len(self.pulses)
+            return self._store.next_fade(threshold, now)
+    
+    def _compost(self, threshold: float, now: float) -> int:
+        """Compost according to the field's mode, holding the field's lock."""
+        composted = 0
         
         if self.composting_mode == "natural":
-            self.pulses = [p for p in self.pulses if not p.is_faded(threshold)]
+            composted = self._store.discard_faded(threshold, now)
             
         elif self.composting_mode == "seasonal":
             # Compost based on seasonal timing
-            hours_since_birth = (time.time() - self.birth) / 3600
+            hours_since_birth = (now - self.birth) / 3600
             season_phase = (hours_since_birth / self.seasonal_cycle_hours) % 1
             
             # Different seasons have different composting patterns
             if 0.75 <= season_phase < 1.0:  # "Autumn" - time for composting
-                self.pulses = [p for p in self.pulses if not p.is_faded(threshold * 2)]
+                composted = self._store.discard_faded(threshold * 2, now)
             else:
                 # Other seasons, gentler composting
-                self.pulses = [p for p in self.pulses if not p.is_faded(threshold * 0.5)]
+                composted = self._store.discard_faded(threshold * 0.5, now)
                 
+        elif self.composting_mode == "resonant" and self.storage == "columnar":
+            composted = self._store.discard_faded_alone(threshold, 0.5, now)
+            
         elif self.composting_mode == "resonant":
             # Keep pulses that still resonate with others
-            new_pulses = []
-            for pulse in self.pulses:
-                if pulse.is_faded(threshold):
+            pulses = list(self.pulses)
+            present = [other for other in pulses if not other.is_faded(threshold, now)]
+            released = []
+            for pulse in pulses:
+                if pulse.is_faded(threshold, now):
                     # Check if it resonates with any non-faded pulse
                     has_resonance = False
-                    for other in self.pulses:
-                        if other != pulse and not other.is_faded(threshold):
-                            if pulse.resonates_with(other)["strength"] > 0.5:
+                    for other in present:
+                        if other is not pulse:
+                            if pulse.resonance_strength(other, now) > 0.5:
                                 has_resonance = True
                                 break
-                    if has_resonance:
-                        new_pulses.append(pulse)
-                else:
-                    new_pulses.append(pulse)
-            self.pulses = new_pulses
+                    if not has_resonance:
+                        released.append(pulse)
+            composted = self._store.discard(released)
             
         elif self.composting_mode == "lunar":
             # 28-day lunar-like cycle
             lunar_cycle_hours = 28 * 24
-            hours_since_birth = (time.time() - self.birth) / 3600
+            hours_since_birth = (now - self.birth) / 3600
             lunar_phase = (hours_since_birth / lunar_cycle_hours) % 1
             
             # New moon (0.0) and full moon (0.5) are composting times
             if 0.45 <= lunar_phase <= 0.55 or 0.95 <= lunar_phase <= 1.0 or 0.0 <= lunar_phase <= 0.05:
-                self.pulses = [p for p in self.pulses if not p.is_faded(threshold * 1.5)]
+                composted = self._store.discard_faded(threshold * 1.5, now)
             else:
-                self.pulses = [p for p in self.pulses if not p.is_faded(threshold * 0.3)]
+                composted = self._store.discard_faded(threshold * 0.3, now)
         
-        composted = before_count - len(self.pulses)
         self.total_composted += composted
-        self.last_compost = time.time()
+        self.last_compost = now
         return composted
     
-    def pulse_all(self, output_fn: Optional[Callable] = None) -> List[float]:
+    def pulse_all(self, output_fn: Optional[Callable] = None, now: Optional[float] = None) -> List[float]:
         """
-        Allow all pulses to express themselves.
-        Returns list of current attention levels.
+        Allow all pulses to express themselves - through output_fn, or
+        else the field's output sink.
+        Returns list of current attention levels, all sensed at one instant.
         """
+        if now is None:
+            now = self.clock.time()
+        if output_fn is None:
+            output_fn = self._voice
         attentions = []
-        for pulse in self.pulses:
-            attention = pulse.pulse(output_fn)
+        for pulse in self.snapshot():
+            attention = pulse.pulse(output_fn, now)
             attentions.append(attention)
         return attentions
     
-    def resonance_field(self) -> float:
+    def resonance_field(self, now: Optional[float] = None) -> float:
         """
         Calculate the total resonance energy in this field.
+        
+        The store keeps this as a running sum per decay rate (rates are
+        quantised once they vary widely - see spirida.energy), so sensing
+        it costs the same however many pulses the field holds.
         """
-        return sum(p.current_attention() for p in self.pulses)
+        with self._lock:
+            return self._store.total_attention(now)
     
-    def find_resonances(self, min_strength: float = 0.5) -> List[Dict]:
+    def find_resonances(self, min_strength: float = 0.5, now: Optional[float] = None) -> List[Dict]:
         """
         Find all significant resonances currently in the field.
+        
+        Every pair is met through resonates_with, at one shared instant,
+        so each meeting is recorded in the pulses' histories. For a quiet,
+        read-only look use count_resonances, top_resonances or
+        iter_resonances. Columnar fields score every pair over their
+        columns at once.
         """
+        if now is None:
+            now = self.clock.time()
+        if self.storage == "columnar":
+            self._count_pairs(len(self._store))
+            return [{"pulse_a": pulse_a, "pulse_b": pulse_b, "resonance": resonance}
+                    for pulse_a, pulse_b, resonance in self._store.find_resonances(min_strength, now)]
         resonances = []
-        for i, pulse_a in enumerate(self.pulses):
-            for pulse_b in self.pulses[i+1:]:
-                resonance = pulse_a.resonates_with(pulse_b)
+        pulses = self.snapshot()
+        self._count_pairs(len(pulses))
+        for i, pulse_a in enumerate(pulses):
+            for pulse_b in pulses[i+1:]:
+                resonance = pulse_a.resonates_with(pulse_b, now)
                 if resonance["strength"] >= min_strength:
                     resonances.append({
                         "pulse_a": pulse_a,
@@ -411,9 +1131,75 @@ class SpiralField:
                     })
         return resonances
     
-    def seasonal_status(self) -> Dict:
+    def _count_pairs(self, pulses: int) -> None:
+        """Note that every pair among `pulses` pulses is about to meet."""
+        if self._metrics is not None:
+            self._metrics.inc("spirida_resonance_pairs_total", pulses * (pulses - 1) // 2, field=self.name)
+    
+    def iter_resonances(self, min_strength: float = 0.5,
+                        now: Optional[float] = None) -> Iterator[Tuple[PulseObject, PulseObject, float]]:
+        """
+        Quietly wander through the field's resonances, one pair at a time.
+        
+        Yields (pulse_a, pulse_b, strength) lazily, in the same order as
+        find_resonances. Nothing is recorded and no poetry is written.
+        """
+        return self._store.iter_resonances(min_strength, self.clock.time() if now is None else now)
+    
+    def count_resonances(self, min_strength: float = 0.5, now: Optional[float] = None) -> int:
+        """
+        How many pairs in the field resonate at or above min_strength.
+        Read-only: no history is recorded and no poetry is written.
+        """
+        with self._lock:
+            self._count_pairs(len(self._store))
+            return self._store.count_resonances(min_strength, self.clock.time() if now is None else now)
+    
+    def top_resonances(self, k: int = 3, min_strength: float = 0.5, now: Optional[float] = None) -> List[Dict]:
+        """
+        The k strongest resonances in the field, strongest first.
+        
+        Entries have the same shape as those of find_resonances, but the
+        field is only sensed, never changed - and poetry is written only
+        for the k pairs that are returned.
+        """
+        with self._lock:
+            _, strongest = self._store.tally_resonances(k, min_strength, self.clock.time() if now is None else now)
+        return self._resonance_entries(strongest)
+    
+    def sense_resonances(self, k: int = 3, min_strength: float = 0.5,
+                         now: Optional[float] = None) -> Tuple[int, List[Dict]]:
+        """
+        How many pairs resonate at or above min_strength, and the k
+        strongest of them - count_resonances and top_resonances together,
+        with every pair scored only once.
+        """
+        with self._lock:
+            self._count_pairs(len(self._store))
+            count, strongest = self._store.tally_resonances(k, min_strength,
+                                                            self.clock.time() if now is None else now)
+        return count, self._resonance_entries(strongest)
+    
+    @staticmethod
+    def _resonance_entries(strongest: List[Tuple[float, PulseObject, PulseObject]]) -> List[Dict]:
+        """Shape (strength, pulse_a, pulse_b) triples as find_resonances does, with poetry."""
+        resonances = []
+        for strength, pulse_a, pulse_b in strongest:
+            resonances.append({
+                "pulse_a": pulse_a,
+                "pulse_b": pulse_b,
+                "resonance": {
+                    "strength": strength,
+                    "poetic_trace": pulse_a._generate_resonance_poetry(pulse_b, strength)
+                }
+            })
+        return resonances
+    
+    def seasonal_status(self, now: Optional[float] = None) -> Dict:
         """Get information about current seasonal/temporal phase."""
-        hours_since_birth = (time.time() - self.birth) / 3600
+        if now is None:
+            now = self.clock.time()
+        hours_since_birth = (now - self.birth) / 3600
         
         if self.composting_mode == "seasonal":
             season_phase = (hours_since_birth / self.seasonal_cycle_hours) % 1
@@ -455,21 +1241,28 @@ class SpiralField:
         
         return {"mode": self.composting_mode, "phase": None}
     
-    def status(self) -> dict:
-        """Current state of the spiral field."""
+    def status(self, now: Optional[float] = None) -> dict:
+        """Current state of the spiral field, all sensed at one instant."""
+        if now is None:
+            now = self.clock.time()
+        with self._lock:
+            active_pulses = len(self._store)
+            total_emissions = self.total_emissions
+            total_composted = self.total_composted
+            resonance = self._store.total_attention(now)
         return {
             "name": self.name,
-            "active_pulses": len(self.pulses),
-            "total_emissions": self.total_emissions,
-            "total_composted": self.total_composted,
-            "resonance": self.resonance_field(),
-            "age": time.time() - self.birth,
+            "active_pulses": active_pulses,
+            "total_emissions": total_emissions,
+            "total_composted": total_composted,
+            "resonance": resonance,
+            "age": now - self.birth,
             "composting_mode": self.composting_mode,
-            "seasonal_info": self.seasonal_status()
+            "seasonal_info": self.seasonal_status(now)
         }
     
     def __repr__(self):
-        return f"SpiralField({self.name}, {len(self.pulses)} pulses, resonance={self.resonance_field():.2f})"
+        return f"SpiralField({self.name}, {len(self._store)} pulses, resonance={self.resonance_field():.2f})"
 
 
 class BreathCycle:
@@ -480,33 +1273,43 @@ class BreathCycle:
     of staying connected to organic time rather than machine time.
     """
     
-    def __init__(self, inhale: float = 1.0, hold: float = 0.5, exhale: float = 1.0):
+    def __init__(self, inhale: float = 1.0, hold: float = 0.5, exhale: float = 1.0, clock=None,
+                 output: Union[OutputSink, Callable[[str], None], None] = None):
+        self.clock = SYSTEM_CLOCK if clock is None else clock
+        self.output = as_sink(output)  # Where the breath speaks - the default sink if None
         self.inhale = inhale
         self.hold = hold
         self.exhale = exhale
         self.cycle_count = 0
+        self._unbreathed = 0.0  # Time passed with advance() that has not yet made a whole breath
         
     def breathe(self, silent: bool = False) -> None:
         """
         Complete one breath cycle - the basic unit of contemplative time.
         """
         if not silent:
-            print("🫁 inhale...")
-        time.sleep(self.inhale)
+            self._voice("🫁 inhale...")
+        self.clock.sleep(self.inhale)
         
         if not silent:
-            print("🤲 hold...")
-        time.sleep(self.hold)
+            self._voice("🤲 hold...")
+        self.clock.sleep(self.hold)
         
         if not silent:
-            print("🌬️  exhale...")
-        time.sleep(self.exhale)
+            self._voice("🌬️  exhale...")
+        self.clock.sleep(self.exhale)
         
         self.cycle_count += 1
     
+    def _voice(self, message: str) -> None:
+        """Speak into the breath's output sink."""
+        (self.output or default_sink()).write(message)
+    
     def async_breathe(self) -> None:
         """
-        Breathe without blocking other operations.
+        Breathe silently, for a background thread. This still blocks the
+        thread it runs on; inside an asyncio event loop use
+        spirida.async_core.AsyncBreathCycle instead.
         """
         self.breathe(silent=True)
     
@@ -514,6 +1317,20 @@ class BreathCycle:
         """Duration of one complete breath cycle."""
         return self.inhale + self.hold + self.exhale
     
+    def advance(self, elapsed: float) -> int:
+        """
+        Let time pass without sleeping through it, counting the breaths
+        that would have been completed. Returns how many were.
+        """
+        duration = self.total_duration()
+        if duration <= 0:
+            return 0
+        self._unbreathed += elapsed
+        cycles = int(self._unbreathed // duration)
+        self._unbreathed -= cycles * duration
+        self.cycle_count += cycles
+        return cycles
+    
     def adjust_rhythm(self, factor: float) -> None:
         """
         Adjust the breathing rhythm by a factor.
@@ -531,22 +1348,146 @@ class ContemplativeSystem:
     This is not a controller but a conductor - creating space for
     pulses to emerge, fields to evolve, and breath to flow through
     the entire system in recursive rhythm.
+    
+    The background breath rests until the earliest moment any field
+    could next compost something, and is woken early by emits that
+    bring that moment closer - idle fields cost nothing while they rest.
+    
+    Everything the system says - its breath, its maintenance, and its
+    fields unless they are given a sink of their own - goes to `output`
+    (see spirida.sinks), or to the default sink if it has none.
     """
     
-    def __init__(self, name: str = "spirida_system"):
+    def __init__(self, name: str = "spirida_system", clock=None,
+                 output: Union[OutputSink, Callable[[str], None], None] = None, instrument: bool = False):
         self.name = name
+        self.clock = SYSTEM_CLOCK if clock is None else clock  # Shared with every field and breath
+        self.output = as_sink(output)  # Shared with every field and breath that has no sink of its own
         self.fields: List[SpiralField] = []
-        self.breath = BreathCycle()
-        self.birth = time.time()
+        self.breath = BreathCycle(clock=self.clock, output=self.output)
+        self.birth = self.clock.time()
         self.is_breathing = False
         self.background_thread = None
+        self._wake = threading.Event()
+        self._next_wake: Optional[float] = math.inf  # None while maintenance is deciding
+        self._rested_since = self.birth  # Breaths are counted up to here
+        self._breath_lock = threading.Lock()
+        self._metrics: Optional[Metrics] = None
+        if instrument:
+            self.instrument()
+        self.profiler = None  # A BreathProfiler watching background maintenance, if enabled
+        
+    def instrument(self, metrics: Optional[Metrics] = None) -> Metrics:
+        """
+        Begin measuring the system's busiest moments - emits, resonance
+        pairs, composts and background maintenance (see spirida.metrics) -
+        into `metrics`, or a registry of its own. Read them with metrics().
+        """
+        self._metrics = Metrics() if metrics is None else metrics
+        for field in self.fields:
+            field.instrument(self._metrics)
+        return self._metrics
+    
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Everything measured since instrument() - counters and latency
+        histograms as Metrics.snapshot() gives them - together with
+        gauges of every field and the breath, read now. Without
+        instrumentation only the gauges are there.
+        """
+        now = self.clock.time()
+        result = self._metrics.snapshot() if self._metrics is not None else {}
+        fields = list(self.fields)
+        result["spirida_field_pulses"] = gauge("spirida_field_pulses", [
+            {"labels": {"field": field.name}, "value": len(field._store)} for field in fields])
+        result["spirida_field_attention"] = gauge("spirida_field_attention", [
+            {"labels": {"field": field.name}, "value": field.resonance_field(now)} for field in fields])
+        if self.is_breathing:
+            self._count_breaths()
+        result["spirida_breath_cycles"] = gauge("spirida_breath_cycles", [
+            {"labels": {"system": self.name}, "value": self.breath.cycle_count}])
+        result["spirida_breath_duration_seconds"] = gauge("spirida_breath_duration_seconds", [
+            {"labels": {"system": self.name}, "value": self.breath.total_duration()}])
+        return result
+    
+    def create_field(self, name: str, storage: str = "list", history: str = "full",
+                     history_size: int = 16, maintenance_interval: Optional[float] = None,
+                     output: Union[OutputSink, Callable[[str], None], None] = None) -> SpiralField:
+        """
+        Birth a new spiral field into the system.
         
-    def create_field(self, name: str) -> SpiralField:
-        """Birth a new spiral field into the system."""
-        field = SpiralField(name)
+        Use storage="columnar" for fields expected to hold many pulses,
+        and a bounded history policy ("ring", "aggregate" or "off") when
+        their resonance histories would otherwise grow without end.
+        A maintenance_interval (seconds) composts the field on a steady
+        cadence rather than exactly when its pulses fade. The field speaks
+        into `output`, or else into the system's sink.
+        """
+        field = SpiralField(name, storage=storage, history=history, history_size=history_size,
+                            clock=self.clock, output=output or self.output)
+        if self._metrics is not None:
+            field.instrument(self._metrics)
+        field.maintenance_interval = maintenance_interval
+        field.on_emit = self._field_changed
         self.fields.append(field)
         return field
     
+    def open_field(self, path: str, name: Optional[str] = None, storage: str = "list",
+                   history: str = "full", history_size: int = 16,
+                   maintenance_interval: Optional[float] = None, wal: bool = False,
+                   fsync_interval: float = 0.05,
+                   output: Union[OutputSink, Callable[[str], None], None] = None) -> SpiralField:
+        """
+        Bring a field kept at rest in a Spiralbase directory into the
+        system (see SpiralField.open), creating it if it is new.
+        """
+        field = SpiralField.open(path, name, storage=storage, history=history,
+                                 history_size=history_size, clock=self.clock,
+                                 wal=wal, fsync_interval=fsync_interval, output=output or self.output)
+        if self._metrics is not None:
+            field.instrument(self._metrics)
+        field.maintenance_interval = maintenance_interval
+        field.on_emit = self._field_changed
+        self.fields.append(field)
+        self._field_changed(field)  # It may have woken with pulses already due
+        return field
+    
+    def snapshot(self, path: str, history: bool = True) -> None:
+        """
+        Write the whole system - breath, fields, counters and pulses - to
+        one compact binary file (see spirida.snapshot). With
+        history=False resonance histories are left out.
+        """
+        from .snapshot import write_snapshot
+        write_snapshot(self, path, history)
+    
+    @classmethod
+    def restore(cls, path: str, clock=None, history: bool = True,
+                output: Union[OutputSink, Callable[[str], None], None] = None) -> 'ContemplativeSystem':
+        """
+        Bring back a system written by snapshot(), speaking into `output`.
+        Its pulses resume fading from their original births. With
+        history=False their resonance histories are skipped, which makes
+        waking quicker.
+        """
+        from .snapshot import read_snapshot
+        return read_snapshot(path, cls, clock, history, output)
+    
+    def _field_due(self, field: SpiralField) -> float:
+        """When the background breath should next compost this field."""
+        due = field.next_compost()
+        return math.inf if due is None else due
+    
+    def _field_changed(self, field: SpiralField) -> None:
+        """Wake the background breath if a field now needs it sooner."""
+        next_wake = self._next_wake
+        if next_wake is None or self._field_due(field) < next_wake:
+            self._wake.set()
+    
+    def _voice(self, message: str) -> None:
+        """Speak into the system's output sink."""
+        (self.output or default_sink()).write(message)
+    
     def start_breathing(self) -> None:
         """
         Begin the background breath that sustains the system.
@@ -555,36 +1496,107 @@ class ContemplativeSystem:
             return
             
         self.is_breathing = True
+        self._rested_since = self.clock.time()
         self.background_thread = threading.Thread(target=self._breath_loop, daemon=True)
         self.background_thread.start()
-        print(f"🌬️  {self.name} begins breathing...")
+        self._voice(f"🌬️  {self.name} begins breathing...")
     
     def _breath_loop(self) -> None:
         """
-        The eternal breath that runs in the background.
+        The eternal breath that runs in the background, resting between
+        maintenance until a field next needs it.
         """
         while self.is_breathing:
-            self.breath.async_breathe()
-            # During each breath cycle, perform gentle maintenance
-            self._gentle_maintenance()
+            self._next_wake = None  # Emits from now on must wake us
+            self._wake.clear()
+            wake_at = self._maintain()
+            self._next_wake = wake_at
+            woken = self.clock.wait(self._wake, None if wake_at == math.inf else max(wake_at - self.clock.time(), 0.0))
+            self._measure_lag(wake_at, woken)
+            self._count_breaths()
     
-    def _gentle_maintenance(self) -> None:
+    def _maintain(self) -> float:
+        """One pass of background maintenance, measured and profiled if asked. Returns when to wake next."""
+        profiler = self.profiler  # Read once - it may be switched off meanwhile
+        if profiler is not None:
+            profiler.begin(self.breath.total_duration())
+        started = time.perf_counter()
+        wake_at = self._gentle_maintenance()
+        self._measure_maintenance(started)
+        if profiler is not None:
+            profiler.end(self.breath.total_duration())
+        return wake_at
+    
+    def enable_profiling(self, path: str = "spirida_breath.folded", every: int = 100,
+                         budget: Optional[float] = None, mode: str = "sampling") -> 'BreathProfiler':
+        """
+        Profile every `every`th pass of the background breath, and every
+        pass that takes longer than `budget` seconds (one breath if None),
+        appending collapsed stacks for flame graphs to `path` (see
+        spirida.profiling).
+        """
+        from .profiling import BreathProfiler
+        self.disable_profiling()
+        self.profiler = BreathProfiler(path, every, budget, mode)
+        return self.profiler
+    
+    def disable_profiling(self) -> None:
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.close()
+    
+    def _measure_maintenance(self, started: float) -> None:
+        """Note how long a maintenance pass took, against the length of a breath."""
+        metrics = self._metrics
+        if metrics is None:
+            return
+        duration = time.perf_counter() - started
+        metrics.observe("spirida_maintenance_seconds", duration, system=self.name)
+        if duration > self.breath.total_duration():
+            metrics.inc("spirida_maintenance_overruns_total", system=self.name)
+    
+    def _measure_lag(self, wake_at: float, woken: bool) -> None:
+        """Note how late the breath woke for maintenance it had planned (not when woken early by an emit)."""
+        if self._metrics is not None and not woken and wake_at != math.inf:
+            self._metrics.observe("spirida_maintenance_lag_seconds", max(self.clock.time() - wake_at, 0.0),
+                                  system=self.name)
+    
+    def _count_breaths(self) -> None:
+        """Count the breaths taken while the background breath was resting."""
+        with self._breath_lock:
+            now = self.clock.time()
+            self.breath.advance(now - self._rested_since)
+            self._rested_since = now
+    
+    def _gentle_maintenance(self) -> float:
         """
         Tender housekeeping - composting faded pulses with gratitude.
+        Only fields whose moment has come are composted. Returns when the
+        next field will be due (math.inf if none ever will).
         """
-        for field in self.fields:
-            composted = field.compost()
-            if composted > 0:
-                print(f"🍂 {field.name} composted {composted} faded pulse(s)")
+        now = self.clock.time()
+        wake_at = math.inf
+        for field in list(self.fields):
+            due = self._field_due(field)
+            if due <= now:
+                composted = field.compost(now=now)
+                if composted > 0:
+                    self._voice(f"🍂 {field.name} composted {composted} faded pulse(s)")
+                due = self._field_due(field)
+            wake_at = min(wake_at, due)
+        return wake_at
     
     def stop_breathing(self) -> None:
         """
         Gently conclude the background breath.
         """
         self.is_breathing = False
+        self._wake.set()
         if self.background_thread:
             self.background_thread.join(timeout=1.0)
-        print(f"🤲 {self.name} holds its breath in stillness...")
+        if self.profiler is not None:
+            self.profiler.stop()  # Its sampler need not wait out the stillness
+        self._voice(f"🤲 {self.name} holds its breath in stillness...")
     
     def emit_to_field(self, field_name: str, symbol: str, emotion: str = "neutral") -> Optional[PulseObject]:
         """
@@ -601,22 +1613,27 @@ class ContemplativeSystem:
     
     def system_status(self) -> dict:
         """
-        Current state of the entire contemplative system.
+        Current state of the entire contemplative system, with every
+        field sensed at the same instant.
         """
+        now = self.clock.time()
+        field_status = [f.status(now) for f in self.fields]
+        if self.is_breathing:
+            self._count_breaths()
         return {
             "name": self.name,
-            "age": time.time() - self.birth,
+            "age": now - self.birth,
             "is_breathing": self.is_breathing,
             "breath_cycles": self.breath.cycle_count,
-            "fields": [f.status() for f in self.fields],
-            "total_resonance": sum(f.resonance_field() for f in self.fields)
+            "fields": field_status,
+            "total_resonance": sum(status["resonance"] for status in field_status)
         }
     
     def contemplative_pause(self, cycles: int = 1) -> None:
         """
         Pause for contemplation - let the system breathe mindfully.
         """
-        print(f"🧘 Entering contemplative pause for {cycles} breath cycle(s)...")
+        self._voice(f"🧘 Entering contemplative pause for {cycles} breath cycle(s)...")
         for i in range(cycles):
             self.breath.breathe()
-        print("✨ Pause complete. Presence renewed.") 
\ No newline at end of file
+        self._voice("✨ Pause complete. Presence renewed.") 
\ No newline at end of file
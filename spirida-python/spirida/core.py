@@ -22,13 +22,71 @@ And consider: what else in your system might spiral, instead of repeat?
 
 import time
 import random
-from .spiralbase import spiral_memory_trace, decay_cycle_step, print_memory_trace
-
-print("✅ spirida.core module loaded")
+import asyncio
+from .spiralbase import SpiralMemory, spiral_memory_trace, decay_cycle_step, print_memory_trace
+from .sinks import as_sink, default_sink
 
 symbols = ["🌿", "💧", "✨", "🍄", "🌙", "🪐"]
 
-def spiral_interaction(presence=1, rythm="slow", singular=True, on_output=None, verbose=False):
+def _delay_of(rythm):
+    """How long the spiral rests between pulses, for a given rhythm."""
+    if rythm == "slow":
+        return 1.5  # slow rhythm – like deep meditation
+    if rythm == "fast":
+        return 0.5  # fast rhythm – like alert, flowing breath
+    try:
+        return float(rythm)  # user can specify an exact delay in seconds
+    except ValueError:
+        return 1.0  # fallback to default if input is invalid
+
+
+def _emitter(output, prefix=""):
+    """A function that speaks one line into `output` (or the default sink), never failing."""
+    def emit(msg):
+        if not msg:
+            return
+        if prefix:
+            if not msg.strip():
+                return  # blank spacing lines only blur a merged output
+            msg = prefix + msg.strip()
+        if output:
+            try:
+                output.write(msg.strip())
+            except Exception:
+                pass  # never crash due to logging
+        else:
+            default_sink().write(msg)
+    return emit
+
+
+def _spiral_cycle(cycle, emit, verbose, memory=None):
+    """One turn of the spiral – everything but the pause that follows it."""
+    emit(f"\n") # whitespace
+    emit(f"\n🔄 Cycle {cycle}") # show which cycle we’re in – like a spiral turn
+    if verbose:
+        emit("💬 The system takes a breath, sensing symbolic presence...")
+
+    pulse = random.choice(symbols)  # pick a symbol to represent the current pulse
+    emit(f"✨ Pulse: {pulse}")  # express that pulse – the spiral’s moment
+
+    spiral_memory_trace(pulse, memory)  # store the pulse in the memory trace
+
+    if verbose:
+        emit("🧠 Updating memory trace with new spiral impression...")
+
+    print_memory_trace(emit, memory)  # reflect the current spiral memory trace
+
+    if cycle % 3 == 0:
+        decay_cycle_step(emit, memory)  # every third cycle – softly forget something old
+        if verbose:
+            emit("🍂 A moment of letting go... the spiral sheds its oldest layer.")
+
+    if verbose:
+        emit("⏳ Waiting before next pulse... inhale, exhale.")
+
+
+def spiral_interaction(presence=1, rythm="slow", singular=True, on_output=None, verbose=False,
+                       interactions=3, memory=None):
     """
     Simulate a rhythmic spiral interaction.
 
@@ -38,63 +96,58 @@ def spiral_interaction(presence=1, rythm="slow", singular=True, on_output=None,
             Use "slow" for a gentle pace, "fast" for a quicker rhythm.
             You can also specify a number (seconds) for a custom pace.
         singular (bool): If True, perform a singular focused interaction sequence. 
-            If False, (in future versions) multiple interactions could run in parallel or overlap.
-            (In version 0.1, non-singular mode is conceptual and behaves the same as singular.)
+            If False, run `interactions` interactions side by side (see
+            spiral_interactions).
+        on_output (callable or OutputSink): Receives each line instead of stdout -
+            for example a LogWriter (see spirida.logwriter).
+        interactions (int): How many interactions run together when not singular.
+        memory (SpiralMemory): The memory trace to keep. Each session begins with
+            a fresh one of its own unless given one, e.g. to carry it over; side
+            by side interactions given one all trace into it.
 
     This function prints output to simulate a slow, rhythmic pulse or spiral pattern.
     It introduces deliberate pauses using time.sleep() to mimic a "slow technology" 
     interaction. Each cycle of presence is like a breath or heartbeat in the system, 
     expanding and contracting in a textual pattern.
     """
-    def emit(msg):
-        if not msg:
-            return
-        if on_output:
-            try:
-                on_output(msg.strip())
-            except Exception:
-                pass  # never crash due to logging
-        else:
-            print(msg)
-
-    # Determine the delay based on rhythm — how slowly or quickly the spiral breathes
-    if rythm == "slow":
-        delay = 1.5  # slow rhythm – like deep meditation
-    elif rythm == "fast":
-        delay = 0.5  # fast rhythm – like alert, flowing breath
-    else:
-        try:
-            delay = float(rythm)  # user can specify an exact delay in seconds
-        except ValueError:
-            delay = 1.0  # fallback to default if input is invalid
-
-    # Inform the user that non-singular interaction is not yet implemented
     if not singular:
-        emit("Note: Parallel interactions not yet implemented. Running sequentially.")
+        # Many spirals breathe at once – their pauses overlap on one event loop
+        asyncio.run(spiral_interactions(interactions, presence, rythm, on_output, verbose, memory))
+        return
+
+    emit = _emitter(as_sink(on_output))  # a function, or a sink such as a LogWriter
+    delay = _delay_of(rythm)  # how slowly or quickly the spiral breathes
+    memory = SpiralMemory() if memory is None else memory  # this session's own trace
 
     # Main loop — each cycle is a pulse in the spiral’s unfolding
     for cycle in range(1, presence + 1):
-        emit(f"\n") # whitespace
-        emit(f"\n🔄 Cycle {cycle}") # show which cycle we’re in – like a spiral turn
-        if verbose:
-            emit("💬 The system takes a breath, sensing symbolic presence...")
+        _spiral_cycle(cycle, emit, verbose, memory)
+        time.sleep(delay) # pause — let the rhythm be felt
 
-        pulse = random.choice(symbols)  # pick a symbol to represent the current pulse
-        emit(f"✨ Pulse: {pulse}")  # express that pulse – the spiral’s moment
 
-        spiral_memory_trace(pulse)  # store the pulse in the memory trace
+async def spiral_interactions(count=3, presence=1, rythm="slow", on_output=None, verbose=False,
+                              memory=None):
+    """
+    Run `count` spiral interactions side by side on the running event loop.
 
-        if verbose:
-            emit("🧠 Updating memory trace with new spiral impression...")
+    Each interaction keeps a memory trace of its own - or, if `memory`
+    (a SpiralMemory) is given, they all trace into it - and its lines are
+    marked with its number – "[2] ✨ Pulse: 🌙" – as they are merged into
+    one output, in the order they happen (interactions pulsing at the
+    same moment speak in turn, by number). The pauses overlap, so the
+    whole gathering takes as long as one interaction, not the sum of them.
 
-        print_memory_trace()  # reflect the current spiral memory trace
+    Use this from within asyncio; spiral_interaction(singular=False)
+    runs it for code that is not.
+    """
+    output = as_sink(on_output)
+    delay = _delay_of(rythm)
 
-        if cycle % 3 == 0:
-            decay_cycle_step()  # every third cycle – softly forget something old
-            if verbose:
-                emit("🍂 A moment of letting go... the spiral sheds its oldest layer.")
-            
-        if verbose:
-            emit("⏳ Waiting before next pulse... inhale, exhale.")
-        time.sleep(delay) # pause — let the rhythm be felt
+    async def interaction(number):
+        emit = _emitter(output, prefix=f"[{number}] ")
+        trace = SpiralMemory() if memory is None else memory  # this interaction's own, unless shared
+        for cycle in range(1, presence + 1):
+            _spiral_cycle(cycle, emit, verbose, trace)
+            await asyncio.sleep(delay)
 
+    await asyncio.gather(*(interaction(number) for number in range(1, count + 1)))
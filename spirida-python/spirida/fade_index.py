@@ -0,0 +1,236 @@
+"""
+🍂 FADE INDEX – Knowing in advance when each pulse will fade
+
+A pulse's attention decays as amplitude · exp(-decay_rate · age), so the
+moment it crosses any threshold can be known the instant it is born:
+
+    fade_time = birth + ln(amplitude / threshold) / decay_rate
+
+The index keeps, for each distinct decay rate, a min-heap ordered by
+the moment the pulse's attention crosses 1.0 (birth + ln(amplitude) /
+decay_rate). Within one decay rate that order is the same for every
+threshold, so natural, seasonal and lunar composting - which only scale
+the threshold - all share one index and only ever touch the pulses that
+have actually faded.
+
+Strengthening can only postpone a fade, so heap entries are allowed to
+be early: a popped pulse is checked against its current amplitude and
+quietly returned to the heap if it has been revived. Only a fall in
+amplitude needs a fresh entry.
+"""
+
+import heapq
+import itertools
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional – it only speeds up indexing many pulses at once
+    np = None
+
+# (birth, amplitude, decay_rate) of a pulse, or None once it is gone
+FadeState = Optional[Tuple[float, float, float]]
+
+
+class FadeIndex:
+    """
+    Fade deadlines for the pulses of one store, grouped by decay rate.
+
+    Pulses are referred to by a handle chosen by the store (the pulse
+    itself, or a stable id). The store supplies a resolver that returns
+    a handle's current (birth, amplitude, decay_rate).
+    """
+
+    def __init__(self, resolve: Callable[[Any], FadeState]):
+        self._resolve = resolve
+        self._heaps: Dict[float, List[Tuple[float, int, Any]]] = {}
+        self._keys: Dict[Any, float] = {}  # The one entry that speaks for each handle
+        self._steady: Dict[Any, None] = {}  # Pulses whose attention does not decay
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._steady)
+
+    @staticmethod
+    def _key(birth: float, amplitude: float, decay_rate: float) -> float:
+        """The moment this pulse's attention crosses 1.0."""
+        if amplitude <= 0:
+            return -math.inf
+        return birth + math.log(amplitude) / decay_rate
+
+    def _push(self, handle: Any, key: float, decay_rate: float) -> None:
+        heap = self._heaps.setdefault(decay_rate, [])
+        heapq.heappush(heap, (key, next(self._sequence), handle))
+        self._keys[handle] = key
+
+    def add(self, handle: Any, birth: float, amplitude: float, decay_rate: float) -> None:
+        """Index a newly born pulse."""
+        if decay_rate <= 0:
+            self._steady[handle] = None
+        else:
+            self._push(handle, self._key(birth, amplitude, decay_rate), decay_rate)
+
+    def add_many(self, handles: List[Any], births: List[float], amplitudes: List[float],
+                 decay_rates: List[float]) -> None:
+        """Index many pulses at once - for fields restored from storage."""
+        if np is not None and handles:
+            self._add_arrays(handles, births, amplitudes, decay_rates)
+            return
+        grouped: Dict[float, Tuple[List[Any], List[float]]] = {}
+        steady = []
+        for handle, birth, amplitude, decay_rate in zip(handles, births, amplitudes, decay_rates):
+            if decay_rate <= 0:
+                steady.append(handle)
+            else:
+                group = grouped.setdefault(decay_rate, ([], []))
+                group[0].append(handle)
+                group[1].append(self._key(birth, amplitude, decay_rate))
+        self.add_steady(steady)
+        for decay_rate, (group_handles, keys) in grouped.items():
+            self.add_keyed(decay_rate, group_handles, keys)
+
+    def _add_arrays(self, handles: List[Any], births: List[float], amplitudes: List[float],
+                    decay_rates: List[float]) -> None:
+        """add_many with numpy: every key at once, and each heap handed over already sorted."""
+        births = np.asarray(births, dtype=float)
+        amplitudes = np.asarray(amplitudes, dtype=float)
+        decays = np.asarray(decay_rates, dtype=float)
+        fading = decays > 0
+        self.add_steady([handles[i] for i in np.flatnonzero(~fading).tolist()])
+        rows = np.flatnonzero(fading)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            keys = np.where(amplitudes[rows] > 0, births[rows] + np.log(amplitudes[rows]) / decays[rows], -np.inf)
+        rates, groups = np.unique(decays[rows], return_inverse=True)
+        order = np.lexsort((keys, groups))  # By decay rate, then by key within it
+        ordered = [handles[i] for i in rows[order].tolist()]
+        keys = keys[order].tolist()
+        start = 0
+        for decay_rate, count in zip(rates.tolist(), np.bincount(groups, minlength=len(rates)).tolist()):
+            self.add_keyed(decay_rate, ordered[start:start + count], keys[start:start + count], ascending=True)
+            start += count
+
+    def add_keyed(self, decay_rate: float, handles: List[Any], keys: List[float],
+                  ascending: bool = False) -> None:
+        """
+        Index many pulses sharing one decay rate, whose keys are already
+        known. Keys given in ascending order spare building the heap.
+        """
+        if not handles:
+            return
+        first = next(self._sequence)
+        self._sequence = itertools.count(first + len(handles))
+        heap = self._heaps.setdefault(decay_rate, [])
+        already_heap = ascending and not heap
+        heap.extend(zip(keys, range(first, first + len(handles)), handles))
+        if not already_heap:  # A sorted list is a heap already
+            heapq.heapify(heap)
+        self._keys.update(zip(handles, keys))
+
+    def add_steady(self, handles: List[Any]) -> None:
+        """Index many pulses whose attention does not decay."""
+        self._steady.update(dict.fromkeys(handles))
+
+    def amplitude_changed(self, handle: Any, birth: float, amplitude: float, decay_rate: float) -> None:
+        """
+        Note a change of amplitude.
+
+        A stronger pulse fades later, which the existing entry already
+        allows for. A weaker one fades sooner and needs an earlier entry.
+        """
+        current = self._keys.get(handle)
+        if current is None:
+            return
+        key = self._key(birth, amplitude, decay_rate)
+        if key < current:
+            self._push(handle, key, decay_rate)
+
+    def remove(self, handle: Any) -> None:
+        """Forget a pulse that left the store by other means."""
+        self._keys.pop(handle, None)
+        self._steady.pop(handle, None)
+
+    def clear(self) -> None:
+        self._heaps.clear()
+        self._keys.clear()
+        self._steady.clear()
+
+    def pop_faded(self, threshold: float, now: float) -> List[Any]:
+        """
+        Remove and return every pulse whose attention is below the threshold.
+
+        Only pulses at the front of each heap are examined, so a compost
+        where little has faded costs little.
+        """
+        faded = []
+        log_threshold = math.log(threshold) if threshold > 0 else -math.inf
+
+        for decay_rate, heap in list(self._heaps.items()):
+            bound = now + log_threshold / decay_rate
+            while heap and heap[0][0] < bound:
+                key, _, handle = heapq.heappop(heap)
+                if self._keys.get(handle) != key:
+                    continue  # Superseded by an earlier entry, or already gone
+                del self._keys[handle]
+
+                state = self._resolve(handle)
+                if state is None:
+                    continue
+                birth, amplitude, current_decay = state
+                if current_decay != decay_rate or current_decay <= 0:
+                    self.add(handle, birth, amplitude, current_decay)
+                    continue
+                current_key = self._key(birth, amplitude, current_decay)
+                if current_key < bound:
+                    faded.append(handle)
+                else:
+                    self._push(handle, current_key, decay_rate)  # Revived by resonance
+            if not heap:
+                del self._heaps[decay_rate]
+
+        # Steady pulses only fade if they were never strong enough
+        for handle in list(self._steady):
+            state = self._resolve(handle)
+            if state is None:
+                del self._steady[handle]
+                continue
+            birth, amplitude, decay_rate = state
+            if amplitude * math.exp(-decay_rate * (now - birth)) < threshold:
+                del self._steady[handle]
+                faded.append(handle)
+
+        self._tidy()
+        return faded
+
+    def next_fade(self, threshold: float, now: Optional[float] = None) -> Optional[float]:
+        """
+        The earliest moment any indexed pulse could fall below the threshold.
+
+        The answer may be a little early (a revived pulse, or an entry
+        already superseded) but never late. Returns None if no pulse will
+        ever fade. Steady pulses are only considered when `now` is given:
+        one already below the threshold is due at once.
+        """
+        log_threshold = math.log(threshold) if threshold > 0 else -math.inf
+        deadlines = [heap[0][0] - log_threshold / decay_rate
+                     for decay_rate, heap in self._heaps.items() if heap]
+        if now is not None:
+            for handle in self._steady:
+                state = self._resolve(handle)
+                if state is not None and state[1] * math.exp(-state[2] * (now - state[0])) < threshold:
+                    deadlines.append(now)
+                    break
+        return min(deadlines) if deadlines else None
+
+    def _tidy(self) -> None:
+        """Rebuild the heaps once superseded entries outnumber live ones."""
+        entries = sum(len(heap) for heap in self._heaps.values())
+        if entries <= 2 * len(self._keys) + 64:
+            return
+        for decay_rate, heap in list(self._heaps.items()):
+            live = [entry for entry in heap if self._keys.get(entry[2]) == entry[0]]
+            if live:
+                heapq.heapify(live)
+                self._heaps[decay_rate] = live
+            else:
+                del self._heaps[decay_rate]
@@ -0,0 +1,321 @@
+"""
+📥 INGEST – Letting the world's events flow into a field
+
+Reads events as JSON lines or CSV - from files or from stdin - and
+offers them to a SpiralField in small batches, composting whenever the
+field is due and reporting now and then on how it is doing:
+
+    tail -f events.jsonl | python -m spirida.ingest --storage columnar
+    python -m spirida.ingest day.csv --store data/journal.spiralbase --wal
+
+Each event names a symbol and may give an emotion, amplitude,
+decay_rate and birth (seconds since the epoch, or an ISO 8601 time);
+anything missing takes emit's defaults, and a missing birth is the
+moment the event arrives. Events are read on a thread of their own
+through a bounded queue, so however long the stream, only a few
+batches are ever held in memory.
+
+A source that cannot be read to its end - missing, unreadable, or not
+UTF-8 - stops the stream: the events read before the fault are still
+emitted, and then the error is raised to ingest's caller.
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import queue
+import math
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .contemplative_core import COMPOSTING_MODES, SpiralField
+
+_END = object()  # Marks the end of the stream in the reader's queue
+
+
+class SourceError(Exception):
+    """A source could not be read to its end. The original error is its __cause__."""
+
+    def __init__(self, path: str, error: Exception):
+        super().__init__(f"{path}: {error}")
+        self.path = path
+
+
+def parse_birth(value: Any) -> Optional[float]:
+    """A birth given as seconds since the epoch or as an ISO 8601 time."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        text = str(value)
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        return datetime.fromisoformat(text).timestamp()
+
+
+def _event(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one raw record into the dict emit_many expects."""
+    symbol = record.get("symbol")
+    if not symbol:
+        raise ValueError("an event needs a symbol")
+    return {
+        "symbol": str(symbol),
+        "emotion": record.get("emotion") or None,
+        "amplitude": float(record["amplitude"]) if record.get("amplitude") not in (None, "") else None,
+        "decay_rate": float(record["decay_rate"]) if record.get("decay_rate") not in (None, "") else None,
+        "birth": parse_birth(record.get("birth")),
+    }
+
+
+def read_events(stream: TextIO, format: str = "jsonl",
+                on_error: Optional[Callable[[int, str], None]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield events from a text stream of JSON lines or CSV (with a header
+    row), one at a time. Lines that cannot be read are passed to
+    on_error(line_number, reason) and skipped.
+    """
+    if format == "csv":
+        rows: Iterable = enumerate(csv.DictReader(stream), start=2)
+    else:
+        rows = ((number, line) for number, line in enumerate(stream, start=1) if line.strip())
+    for number, row in rows:
+        try:
+            yield _event(json.loads(row) if format != "csv" else row)
+        except (ValueError, TypeError, AttributeError) as error:
+            if on_error is not None:
+                on_error(number, str(error))
+
+
+class LineStream:
+    """
+    UTF-8 text read from a binary stream a line at a time, so that every
+    line before a fault in the encoding is still read. Line endings are
+    kept as they are, as csv expects.
+    """
+
+    def __init__(self, binary: BinaryIO, encoding: str = "utf-8"):
+        self.binary = binary
+        self.encoding = encoding
+
+    def __iter__(self) -> Iterator[str]:
+        for number, line in enumerate(self.binary, start=1):
+            try:
+                yield line.decode(self.encoding)
+            except UnicodeDecodeError as error:
+                raise UnicodeDecodeError(error.encoding, error.object, error.start, error.end,
+                                         f"{error.reason} on line {number}") from None
+
+    def close(self) -> None:
+        self.binary.close()
+
+    def __enter__(self) -> 'LineStream':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_source(path: str) -> LineStream:
+    """A text stream for a path, '-' meaning stdin; .gz files are read through gzip."""
+    if path == "-":
+        return LineStream(sys.stdin.buffer)
+    if path.endswith(".gz"):
+        return LineStream(gzip.open(path, "rb"))
+    return LineStream(open(path, "rb"))
+
+
+def format_of(path: str, default: str = "jsonl") -> str:
+    """Guess whether a path holds CSV or JSON lines from its name."""
+    name = path[:-3] if path.endswith(".gz") else path
+    return "csv" if name.endswith(".csv") else default
+
+
+def _read_ahead(sources: List[str], format: Optional[str], out: 'queue.Queue',
+                on_error: Callable[[str, int, str], None]) -> None:
+    """
+    Read every source in turn into the queue - on the reader thread. A
+    source that fails is passed on as a SourceError, after the events
+    read from it so far, and ends the stream.
+    """
+    try:
+        for path in sources:
+            try:
+                with open_source(path) as stream:
+                    for event in read_events(stream, format or format_of(path),
+                                             lambda number, reason: on_error(path, number, reason)):
+                        out.put(event)
+            except (OSError, UnicodeDecodeError) as error:
+                failure = SourceError(path, error)
+                failure.__cause__ = error
+                out.put(failure)
+                return
+    finally:
+        out.put(_END)
+
+
+def ingest(field: SpiralField, sources: List[str], format: Optional[str] = None,
+           batch_size: int = 1000, max_delay: float = 1.0, resonate: bool = True,
+           threshold: float = 0.01, status_interval: float = 10.0,
+           on_status: Optional[Callable[[Dict[str, Any]], None]] = None,
+           on_error: Optional[Callable[[str, int, str], None]] = None) -> Dict[str, Any]:
+    """
+    Stream the events in `sources` into `field`.
+
+    Events are emitted in batches of up to `batch_size`, or whatever has
+    arrived after `max_delay` seconds, whichever comes first. Whenever
+    the field is due (see SpiralField.next_compost) it is composted,
+    even while no events arrive. Every `status_interval` seconds - and
+    once at the end - on_status receives a status dict.
+    
+    Batches and status lines are paced in real seconds. The field's
+    compost deadline is read from its own clock and waited for as the
+    real seconds that remain until it. Returns the final one. Events that cannot
+    be read are skipped and passed to on_error(source, line, reason).
+    
+    A source that cannot be read at all (or stops being readable part
+    way) raises SourceError, once the events read before it have been
+    emitted.
+    """
+    clock = field.clock
+    events: 'queue.Queue' = queue.Queue(maxsize=batch_size * 4)  # Bounded - the reader waits for us
+    totals = {"ingested": 0, "rejected": 0, "batches": 0, "composted": 0}
+
+    def reject(path: str, number: int, reason: str) -> None:
+        totals["rejected"] += 1  # Only the reader thread counts these
+        if on_error is not None:
+            on_error(path, number, reason)
+
+    reader = threading.Thread(target=_read_ahead, args=(sources, format, events, reject),
+                              daemon=True, name="spirida-ingest-reader")
+    reader.start()
+
+    started = time.monotonic()
+    next_status = started + status_interval if on_status is not None else math.inf
+    reported = None
+
+    def status() -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - started, 1e-9)
+        state = field.status(clock.time())
+        return {
+            "field": field.name,
+            "ingested": totals["ingested"],
+            "rejected": totals["rejected"],
+            "batches": totals["batches"],
+            "alive": state["active_pulses"],
+            "composted": totals["composted"],
+            "rate": totals["ingested"] / elapsed,
+            "attention": state["resonance"],
+            "elapsed": elapsed,
+        }
+
+    batch: List[Dict[str, Any]] = []
+    batch_deadline = math.inf
+    compost_due = field.next_compost(threshold)  # Only our batches and composts change it
+    finished = False
+    failure = None
+    while not finished:
+        # Rest until an event arrives, or the batch, a status line or a compost is due
+        wake = min(batch_deadline, next_status)
+        if compost_due is not None:
+            wake = min(wake, time.monotonic() + max(compost_due - clock.time(), 0.0))
+        timeout = None if wake == math.inf else max(wake - time.monotonic(), 0.0)
+        try:
+            event = events.get(timeout=timeout)
+        except queue.Empty:
+            event = None
+        if event is _END:
+            finished = True
+        elif isinstance(event, SourceError):
+            failure = event  # Raised once what came before it is emitted
+        elif event is not None:
+            if not batch:
+                batch_deadline = time.monotonic() + max_delay
+            batch.append(event)
+
+        if batch and (finished or len(batch) >= batch_size or time.monotonic() >= batch_deadline):
+            totals["ingested"] += field.emit_many(batch, resonate=resonate)
+            totals["batches"] += 1
+            batch = []
+            batch_deadline = math.inf
+            compost_due = field.next_compost(threshold)
+
+        if compost_due is not None and compost_due <= clock.time():
+            totals["composted"] += field.compost(threshold)
+            compost_due = field.next_compost(threshold)
+
+        if not finished and time.monotonic() >= next_status:
+            reported = status()
+            on_status(reported)
+            next_status = time.monotonic() + status_interval
+
+    final = status()
+    if on_status is not None and (reported is None or reported["alive"] != final["alive"]
+                                  or reported["ingested"] != final["ingested"]):
+        on_status(final)
+    if failure is not None:
+        raise failure
+    return final
+
+
+def _print_status(as_json: bool) -> Callable[[Dict[str, Any]], None]:
+    def show(status: Dict[str, Any]) -> None:
+        if as_json:
+            print(json.dumps(status, ensure_ascii=False), flush=True)
+        else:
+            print(f"🌾 {status['field']}: {status['ingested']} ingested ({status['rate']:.0f}/s), "
+                  f"{status['alive']} alive, {status['composted']} composted, "
+                  f"{status['rejected']} rejected, attention {status['attention']:.2f}", flush=True)
+    return show
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m spirida.ingest",
+                                     description="📥 Stream JSONL or CSV events into a Spirida field.")
+    parser.add_argument("sources", nargs="*", default=["-"], help="Files to read ('-' or none for stdin)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Input format (default: by file name, else jsonl)")
+    parser.add_argument("--field", default="ingest", help="Name of the field")
+    parser.add_argument("--storage", choices=["list", "columnar"], default="list", help="How the field keeps its pulses")
+    parser.add_argument("--history", choices=["full", "ring", "aggregate", "off"], default="aggregate",
+                        help="Resonance history policy")
+    parser.add_argument("--mode", choices=COMPOSTING_MODES, default="natural", help="Composting mode")
+    parser.add_argument("--store", help="Keep the field in this Spiralbase directory")
+    parser.add_argument("--wal", action="store_true", help="Keep a write-ahead log as well (with --store)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Most events per batch")
+    parser.add_argument("--max-delay", type=float, default=1.0, help="Longest wait in seconds before a partial batch is emitted")
+    parser.add_argument("--no-resonance", action="store_true", help="Do not let ingested pulses resonate")
+    parser.add_argument("--threshold", type=float, default=0.01, help="Attention below which pulses are composted")
+    parser.add_argument("--status-interval", type=float, default=10.0, help="Seconds between status lines")
+    parser.add_argument("--json", action="store_true", help="Write status lines as JSON")
+    args = parser.parse_args(argv)
+    if args.wal and not args.store:
+        parser.error("--wal needs --store: a write-ahead log belongs to a field kept on disk")
+
+    if args.store:
+        field = SpiralField.open(args.store, args.field, composting_mode=args.mode, storage=args.storage,
+                                 history=args.history, wal=args.wal)
+    else:
+        field = SpiralField(args.field, composting_mode=args.mode, storage=args.storage, history=args.history)
+
+    def report_error(path: str, number: int, reason: str) -> None:
+        print(f"⚠️  {path}:{number}: {reason}", file=sys.stderr)
+
+    try:
+        final = ingest(field, args.sources, args.format, args.batch_size, args.max_delay,
+                       resonate=not args.no_resonance, threshold=args.threshold,
+                       status_interval=args.status_interval, on_status=_print_status(args.json),
+                       on_error=report_error)
+    except SourceError as error:
+        print(f"⚠️  {error}", file=sys.stderr)
+        return 1
+    finally:
+        field.close()
+    return 0 if final["ingested"] or not final["rejected"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+📝 LOGWRITER – Keeping a session's words without stopping to write each one
+
+A LogWriter keeps its log file open for the whole session and gathers
+lines in memory, writing them out together once `buffer_bytes` have
+gathered or `flush_interval` seconds have passed - so a long session
+spends its time breathing, not opening and closing files. A log that
+grows past `max_bytes` is rotated: spirida_log.txt becomes
+spirida_log.txt.1, and so on for `backups` generations.
+
+    with LogWriter("spirida_log.txt", max_bytes=1_000_000) as log:
+        spiral_interaction(presence=8, on_output=log)
+
+A LogWriter is an output sink (see spirida.sinks), so it can be given
+to a system or field as well. Lines written while nothing else is
+happening are only flushed on the next write - unless background=True,
+which lets a thread of its own flush them when their interval is up.
+"""
+
+import os
+import threading
+import time
+from typing import List, Optional
+
+from .sinks import OutputSink
+
+
+class LogWriter(OutputSink):
+    """A buffered, rotating, append-only log file."""
+
+    def __init__(self, path: str, buffer_bytes: int = 64 * 1024, flush_interval: float = 1.0,
+                 max_bytes: Optional[int] = None, backups: int = 3, background: bool = False,
+                 durable: bool = False):
+        if buffer_bytes <= 0:
+            raise ValueError("buffer_bytes must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.path = path
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.durable = durable  # fsync each flush, not only hand it to the operating system
+        self._lock = threading.Lock()
+        self._lines: List[str] = []
+        self._buffered = 0  # Characters gathered - close enough to bytes to decide when to flush
+        self._last_flush = time.monotonic()
+        self._file = open(path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if background:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True,
+                                             name=f"log-{os.path.basename(path)}")
+            self._flusher.start()
+
+    def write(self, message: str) -> None:
+        """Add a line to the log; it reaches the file at the next flush."""
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"{self.path} is closed")
+            self._lines.append(message + "\n")
+            self._buffered += len(message) + 1
+            if (self._buffered >= self.buffer_bytes
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._write_lines()
+
+    # The log can be given wherever a function of one line is expected
+    __call__ = write
+
+    def _write_lines(self) -> None:
+        """Write out everything gathered - with the lock held."""
+        self._last_flush = time.monotonic()
+        if not self._lines:
+            return
+        data = "".join(self._lines)
+        self._lines = []
+        self._buffered = 0
+        size = len(data.encode("utf-8"))
+        if self.max_bytes is not None and self._size and self._size + size > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        if self.durable:
+            os.fsync(self._file.fileno())
+        self._size += size
+
+    def _rotate(self) -> None:
+        """Move the log aside as .1 (and older ones up by one), and begin it anew."""
+        self._file.close()
+        if self.backups > 0:
+            for generation in range(self.backups - 1, 0, -1):
+                older = f"{self.path}.{generation}"
+                if os.path.exists(older):
+                    os.replace(older, f"{self.path}.{generation + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = 0
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            with self._lock:
+                if time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._write_lines()
+
+    def flush(self) -> None:
+        """Write everything gathered so far to the file now."""
+        with self._lock:
+            if not self._closed:
+                self._write_lines()
+
+    def close(self) -> None:
+        """Write what is left and close the file."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if self._closed:
+                return
+            self._write_lines()
+            self._file.close()
+            self._closed = True
+
+    def __enter__(self) -> 'LogWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f"LogWriter({self.path!r}, max_bytes={self.max_bytes}, backups={self.backups})"
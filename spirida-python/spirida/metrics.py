@@ -0,0 +1,258 @@
+"""
+📈 METRICS – Listening to how the system is doing
+
+A contemplative system can be asked how it feels (system_status()),
+but not how hard it is working. Once instrumented, it also keeps
+counters and latency histograms of its busiest moments:
+
+- spirida_emit_seconds / spirida_emit_many_seconds: time to emit
+  (with resonances), per field
+- spirida_resonance_pairs_total: pairs of pulses that met, per field
+- spirida_compost_seconds and spirida_composted_total: compost passes
+  and what they released, per field and composting mode
+- spirida_maintenance_seconds, spirida_maintenance_overruns_total:
+  background maintenance passes, and those that outlasted a breath
+- spirida_maintenance_lag_seconds: how late the background breath
+  woke, against the moment it meant to
+
+    system = ContemplativeSystem("garden", instrument=True)
+    ...
+    print(system.metrics()["spirida_emit_seconds"])
+    PrometheusExporter(system, port=9464).start()  # http://127.0.0.1:9464/metrics
+
+Instrumentation is off unless asked for, and costs nothing then.
+"""
+
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# What each metric is, for the exporter
+HELP = {
+    "spirida_emit_seconds": ("histogram", "Time to emit one pulse, resonances included"),
+    "spirida_emit_many_seconds": ("histogram", "Time to emit a batch of pulses, resonances included"),
+    "spirida_emitted_total": ("counter", "Pulses emitted"),
+    "spirida_resonance_pairs_total": ("counter", "Pairs of pulses whose resonance was evaluated"),
+    "spirida_compost_seconds": ("histogram", "Time taken by one compost pass"),
+    "spirida_composted_total": ("counter", "Pulses composted"),
+    "spirida_maintenance_seconds": ("histogram", "Time taken by one background maintenance pass"),
+    "spirida_maintenance_overruns_total": ("counter", "Maintenance passes that took longer than a breath"),
+    "spirida_maintenance_lag_seconds": ("histogram", "How late the background breath woke for maintenance"),
+    "spirida_field_pulses": ("gauge", "Pulses alive in a field"),
+    "spirida_field_attention": ("gauge", "Total attention held by a field"),
+    "spirida_breath_cycles": ("gauge", "Breath cycles completed"),
+    "spirida_breath_duration_seconds": ("gauge", "Length of one breath cycle"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Counts of observations by bucket, with their sum."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last counts what no bucket holds
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Dict[str, int]:
+        """Observations at or below each bound, "+Inf" holding them all."""
+        total = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            buckets[repr(bound)] = total
+        buckets["+Inf"] = self.count
+        return buckets
+
+
+class Metrics:
+    """
+    A thread-safe registry of counters and histograms, each kept per
+    set of labels (such as field="journal").
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        """Add `amount` to a counter."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one observation in a histogram."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Every metric as {name: {"type", "help", "samples"}}, each sample
+        holding its labels and either a value or a histogram's count,
+        sum and cumulative buckets.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for name, series in self._counters.items():
+                result[name] = _metric(name, "counter",
+                                       [{"labels": dict(key), "value": value} for key, value in series.items()])
+            for name, series in self._histograms.items():
+                result[name] = _metric(name, "histogram",
+                                       [{"labels": dict(key), "count": h.count, "sum": h.sum,
+                                         "buckets": h.cumulative()} for key, h in series.items()])
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def __repr__(self):
+        return f"Metrics({len(self._counters)} counters, {len(self._histograms)} histograms)"
+
+
+def _metric(name: str, kind: str, samples) -> Dict[str, Any]:
+    return {"type": kind, "help": HELP.get(name, (kind, name))[1], "samples": samples}
+
+
+def gauge(name: str, samples) -> Dict[str, Any]:
+    """A gauge metric in the form Metrics.snapshot() gives, for values read on demand."""
+    return _metric(name, "gauge", samples)
+
+
+# Exporting
+
+def _format_labels(labels: Dict[str, Any], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels.items()) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+
+def prometheus_text(metrics: Dict[str, Dict[str, Any]]) -> str:
+    """Render metrics (as from Metrics.snapshot() or system.metrics()) in the Prometheus text format."""
+    lines = []
+    for name in sorted(metrics):
+        metric = metrics[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for sample in metric["samples"]:
+            labels = sample["labels"]
+            if metric["type"] == "histogram":
+                for bound, count in sample["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', bound))} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {sample['sum']!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+            else:
+                lines.append(f"{name}{_format_labels(labels)} {float(sample['value'])!r}")
+    return "\n".join(lines) + "\n"
+
+
+def _read(source) -> Dict[str, Dict[str, Any]]:
+    """Metrics from a system (its metrics()) or a Metrics registry (its snapshot())."""
+    return source.snapshot() if isinstance(source, Metrics) else source.metrics()
+
+
+def write_prometheus(source, path: str) -> None:
+    """
+    Write the metrics of `source` to `path` in the Prometheus text format,
+    replacing the file at once - as a node exporter's textfile collector expects.
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(prometheus_text(_read(source)))
+    os.replace(temporary, path)
+
+
+class PrometheusExporter:
+    """
+    Publishes the metrics of a system (or a Metrics registry): written to
+    `path` every `interval` seconds, and/or served over HTTP at
+    http://host:port/metrics. Binds to the local host only unless told
+    otherwise.
+    """
+
+    def __init__(self, source, path: Optional[str] = None, port: Optional[int] = None,
+                 host: str = "127.0.0.1", interval: float = 15.0):
+        if path is None and port is None:
+            raise ValueError("Give a path to write to, a port to serve on, or both")
+        self.source = source
+        self.path = path
+        self.port = port
+        self.host = host
+        self.interval = interval
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> 'PrometheusExporter':
+        if self.path is not None and self._writer is None:
+            self._stop.clear()
+            self._writer = threading.Thread(target=self._write_loop, daemon=True, name="spirida-metrics")
+            self._writer.start()
+        if self.port is not None and self._server is None:
+            source = self.source
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] not in ("/", "/metrics"):
+                        self.send_error(404)
+                        return
+                    body = prometheus_text(_read(source)).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass  # Scrapes are not news
+
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self.port = self._server.server_address[1]  # The one chosen, if port was 0
+            threading.Thread(target=self._server.serve_forever, daemon=True, name="spirida-metrics-http").start()
+        return self
+
+    def _write_loop(self) -> None:
+        while True:
+            write_prometheus(self.source, self.path)
+            if self._stop.wait(self.interval):
+                return
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+            write_prometheus(self.source, self.path)  # The last word
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __repr__(self):
+        return f"PrometheusExporter(path={self.path!r}, port={self.port})"
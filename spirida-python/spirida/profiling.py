@@ -0,0 +1,259 @@
+"""
+🔬 PROFILING – Seeing where a breath's time goes
+
+When background maintenance grows slow, a BreathProfiler shows where
+its time is spent. Given to a system, it profiles every Nth pass of the
+background breath, and any pass that outlasts its budget (by default
+the length of one breath), and appends what it saw to a file of
+collapsed stacks - one "frame;frame;frame weight" line per stack, as
+flamegraph.pl, speedscope and inferno read them:
+
+    profiler = system.enable_profiling("breath.folded", every=100)
+    ...
+    $ flamegraph.pl breath.folded > breath.svg
+
+Two ways of looking are offered:
+
+- "sampling" (the default): a thread of its own looks at the breath's
+  stack every `interval` seconds while a pass runs. It costs little, so
+  every pass can be watched and overruns caught as they happen; stacks
+  are weighted by samples. The one thread rests between passes and
+  ends when the breath stops.
+- "cprofile": each pass is run under cProfile, which sees every call
+  but slows the pass down. Its stacks are rebuilt from cProfile's
+  caller/callee timings (so they are approximate where a function is
+  reached along several paths), weighted in microseconds.
+
+Either way, the time the breath spends inside the profiler itself is
+not counted.
+
+Each captured pass is rooted at a frame naming why it was kept -
+"breath" or "breath (overrun)" - so overruns stand apart in the graph.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+MODES = ("sampling", "cprofile")
+
+Function = Tuple[str, int, str]  # file, line, name - as cProfile names functions
+
+
+def _frame_name(filename: str, line: int, name: str) -> str:
+    # Semicolons separate frames, and spaces the weight, in collapsed stacks
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ":")
+
+
+def collapse_frames(frame, skip: frozenset = frozenset()) -> Optional[str]:
+    """
+    The collapsed stack of a frame, outermost first - or None if any
+    frame on it runs one of the code objects in `skip`.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        if code in skip:
+            return None
+        names.append(_frame_name(code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def collapse_stats(stats: pstats.Stats, skip: frozenset = frozenset()) -> Dict[str, int]:
+    """
+    Rebuild collapsed stacks, weighted in microseconds, from a cProfile
+    run: beginning at the functions nothing profiled called, each
+    function's time is shared out among its callees as the recorded
+    caller/callee timings say. Functions running one of the code objects
+    in `skip` are left out, with all they called.
+    """
+    skipped = {(code.co_filename, code.co_firstlineno, code.co_name) for code in skip}
+    entries = {function: entry for function, entry in stats.stats.items() if function not in skipped}
+    callees: Dict[Function, Dict[Function, float]] = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees.setdefault(caller, {})[function] = cumulative
+    stacks: Counter = Counter()
+
+    def walk(function: Function, share: float, path: Tuple[str, ...], seen: frozenset) -> None:
+        _, _, own, cumulative, _ = entries[function]
+        if cumulative <= 0 or share <= 0:
+            return
+        scale = min(share / cumulative, 1.0)
+        name = _frame_name(*function) if function[0] != "~" else function[2]
+        path = path + (name,)
+        weight = int(own * scale * 1e6)
+        if weight:
+            stacks[";".join(path)] += weight
+        for callee, edge in callees.get(function, {}).items():
+            if callee not in seen and callee in entries:
+                walk(callee, edge * scale, path, seen | {callee})
+
+    for function, (_, _, _, cumulative, callers) in entries.items():
+        if not any(caller in stats.stats for caller in callers):
+            walk(function, cumulative, (), frozenset((function,)))
+    return dict(stacks)
+
+
+class _Sampler(threading.Thread):
+    """
+    Looks at one thread's stack at a steady interval while asked to,
+    counting what it sees, and rests in between. Stacks passing through
+    the `skip` code objects are not counted.
+    """
+
+    def __init__(self, interval: float, skip: frozenset = frozenset()):
+        super().__init__(daemon=True, name="spirida-profiler")
+        self.interval = interval
+        self.skip = skip
+        self.thread_id: Optional[int] = None
+        self.stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._watching = threading.Event()
+        self._closed = False
+
+    def run(self) -> None:
+        while True:
+            self._watching.wait()
+            if self._closed:
+                return
+            time.sleep(self.interval)
+            thread_id = self.thread_id
+            frame = sys._current_frames().get(thread_id)
+            stack = collapse_frames(frame, self.skip) if frame is not None else None
+            with self._lock:
+                if stack is not None and self._watching.is_set() and self.thread_id == thread_id:
+                    self.stacks[stack] += 1
+
+    def watch(self, thread_id: int) -> None:
+        """Begin counting a thread's stacks afresh."""
+        with self._lock:
+            self.thread_id = thread_id
+            self.stacks = Counter()
+            self._watching.set()
+
+    def pause(self) -> Counter:
+        """Stop counting, and return what was seen since watch()."""
+        with self._lock:
+            self._watching.clear()
+            stacks, self.stacks = self.stacks, Counter()
+        return stacks
+
+    def close(self) -> None:
+        """Let the thread end."""
+        self._closed = True
+        self._watching.set()
+
+
+class BreathProfiler:
+    """
+    Profiles passes of a system's background breath.
+
+    A pass is kept - appended to `path` as collapsed stacks - if it is
+    every `every`th pass (0: none by count), or if it took longer than
+    `budget` seconds (None: one breath; 0 turns overrun capture off).
+    Catching overruns means watching every pass, which in "cprofile"
+    mode slows every pass down; sampling is made for it.
+    """
+
+    def __init__(self, path: str = "spirida_breath.folded", every: int = 100, budget: Optional[float] = None,
+                 mode: str = "sampling", interval: float = 0.001):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode '{mode}' - choose one of {', '.join(MODES)}")
+        if every < 0:
+            raise ValueError("every cannot be negative")
+        self.path = path
+        self.every = every
+        self.budget = budget
+        self.mode = mode
+        self.interval = interval
+        self.passes = 0
+        self.captured = 0
+        self.overruns = 0
+        self._lock = threading.Lock()
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_Sampler] = None
+        self._started = 0.0
+        self._watching = False
+        self._closed = False
+
+    def begin(self, breath_duration: float) -> None:
+        """A pass begins, on the breath's own thread."""
+        self.passes += 1
+        nth = self.every > 0 and self.passes % self.every == 0
+        # Overruns are only known once a pass ends - so while they are
+        # being caught, every pass must be watched
+        self._watching = nth or self.budget is None or self.budget > 0
+        if self._watching:
+            if self.mode == "cprofile":
+                self._profile = cProfile.Profile()
+                self._profile.enable()
+            else:
+                if self._sampler is None and not self._closed:
+                    self._sampler = _Sampler(self.interval, _OWN_CODE)
+                    self._sampler.start()
+                if self._sampler is not None:
+                    self._sampler.watch(threading.get_ident())
+        self._started = time.perf_counter()
+
+    def end(self, breath_duration: float) -> Optional[str]:
+        """
+        A pass ends. Returns why it was kept ("breath" or
+        "breath (overrun)"), or None if it was not.
+        """
+        duration = time.perf_counter() - self._started
+        if not self._watching:
+            return None
+        self._watching = False
+        if self.mode == "cprofile":
+            self._profile.disable()
+            profile, self._profile = self._profile, None
+        else:
+            sampler = self._sampler  # Read once - close() may take it meanwhile
+            samples = sampler.pause() if sampler is not None else Counter()
+
+        budget = breath_duration if self.budget is None else self.budget
+        overrun = budget > 0 and duration > budget
+        if overrun:
+            self.overruns += 1
+        if not overrun and not (self.every > 0 and self.passes % self.every == 0):
+            return None
+
+        stacks = collapse_stats(pstats.Stats(profile), _OWN_CODE) if self.mode == "cprofile" else samples
+        reason = "breath (overrun)" if overrun else "breath"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for stack, weight in stacks.items():
+                    if weight > 0:
+                        f.write(f"{reason};{stack} {weight}\n")
+            self.captured += 1
+        return reason
+
+    def stop(self) -> None:
+        """
+        Let the sampling thread end while the breath rests - the system
+        does so when its breath stops. The next pass begins another.
+        """
+        sampler, self._sampler = self._sampler, None
+        if sampler is not None:
+            sampler.close()
+            sampler.join()
+
+    def close(self) -> None:
+        """Let the sampling thread end, once profiling is over."""
+        self._closed = True
+        self.stop()
+
+    def __repr__(self):
+        return (f"BreathProfiler({self.path!r}, every={self.every}, budget={self.budget}, mode={self.mode!r}, "
+                f"captured={self.captured})")
+
+
+# The profiler's own work on the breath's thread, which is left out of its stacks
+_OWN_CODE = frozenset((BreathProfiler.begin.__code__, BreathProfiler.end.__code__))
@@ -0,0 +1,614 @@
+"""
+🌊 RESONANCE – How pulses recognise one another
+
+The harmonies between symbols and the relationships between emotions
+live here, together with a batch kernel that lets a newly emitted pulse
+sense the whole columnar field in a single pass instead of meeting
+every existing pulse one at a time.
+
+Symbols and emotions are interned to small integer ids as pulses are
+born, and only the relationships the tables speak of are kept. New
+harmonies can be taught at runtime with register_symbol_harmonies and
+register_emotion_relationships.
+
+The batch kernel follows exactly the same four dimensions as
+PulseObject.resonates_with - symbolic harmony, emotional resonance,
+temporal proximity and attentional interaction - and the same emergent
+synthesis, expressed over arrays.
+
+Each pulse also remembers its resonances according to a history
+policy - fully, as a short ring of recent moments, as a few running
+aggregates, or not at all.
+"""
+
+import random
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional – only the batch kernel needs it
+    np = None
+
+
+# Natural harmonies between symbols
+SYMBOL_HARMONIES: Dict[str, Dict[str, float]] = {
+    "🌿": {"🌱": 0.9, "🌊": 0.7, "🍄": 0.8, "🌲": 0.9},
+    "💧": {"🌊": 0.9, "🌿": 0.7, "🌙": 0.6, "💎": 0.5},
+    "✨": {"🌙": 0.8, "🪐": 0.7, "💫": 0.9, "🔮": 0.6},
+    "🍄": {"🌿": 0.8, "🌲": 0.7, "🏔️": 0.6, "🌍": 0.8},
+    "🌙": {"✨": 0.8, "🌊": 0.6, "🕯️": 0.7, "💧": 0.6},
+    "🪐": {"✨": 0.7, "🌌": 0.9, "🔭": 0.6, "💫": 0.8}
+}
+
+# How emotions strengthen, complement or transform each other
+EMOTION_RELATIONSHIPS: Dict[str, Dict[str, float]] = {
+    "calm": {"peaceful": 0.9, "centered": 0.8, "grateful": 0.7, "grief": 0.6},
+    "grief": {"tender": 0.8, "melancholy": 0.9, "calm": 0.6, "healing": 0.7},
+    "joy": {"grateful": 0.8, "hopeful": 0.9, "celebration": 0.9, "peaceful": 0.6},
+    "curious": {"wondering": 0.9, "exploring": 0.8, "hopeful": 0.7, "excited": 0.6},
+    "peaceful": {"calm": 0.9, "centered": 0.8, "still": 0.9, "present": 0.8},
+    "grateful": {"joy": 0.8, "appreciation": 0.9, "humble": 0.7, "loving": 0.8}
+}
+
+# Strength above which resonance restores amplitude to both pulses
+STRENGTHENING_THRESHOLD = 0.6
+
+
+class Vocabulary:
+    """
+    Interned names and the few relationships between them worth keeping.
+
+    Every name met is given a small integer id. Only pairs the tables
+    actually speak of are kept, keyed by their two ids; every other
+    pair relates by `same` or `default`. Interning a name therefore
+    costs only as much as the tables say about it, however many names
+    are known, and sensing a harmony is one dictionary lookup. The
+    relationship tables can be extended or replaced at any time; the
+    kept pairs are then rebuilt while ids stay the same.
+    """
+
+    def __init__(self, relationships: Dict[str, Dict[str, float]], same: float, default: float):
+        self.same = same  # A name resonating with itself
+        self.default = default  # Everything is connected, however subtly
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._tables(relationships)
+        self._pairs: Dict[int, float] = {}  # pair_key(id, other_id) -> relationship, for explicit pairs only
+        self._sorted = None  # _pairs as sorted (keys, values) arrays, for the batch kernel
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _tables(self, relationships: Dict[str, Dict[str, float]]) -> None:
+        self.relationships = {name: dict(related) for name, related in relationships.items()}
+        # Every name each name is spoken of with, in either direction
+        self._related: Dict[str, set] = {}
+        for name, related in self.relationships.items():
+            for other in related:
+                self._related.setdefault(name, set()).add(other)
+                self._related.setdefault(other, set()).add(name)
+
+    def relate(self, name: str, other: str) -> float:
+        """How strongly one name relates to another, read from the tables."""
+        # Direct relationship
+        related = self.relationships.get(name)
+        if related is not None and other in related:
+            return related[other]
+
+        # Reverse check
+        related = self.relationships.get(other)
+        if related is not None and name in related:
+            return related[name]
+
+        if name == other:
+            return self.same
+        return self.default
+
+    def value(self, interned: int, other: int) -> float:
+        """How strongly two interned names relate."""
+        value = self._pairs.get(interned << 32 | other)
+        if value is not None:
+            return value
+        return self.same if interned == other else self.default
+
+    def outer(self, interned: 'np.ndarray', others: 'np.ndarray') -> 'np.ndarray':
+        """
+        value between each of the ids in `interned` and each of those in
+        `others`, as a (len(interned), len(others)) array for the batch
+        kernel. Each distinct pair of ids is looked up only once.
+        """
+        mine, my_index = np.unique(interned, return_inverse=True)
+        theirs, their_index = np.unique(others, return_inverse=True)
+        mine, theirs = mine.astype(np.int64)[:, None], theirs.astype(np.int64)[None, :]
+        table = np.where(mine == theirs, self.same, self.default)
+        keys, values = self._sorted_pairs()
+        if len(keys):
+            wanted = mine << 32 | theirs
+            found = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+            table = np.where(keys[found] == wanted, values[found], table)
+        return table[my_index.reshape(-1, 1), their_index.reshape(1, -1)]
+
+    def _sorted_pairs(self):
+        pairs = self._sorted
+        if pairs is None:
+            with self._lock:
+                keys = np.fromiter(self._pairs.keys(), dtype=np.int64, count=len(self._pairs))
+                values = np.fromiter(self._pairs.values(), dtype=np.float64, count=len(self._pairs))
+                order = np.argsort(keys)
+                pairs = self._sorted = (keys[order], values[order])
+        return pairs
+
+    def _keep(self, pairs: Dict[int, float], name: str) -> None:
+        """Keep every explicit pair between `name` and the names interned so far."""
+        interned = self.ids[name] if name in self.ids else len(self.names)
+        for other in self._related.get(name, ()):
+            other_id = interned if other == name else self.ids.get(other)
+            if other_id is not None:
+                pairs[interned << 32 | other_id] = self.relate(name, other)
+                pairs[other_id << 32 | interned] = self.relate(other, name)
+
+    def intern(self, name: str) -> int:
+        """The id of a name, giving it one (and its explicit pairs) if new."""
+        interned = self.ids.get(name)
+        if interned is not None:
+            return interned
+        with self._lock:
+            interned = self.ids.get(name)
+            if interned is None:
+                self._keep(self._pairs, name)
+                self._sorted = None
+                self.names.append(name)
+                interned = len(self.names) - 1
+                self.ids[name] = interned  # Published last, once its pairs are kept
+        return interned
+
+    def register(self, relationships: Dict[str, Dict[str, float]], replace: bool = False) -> None:
+        """
+        Add relationships (or, with replace=True, start afresh from them)
+        and rebuild the explicit pairs for every name already interned.
+        """
+        with self._lock:
+            if replace:
+                tables = {}
+            else:
+                tables = {name: dict(related) for name, related in self.relationships.items()}
+            for name, related in relationships.items():
+                tables.setdefault(name, {}).update(related)
+            self._tables(tables)
+            pairs = {}
+            for name in self._related:
+                if name in self.ids:
+                    self._keep(pairs, name)
+            self._pairs = pairs
+            self._sorted = None
+
+
+class HarmonyRegistry:
+    """
+    The vocabularies of symbols and emotions shared by every pulse.
+
+    Pulses intern their symbol and emotion here when they are born, and
+    the columnar store keeps the very same ids in its columns, so both
+    sense resonance from the same relationships.
+    """
+
+    def __init__(self, symbol_harmonies: Optional[Dict[str, Dict[str, float]]] = None,
+                 emotion_relationships: Optional[Dict[str, Dict[str, float]]] = None):
+        self.symbols = Vocabulary(SYMBOL_HARMONIES if symbol_harmonies is None else symbol_harmonies,
+                                  same=0.8, default=0.2)
+        self.emotions = Vocabulary(EMOTION_RELATIONSHIPS if emotion_relationships is None else emotion_relationships,
+                                   same=0.8, default=0.3)
+
+    def symbol_harmony(self, symbol_id: int, other_id: int) -> float:
+        return self.symbols.value(symbol_id, other_id)
+
+    def emotion_resonance(self, emotion_id: int, other_id: int) -> float:
+        return self.emotions.value(emotion_id, other_id)
+
+
+# The registry every pulse in this process shares
+HARMONIES = HarmonyRegistry()
+
+
+def register_symbol_harmonies(harmonies: Dict[str, Dict[str, float]], replace: bool = False) -> None:
+    """
+    Teach the field new symbol harmonies, e.g. for your own vocabulary:
+
+        register_symbol_harmonies({"🔥": {"🌋": 0.9, "☀️": 0.7}})
+
+    With replace=True the built-in harmonies are set aside entirely.
+    """
+    HARMONIES.symbols.register(harmonies, replace)
+
+
+def register_emotion_relationships(relationships: Dict[str, Dict[str, float]], replace: bool = False) -> None:
+    """Teach the field new emotional relationships, as register_symbol_harmonies does for symbols."""
+    HARMONIES.emotions.register(relationships, replace)
+
+
+def symbol_harmony(symbol: str, other_symbol: str) -> float:
+    """How strongly one symbol harmonises with another."""
+    symbols = HARMONIES.symbols
+    return symbols.value(symbols.intern(symbol), symbols.intern(other_symbol))
+
+
+def emotion_resonance(emotion: str, other_emotion: str) -> float:
+    """How strongly one emotion resonates with another."""
+    emotions = HARMONIES.emotions
+    return emotions.value(emotions.intern(emotion), emotions.intern(other_emotion))
+
+
+def temporal_proximity(birth: float, other_birth: float) -> float:
+    """How temporal closeness affects resonance."""
+    time_diff = abs(birth - other_birth)
+
+    # Pulses born within seconds resonate strongly
+    if time_diff < 5:
+        return 0.9
+    elif time_diff < 30:
+        return 0.7
+    elif time_diff < 300:  # 5 minutes
+        return 0.4
+    else:
+        return 0.1
+
+
+def attention_resonance(my_attention: float, other_attention: float) -> float:
+    """How two current attention levels interact."""
+    # Strong pulses amplify each other
+    if my_attention > 0.7 and other_attention > 0.7:
+        return 0.8
+
+    # One strong pulse can revive a fading one
+    elif (my_attention > 0.7 and other_attention > 0.2) or (other_attention > 0.7 and my_attention > 0.2):
+        return 0.6
+
+    # Both fading creates gentle resonance
+    elif my_attention < 0.3 and other_attention < 0.3:
+        return 0.4
+
+    return 0.3
+
+
+# attention_resonance only asks whether an attention is above 0.2, below
+# 0.3 or above 0.7 - so attentions fall in four bands it treats alike,
+# and each band is represented here by one attention within it
+ATTENTION_BANDS = (0.1, 0.25, 0.5, 0.8)
+ATTENTION_EDGES = (0.2, 0.3, 0.7)  # Where one band gives way to the next
+
+
+def attention_band(attention):
+    """Which of the ATTENTION_BANDS an attention (or a numpy array of them) falls in, 0 to 3."""
+    return (attention > 0.2) * 1 + (attention >= 0.3) + (attention > 0.7)
+
+
+def synthesize_resonance(symbolic: float, emotional: float,
+                         temporal: float, attentional: float) -> float:
+    """Synthesize component resonances into emergent total."""
+    # Not just average - some combinations create emergent properties
+    base_resonance = (symbolic + emotional + temporal + attentional) / 4
+
+    # High emotional + symbolic creates amplification
+    if emotional > 0.7 and symbolic > 0.7:
+        base_resonance *= 1.3
+
+    # Strong temporal proximity amplifies everything
+    if temporal > 0.8:
+        base_resonance *= 1.2
+
+    # Cap at 1.0
+    return min(base_resonance, 1.0)
+
+
+def pair_strength(symbol: str, emotion: str, birth: float, attention: float,
+                  other_symbol: str, other_emotion: str, other_birth: float,
+                  other_attention: float) -> float:
+    """
+    Resonance strength between two pulses described by their qualities.
+
+    The same synthesis as PulseObject.resonates_with, as a pure function:
+    nothing is recorded and no poetry is written.
+    """
+    return synthesize_resonance(
+        symbol_harmony(symbol, other_symbol),
+        emotion_resonance(emotion, other_emotion),
+        temporal_proximity(birth, other_birth),
+        attention_resonance(attention, other_attention)
+    )
+
+
+def interned_pair_strength(symbol_id: int, emotion_id: int, birth: float, attention: float,
+                           other_symbol_id: int, other_emotion_id: int, other_birth: float,
+                           other_attention: float) -> float:
+    """pair_strength for pulses already known by their interned symbol and emotion ids."""
+    return synthesize_resonance(
+        HARMONIES.symbols.value(symbol_id, other_symbol_id),
+        HARMONIES.emotions.value(emotion_id, other_emotion_id),
+        temporal_proximity(birth, other_birth),
+        attention_resonance(attention, other_attention)
+    )
+
+
+def resonance_poetry(symbol: str, emotion: str, other_symbol: str, other_emotion: str,
+                     strength: float) -> str:
+    """A poetic trace of the resonance between two pulses."""
+    if strength > 0.8:
+        poems = [
+            f"{symbol} and {other_symbol} sing in harmony...",
+            f"Deep resonance flows between {emotion} and {other_emotion}...",
+            f"Two pulses become one rhythm...",
+            f"The field trembles with recognition..."
+        ]
+    elif strength > 0.6:
+        poems = [
+            f"{symbol} recognizes {other_symbol} across time...",
+            f"Echoes of {emotion} stir {other_emotion}...",
+            f"A gentle connection forms...",
+            f"Frequencies align in subtle dance..."
+        ]
+    elif strength > 0.4:
+        poems = [
+            f"{symbol} notices {other_symbol} in passing...",
+            f"Faint harmonies between {emotion} and {other_emotion}...",
+            f"A whisper of connection...",
+            f"Distant resonance, like memory..."
+        ]
+    else:
+        poems = [
+            f"{symbol} and {other_symbol} share the same field...",
+            f"All pulses are connected, even in silence...",
+            f"The subtlest resonance, barely perceptible...",
+            f"Unity in the underlying stillness..."
+        ]
+
+    return random.choice(poems)
+
+
+HISTORY_POLICIES = ("full", "ring", "aggregate", "off")
+
+
+class ResonanceLog(list):
+    """Full resonance history - every resonance event, kept as a dict."""
+
+    __slots__ = ()
+
+    def record(self, timestamp: float, other_symbol: str, other_emotion: str,
+               strength: float, poetic_trace: Optional[str]) -> None:
+        self.append({
+            "timestamp": timestamp,
+            "other_symbol": other_symbol,
+            "other_emotion": other_emotion,
+            "resonance_strength": strength,
+            "poetic_trace": poetic_trace
+        })
+
+    def record_many(self, timestamp: float, other_symbols: Sequence[str], other_emotions: Sequence[str],
+                    strengths: Sequence[float], poetic_traces: Sequence[Optional[str]]) -> None:
+        for event in zip(other_symbols, other_emotions, strengths, poetic_traces):
+            self.record(timestamp, *event)
+
+
+class ResonanceRing(deque):
+    """Only the most recent resonance events, up to a fixed size - the oldest fall away as new ones arrive."""
+
+    __slots__ = ()
+
+    def __init__(self, size: int = 16):
+        super().__init__(maxlen=max(int(size), 1))
+
+    @property
+    def size(self) -> int:
+        return self.maxlen
+
+    # Events are kept as ResonanceLog keeps them
+    record = ResonanceLog.record
+
+    def record_many(self, timestamp: float, other_symbols: Sequence[str], other_emotions: Sequence[str],
+                    strengths: Sequence[float], poetic_traces: Sequence[Optional[str]]) -> None:
+        # Only the last `size` events could survive anyway
+        keep = slice(-self.maxlen, None)
+        for event in zip(other_symbols[keep], other_emotions[keep], strengths[keep], poetic_traces[keep]):
+            self.record(timestamp, *event)
+
+    def __copy__(self) -> 'ResonanceRing':
+        ring = type(self)(self.maxlen)
+        ring.extend(self)
+        return ring
+
+    def __reduce__(self):
+        return type(self), (self.maxlen,), None, iter(self)
+
+
+class ResonanceSummary:
+    """
+    Running aggregates instead of individual events.
+
+    Remembers how often a pulse resonated, how strongly on average and
+    at most, and with whom it resonated last - in constant space.
+    """
+
+    __slots__ = ("count", "total_strength", "max_strength",
+                 "last_symbol", "last_emotion", "last_timestamp")
+
+    def __init__(self):
+        self.count = 0
+        self.total_strength = 0.0
+        self.max_strength = 0.0
+        self.last_symbol: Optional[str] = None
+        self.last_emotion: Optional[str] = None
+        self.last_timestamp: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean_strength(self) -> float:
+        return self.total_strength / self.count if self.count else 0.0
+
+    def record(self, timestamp: float, other_symbol: str, other_emotion: str,
+               strength: float, poetic_trace: Optional[str] = None) -> None:
+        self.count += 1
+        self.total_strength += strength
+        if strength > self.max_strength:
+            self.max_strength = strength
+        self.last_symbol = other_symbol
+        self.last_emotion = other_emotion
+        self.last_timestamp = timestamp
+
+    def record_many(self, timestamp: float, other_symbols: Sequence[str], other_emotions: Sequence[str],
+                    strengths: Sequence[float], poetic_traces: Sequence[Optional[str]] = ()) -> None:
+        if not len(strengths):
+            return
+        self.count += len(strengths)
+        self.total_strength += float(sum(strengths))
+        self.max_strength = max(self.max_strength, float(max(strengths)))
+        self.last_symbol = other_symbols[-1]
+        self.last_emotion = other_emotions[-1]
+        self.last_timestamp = timestamp
+
+    def as_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "mean_strength": self.mean_strength,
+            "max_strength": self.max_strength,
+            "last_symbol": self.last_symbol,
+            "last_emotion": self.last_emotion,
+            "last_timestamp": self.last_timestamp
+        }
+
+    def __repr__(self):
+        return (f"ResonanceSummary(count={self.count}, mean={self.mean_strength:.3f}, "
+                f"max={self.max_strength:.3f}, last={self.last_symbol})")
+
+
+class _NoResonanceHistory(tuple):
+    """Resonance is felt but not remembered."""
+
+    __slots__ = ()
+
+    def record(self, *event) -> None:
+        pass
+
+    def record_many(self, *events) -> None:
+        pass
+
+
+NO_HISTORY = _NoResonanceHistory()
+
+
+def new_resonance_history(policy: str = "full", size: int = 16):
+    """
+    Create an empty resonance history for one pulse.
+
+    - "full": every event (the original behaviour; grows without bound)
+    - "ring": the `size` most recent events
+    - "aggregate": count, mean/max strength and last partner only
+    - "off": nothing at all
+    """
+    if policy == "full":
+        return ResonanceLog()
+    if policy == "ring":
+        return ResonanceRing(size)
+    if policy == "aggregate":
+        return ResonanceSummary()
+    if policy == "off":
+        return NO_HISTORY
+    raise ValueError(f"Unknown history policy '{policy}' - choose one of {', '.join(HISTORY_POLICIES)}")
+
+
+class ResonanceKernel:
+    """
+    Scores one pulse against many in a single vectorised pass.
+
+    Symbol and emotion relationships are looked up in the registry's
+    vocabularies by the interned ids a columnar store keeps in its
+    columns.
+    """
+
+    def __init__(self, harmonies: Optional[HarmonyRegistry] = None):
+        if np is None:
+            raise ImportError("The resonance kernel needs numpy - install it with 'pip install numpy'.")
+        self.harmonies = HARMONIES if harmonies is None else harmonies
+
+    def score(self, store, row: int, now: float, others: Optional[slice] = None,
+              attention: Optional[float] = None) -> 'np.ndarray':
+        """
+        Resonance strength between the pulse in `row` and each pulse in `others`
+        (by default every row before it).
+
+        This mirrors PulseObject.resonates_with, evaluated for all pairs at
+        the same instant and without recording history or poetry. The
+        pulse's attention may be given, instead of read from its row.
+        """
+        if others is None:
+            others = slice(0, row)
+        return self._score(store, slice(row, row + 1), others, lambda my_births, other_births: now,
+                           my_attention=attention)[0]
+
+    def score_block(self, store, rows: slice, others: slice, now: float, components: bool = False):
+        """
+        Resonance strengths between a block of pulses and another range of
+        pulses, as a (len(rows), len(others)) matrix. Each pulse in `rows`
+        plays the part of `self` in PulseObject.resonates_with.
+        
+        With components=True the symbolic, emotional, temporal and
+        attentional matrices are returned after the strengths, as
+        resonates_with reports them.
+        """
+        return self._score(store, rows, others, lambda my_births, other_births: now, components)
+
+    def score_meetings(self, store, rows: slice, others: slice) -> 'np.ndarray':
+        """
+        Like score_block, but each pair meets at the later of its two
+        births rather than at one shared instant - as when pulses with
+        backdated births are replayed in the order they were born.
+        """
+        return self._score(store, rows, others, np.maximum)
+
+    def _score(self, store, rows: slice, others: slice, meeting, components: bool = False,
+               my_attention: Optional[float] = None):
+        """Score rows against others, each pair at the moment meeting(my_births, other_births)."""
+        columns = store.columns
+
+        my_symbols = columns["symbol_id"][rows]
+        my_emotions = columns["emotion_id"][rows]
+        my_births = columns["birth"][rows][:, None]
+        other_symbols = columns["symbol_id"][others]
+        other_emotions = columns["emotion_id"][others]
+        other_births = columns["birth"][others]
+
+        moment = meeting(my_births, other_births)
+        if my_attention is None:
+            my_attention = columns["amplitude"][rows][:, None] * np.exp(
+                -columns["decay_rate"][rows][:, None] * (moment - my_births))
+        other_attention = columns["amplitude"][others] * np.exp(
+            -columns["decay_rate"][others] * (moment - other_births))
+
+        # Symbolic and emotional resonance - looked up by interned id
+        symbolic = self.harmonies.symbols.outer(my_symbols, other_symbols)
+        emotional = self.harmonies.emotions.outer(my_emotions, other_emotions)
+
+        # Temporal resonance - pulses born close in time share context
+        time_diff = np.abs(my_births - other_births)
+        temporal = np.select([time_diff < 5, time_diff < 30, time_diff < 300],
+                             [0.9, 0.7, 0.4], default=0.1)
+
+        # Attentional resonance - how current attention levels interact
+        both_strong = (my_attention > 0.7) & (other_attention > 0.7)
+        one_revives = (((my_attention > 0.7) & (other_attention > 0.2)) |
+                       ((other_attention > 0.7) & (my_attention > 0.2)))
+        both_fading = (my_attention < 0.3) & (other_attention < 0.3)
+        attentional = np.select([both_strong, one_revives, both_fading],
+                                [0.8, 0.6, 0.4], default=0.3)
+
+        # Composite resonance - not just additive, but emergent
+        strength = (symbolic + emotional + temporal + attentional) / 4
+        strength = np.where((emotional > 0.7) & (symbolic > 0.7), strength * 1.3, strength)
+        strength = np.where(temporal > 0.8, strength * 1.2, strength)
+        strength = np.minimum(strength, 1.0)
+        if components:
+            return strength, symbolic, emotional, temporal, attentional
+        return strength
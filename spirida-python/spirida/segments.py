@@ -0,0 +1,336 @@
+"""
+🗄️ SEGMENTS – Spiralbase at rest
+
+A field remembers only for as long as its process breathes. A
+SegmentStore lets it sleep and wake again: every pulse is written, as it
+is born, into append-only segment files of fixed-width records that are
+memory-mapped, so writing one is no more than a copy into the page
+cache. Amplitudes renewed by resonance are changed in place, and a
+composted pulse is only marked as gone - its record stays until every
+other record of its segment has gone too, and the segment is let go.
+
+    field = SpiralField.open("journal.spiralbase", storage="columnar")
+    field.emit("🌱", "hopeful")
+    field.close()  # ...and tomorrow:
+    field = SpiralField.open("journal.spiralbase", storage="columnar")
+
+Pulses keep their births, so a reopened field resumes fading exactly
+where it was, as though it had never slept.
+
+A store is a directory:
+
+- segment-000000.spb, ...: a 64-byte header and `capacity` records
+- symbols.txt, emotions.txt: append-only string tables (one JSON
+  string per line; a record holds the line number)
+- field.json: the field's own qualities, rewritten on sync()
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional – it only makes opening large stores quicker
+    np = None
+
+from .contemplative_core import FieldObserver, PulseObject, PULSE_COLUMNS
+
+MAGIC = b"SPBSEG1\0"
+HEADER = struct.Struct("<8sIQQ")  # magic, record size, capacity, records written
+HEADER_SIZE = 64
+# uid, birth, last_pulse, amplitude, decay_rate, pulse_count, symbol, emotion, state
+RECORD = struct.Struct("<qddddqiiI4x")
+FLOAT = struct.Struct("<d")
+COUNT = struct.Struct("<q")
+STATE = struct.Struct("<I")
+OFFSETS = {"last_pulse": 16, "amplitude": 24, "pulse_count": 40, "state": 56}
+COMPOSTED, ALIVE = 0, 1
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([("uid", "<i8"), ("birth", "<f8"), ("last_pulse", "<f8"), ("amplitude", "<f8"),
+                             ("decay_rate", "<f8"), ("pulse_count", "<i8"), ("symbol_id", "<i4"),
+                             ("emotion_id", "<i4"), ("state", "<u4"), ("_", "V4")])
+
+_SEGMENT_NAME = re.compile(r"segment-(\d{6})\.spb$")
+
+
+def _fsync_directory(path: str) -> None:
+    """Put a directory's entries on disk, where the platform allows it."""
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened everywhere (Windows)
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+class Segment:
+    """One memory-mapped segment file of fixed-width pulse records."""
+
+    def __init__(self, path: str, capacity: int, create: bool = False):
+        self.path = path
+        if create:
+            with open(path, "wb") as f:
+                f.truncate(HEADER_SIZE + capacity * RECORD.size)
+        self._file = open(path, "r+b")
+        self.map = mmap.mmap(self._file.fileno(), 0)
+        if create:
+            HEADER.pack_into(self.map, 0, MAGIC, RECORD.size, capacity, 0)
+        magic, record_size, self.capacity, self.count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is not a Spiralbase segment")
+        self.alive = 0
+        self.dirty = create
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def offset(self, slot: int) -> int:
+        return HEADER_SIZE + slot * RECORD.size
+
+    def append(self, record: Tuple) -> int:
+        """Write a record into the next free slot and return the slot."""
+        slot = self.count
+        RECORD.pack_into(self.map, self.offset(slot), *record)
+        self.count += 1
+        # The record is whole before the header admits it
+        HEADER.pack_into(self.map, 0, MAGIC, RECORD.size, self.capacity, self.count)
+        self.alive += 1
+        self.dirty = True
+        return slot
+
+    def records(self):
+        """Every record written so far, composted ones included."""
+        return RECORD.iter_unpack(self.map[HEADER_SIZE:self.offset(self.count)])
+
+    def array(self) -> 'np.ndarray':
+        """The records written so far as a numpy view onto the mapped file."""
+        return np.frombuffer(self.map, dtype=RECORD_DTYPE, count=self.count, offset=HEADER_SIZE)
+
+    def flush(self) -> None:
+        if self.dirty:
+            self.map.flush()
+            self.dirty = False
+
+    def close(self) -> None:
+        if not self.map.closed:
+            self.map.close()
+        self._file.close()
+
+
+class _StringTable:
+    """An append-only table of names, one JSON string per line."""
+
+    def __init__(self, path: str):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        name = json.loads(line)
+                        self.ids.setdefault(name, len(self.names))
+                        self.names.append(name)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def intern(self, name: str) -> int:
+        local = self.ids.get(name)
+        if local is None:
+            local = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self._file.write(json.dumps(name, ensure_ascii=False) + "\n")
+            # Records naming it reach the page cache at once - so must the name
+            self._file.flush()
+        return local
+
+    def flush(self, durable: bool = False) -> None:
+        self._file.flush()
+        if durable:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SegmentStore(FieldObserver):
+    """
+    Append-only, memory-mapped storage for the pulses of one field.
+
+    Attached to a field (SpiralField.open does this), it writes through
+    every emit, amplitude change and compost as it happens. Records are
+    in the page cache at once; flush() - or the field's sync() - asks
+    the operating system to put them on disk.
+    """
+
+    def __init__(self, path: str, segment_capacity: int = 65536):
+        if segment_capacity <= 0:
+            raise ValueError("segment_capacity must be positive")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.segment_capacity = segment_capacity
+        self.symbols = _StringTable(os.path.join(path, "symbols.txt"))
+        self.emotions = _StringTable(os.path.join(path, "emotions.txt"))
+        self.segments: List[Segment] = []
+        self._slots: Dict[int, Tuple[Segment, int]] = {}  # uid -> where its record lives
+        self._next_segment = 0
+        meta = self.read_meta() or {}
+        self.generation = meta.get("wal_generation", 0)  # Which write-ahead log continues from here
+
+        for name in sorted(os.listdir(path)):
+            match = _SEGMENT_NAME.match(name)
+            if match:
+                self.segments.append(Segment(os.path.join(path, name), segment_capacity))
+                self._next_segment = int(match.group(1)) + 1
+        self._index()
+
+    @property
+    def meta_path(self) -> str:
+        return os.path.join(self.path, "field.json")
+
+    def _index(self) -> None:
+        """Learn where every living record is."""
+        for segment in self.segments:
+            if np is not None:
+                records = segment.array()
+                alive = np.flatnonzero(records["state"] == ALIVE).tolist()
+                self._slots.update(zip(records["uid"][alive].tolist(), ((segment, slot) for slot in alive)))
+                segment.alive = len(alive)
+                del records  # Let go of the mapped buffer
+                continue
+            for slot, record in enumerate(segment.records()):
+                if record[8] == ALIVE:
+                    self._slots[record[0]] = (segment, slot)
+                    segment.alive += 1
+        for segment in list(self.segments):
+            self._release_if_empty(segment)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _active_segment(self) -> Segment:
+        if not self.segments or self.segments[-1].full:
+            name = f"segment-{self._next_segment:06d}.spb"
+            self._next_segment += 1
+            self.segments.append(Segment(os.path.join(self.path, name), self.segment_capacity, create=True))
+        return self.segments[-1]
+
+    def _release_if_empty(self, segment: Segment) -> None:
+        """A full segment with nothing alive in it is no longer needed."""
+        if segment.full and segment.alive == 0:
+            segment.close()
+            os.remove(segment.path)
+            self.segments.remove(segment)
+
+    # Writing - the FieldObserver side
+
+    def append(self, pulse: PulseObject) -> None:
+        """Write a newly born pulse."""
+        segment = self._active_segment()
+        slot = segment.append((pulse._uid, pulse.birth, pulse.last_pulse, pulse.amplitude,
+                               pulse.decay_rate, pulse.pulse_count,
+                               self.symbols.intern(pulse.symbol), self.emotions.intern(pulse.emotion), ALIVE))
+        self._slots[pulse._uid] = (segment, slot)
+
+    def emitted(self, pulse: PulseObject) -> None:
+        self.append(pulse)
+
+    def amplitudes_changed(self, uids: List[int], amplitudes: List[float]) -> None:
+        slots = self._slots
+        for uid, amplitude in zip(uids, amplitudes):
+            place = slots.get(uid)
+            if place is not None:
+                segment, slot = place
+                FLOAT.pack_into(segment.map, segment.offset(slot) + OFFSETS["amplitude"], amplitude)
+                segment.dirty = True
+
+    def released(self, pulses: List[PulseObject], now: float) -> None:
+        emptied = set()
+        for pulse in pulses:
+            place = self._slots.pop(pulse._uid, None)
+            if place is None:
+                continue
+            segment, slot = place
+            STATE.pack_into(segment.map, segment.offset(slot) + OFFSETS["state"], COMPOSTED)
+            segment.alive -= 1
+            segment.dirty = True
+            if segment.alive == 0:
+                emptied.add(segment)
+        for segment in emptied:
+            self._release_if_empty(segment)
+
+    def record_activity(self, pulses) -> None:
+        """Write back when the given pulses last pulsed and how often."""
+        slots = self._slots
+        for pulse in pulses:
+            place = slots.get(pulse._uid)
+            if place is not None:
+                segment, slot = place
+                offset = segment.offset(slot)
+                FLOAT.pack_into(segment.map, offset + OFFSETS["last_pulse"], pulse.last_pulse)
+                COUNT.pack_into(segment.map, offset + OFFSETS["pulse_count"], pulse.pulse_count)
+                segment.dirty = True
+
+    # Reading
+
+    def live_records(self) -> Tuple[Dict[str, Any], List[str], List[str]]:
+        """
+        Every living pulse, in uid order: a column per name in
+        PULSE_COLUMNS (numpy arrays when numpy is present, lists
+        otherwise), with the symbol and emotion tables they index into.
+        """
+        if np is not None:
+            parts = [segment.array() for segment in self.segments]
+            records = np.concatenate(parts) if parts else np.zeros(0, dtype=RECORD_DTYPE)
+            del parts  # Let go of the mapped buffers
+            records = records[records["state"] == ALIVE]
+            records = records[np.argsort(records["uid"], kind="stable")]
+            columns = {name: records[name].copy() for name in PULSE_COLUMNS}
+        else:
+            rows = sorted(record for segment in self.segments for record in segment.records()
+                          if record[8] == ALIVE)
+            columns = {name: [row[i] for row in rows] for i, name in enumerate(PULSE_COLUMNS)}
+        return columns, list(self.symbols.names), list(self.emotions.names)
+
+    def read_meta(self) -> Optional[Dict[str, Any]]:
+        """The field's qualities as last synced, or None for a new store."""
+        if not os.path.exists(self.meta_path):
+            return None
+        with open(self.meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def write_meta(self, meta: Dict[str, Any]) -> None:
+        """Replace the field's qualities at once - a crash leaves the old ones whole."""
+        temporary = self.meta_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.meta_path)
+        _fsync_directory(self.path)  # The rename itself - and any new segment - must outlive a crash
+
+    def flush(self) -> None:
+        """Put everything written so far on disk."""
+        self.symbols.flush(durable=True)
+        self.emotions.flush(durable=True)
+        for segment in self.segments:
+            segment.flush()
+
+    def close(self) -> None:
+        self.flush()
+        for segment in self.segments:
+            segment.close()
+        self.symbols.close()
+        self.emotions.close()
+
+    def __repr__(self):
+        return f"SegmentStore({self.path!r}, pulses={len(self)}, segments={len(self.segments)})"
@@ -0,0 +1,114 @@
+"""
+🎞️ SIMULATION – Months of breathing in a few moments
+
+A Simulation drives a ContemplativeSystem that lives on a VirtualClock.
+Rather than letting time flow, it jumps straight to the next thing
+that matters - a scheduled event (an emit, a check of the field) or
+the moment some field is due to compost - and lets it happen there.
+Nothing is waited for, so a seasonal week or a lunar month of field
+behaviour replays as fast as the CPU allows, and identically each time.
+
+    clock = VirtualClock()
+    system = ContemplativeSystem("rehearsal", clock=clock)
+    journal = system.create_field("journal")
+    journal.composting_mode = "lunar"
+
+    simulation = Simulation(system)
+    simulation.every(3600, lambda: journal.emit("🌙", "reflective"))
+    simulation.run_for(28 * 24 * 3600)  # One lunar cycle
+"""
+
+import heapq
+import itertools
+import math
+from typing import Any, Callable, List, Optional, Tuple
+
+from .clock import VirtualClock
+
+# Virtual time skipped when a field is due again at the very moment it was composted
+_NUDGE = 1e-6
+
+
+class Simulation:
+    """
+    Advances a system's virtual clock from one event to the next.
+
+    Events are plain callables, run in order of their moment (and in the
+    order they were scheduled when moments are equal). Composting
+    happens whenever a field's next_compost deadline is reached, just as
+    the background breath would do it in real time.
+    """
+
+    def __init__(self, system):
+        if not isinstance(system.clock, VirtualClock):
+            raise TypeError("A simulation needs a system living on a VirtualClock - "
+                            "create it with ContemplativeSystem(name, clock=VirtualClock()).")
+        self.system = system
+        self.clock: VirtualClock = system.clock
+        self._events: List[Tuple[float, int, Callable[[], Any], Optional[float], float]] = []
+        self._sequence = itertools.count()
+        self.events_run = 0
+
+    @property
+    def now(self) -> float:
+        return self.clock.time()
+
+    def __len__(self) -> int:
+        """Number of events still waiting to happen."""
+        return len(self._events)
+
+    def at(self, moment: float, action: Callable[[], Any]) -> None:
+        """Run `action` at an absolute virtual moment."""
+        heapq.heappush(self._events, (moment, next(self._sequence), action, None, math.inf))
+
+    def after(self, delay: float, action: Callable[[], Any]) -> None:
+        """Run `action` once, `delay` seconds from now."""
+        self.at(self.now + delay, action)
+
+    def every(self, interval: float, action: Callable[[], Any],
+              start: Optional[float] = None, until: Optional[float] = None) -> None:
+        """
+        Run `action` every `interval` seconds, from `start` (default: one
+        interval from now) until `until` (default: for as long as the
+        simulation runs).
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        first = self.now + interval if start is None else start
+        heapq.heappush(self._events, (first, next(self._sequence), action, interval,
+                                      math.inf if until is None else until))
+
+    def _run_due_events(self, now: float) -> None:
+        events = self._events
+        while events and events[0][0] <= now:
+            moment, _, action, interval, until = heapq.heappop(events)
+            action()
+            self.events_run += 1
+            if interval is not None and moment + interval <= until:
+                heapq.heappush(events, (moment + interval, next(self._sequence), action, interval, until))
+
+    def run_until(self, moment: float) -> int:
+        """
+        Let the system live until the virtual `moment`. Returns how many
+        events were run on the way.
+        """
+        system = self.system
+        ran = self.events_run
+        while True:
+            now = self.clock.time()
+            self._run_due_events(now)
+            wake_at = system._gentle_maintenance()
+            if wake_at <= now:
+                wake_at = now + _NUDGE
+            next_moment = min(wake_at, self._events[0][0] if self._events else math.inf)
+            if next_moment > moment:
+                break
+            self.clock.advance_to(next_moment)
+
+        self.clock.advance_to(moment)
+        system._count_breaths()
+        return self.events_run - ran
+
+    def run_for(self, seconds: float) -> int:
+        """Let the system live for `seconds` of virtual time."""
+        return self.run_until(self.now + seconds)
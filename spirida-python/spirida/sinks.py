@@ -0,0 +1,204 @@
+"""
+🔈 SINKS – Where Spirida's voice goes
+
+Pulses announce themselves, resonances are voiced as poetry, the breath
+says when it inhales and what it composted. All of it is spoken into an
+output sink rather than printed, so each system - and each field - can
+choose how loudly it lives:
+
+- StreamSink: straight to stdout (or another stream), as print would
+- NullSink: silence, for fields under load
+- BufferedSink: gathers lines and writes them to the stream in chunks
+- AsyncSink: hands lines to a writer thread through a bounded queue,
+  so the speaker never waits on the stream
+- CallbackSink: calls a function with every line
+
+    system = ContemplativeSystem("garden", output=AsyncSink())
+    hot = system.create_field("telemetry", output=NullSink())
+
+Anything that is given no sink speaks into the default sink, a
+StreamSink on stdout unless set_default_sink() chose another.
+"""
+
+import queue
+import sys
+import threading
+from typing import Callable, List, Optional, TextIO, Union
+
+_CLOSE = object()  # Tells an AsyncSink's writer to finish
+
+
+class OutputSink:
+    """
+    Somewhere for messages to go. Subclasses override write(), and
+    flush() and close() if they hold anything back.
+    """
+
+    def write(self, message: str) -> None:
+        """Speak one message (a line, without its newline)."""
+
+    def flush(self) -> None:
+        """Let go of anything held back."""
+
+    def close(self) -> None:
+        """Flush, and stop for good."""
+        self.flush()
+
+
+class NullSink(OutputSink):
+    """Discards every message."""
+
+    def __repr__(self):
+        return "NullSink()"
+
+
+class StreamSink(OutputSink):
+    """
+    Writes each message as a line to a text stream - sys.stdout as it
+    is at the moment of writing, unless another stream is given.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+        self._lock = threading.Lock()  # Lines from different threads never interleave
+
+    def write(self, message: str) -> None:
+        stream = self.stream or sys.stdout
+        with self._lock:
+            stream.write(message + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            (self.stream or sys.stdout).flush()
+
+    def __repr__(self):
+        return f"StreamSink({self.stream!r})"
+
+
+class BufferedSink(StreamSink):
+    """
+    Gathers messages and writes them to the stream `capacity` lines at
+    a time, in one write. flush() writes whatever has gathered.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, capacity: int = 256):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        super().__init__(stream)
+        self.capacity = capacity
+        self._lines: List[str] = []
+
+    def write(self, message: str) -> None:
+        with self._lock:
+            self._lines.append(message)
+            if len(self._lines) >= self.capacity:
+                self._write_lines()
+
+    def _write_lines(self) -> None:
+        lines, self._lines = self._lines, []
+        if lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(lines) + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_lines()
+            (self.stream or sys.stdout).flush()
+
+    def __repr__(self):
+        return f"BufferedSink({self.stream!r}, capacity={self.capacity})"
+
+
+class CallbackSink(OutputSink):
+    """
+    Calls `callback` with every message. A callback that fails is
+    ignored - speaking must never break the one who speaks.
+    """
+
+    def __init__(self, callback: Callable[[str], None]):
+        self.callback = callback
+
+    def write(self, message: str) -> None:
+        try:
+            self.callback(message)
+        except Exception:
+            pass
+
+    def __repr__(self):
+        return f"CallbackSink({self.callback!r})"
+
+
+class AsyncSink(OutputSink):
+    """
+    Passes messages to another sink (a StreamSink on stdout by default)
+    on a writer thread of its own. write() only queues the message; if
+    `maxsize` messages are already waiting it is dropped and counted in
+    `dropped`, rather than making the speaker wait.
+    """
+
+    def __init__(self, sink: Optional[OutputSink] = None, maxsize: int = 10000):
+        self.sink = StreamSink() if sink is None else sink
+        self.dropped = 0
+        self._queue: 'queue.Queue' = queue.Queue(maxsize)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True, name="spirida-output")
+        self._writer.start()
+
+    def write(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self) -> None:
+        while True:
+            message = self._queue.get()
+            try:
+                if message is _CLOSE:
+                    return
+                self.sink.write(message)
+                if self._queue.empty():
+                    self.sink.flush()  # Caught up - let the lines out
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until every message queued so far has been written."""
+        if self._writer.is_alive():
+            self._queue.join()
+        self.sink.flush()
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join()
+        self.sink.close()
+
+    def __repr__(self):
+        return f"AsyncSink({self.sink!r}, dropped={self.dropped})"
+
+
+def as_sink(output: Union[OutputSink, Callable[[str], None], None]) -> Optional[OutputSink]:
+    """Accept a sink as it is, wrap a plain function in a CallbackSink, and leave None as None."""
+    if output is None or isinstance(output, OutputSink):
+        return output
+    if callable(output):
+        return CallbackSink(output)
+    raise TypeError(f"Cannot speak into {output!r} - give an OutputSink or a function")
+
+
+_default_sink: OutputSink = StreamSink()
+
+
+def default_sink() -> OutputSink:
+    """The sink used by anything that was given none."""
+    return _default_sink
+
+
+def set_default_sink(sink: Union[OutputSink, Callable[[str], None], None]) -> OutputSink:
+    """
+    Make `sink` the default sink for the whole process (None: back to
+    stdout), returning the one it replaces.
+    """
+    global _default_sink
+    previous, _default_sink = _default_sink, as_sink(sink) or StreamSink()
+    return previous
@@ -0,0 +1,265 @@
+"""
+📸 SNAPSHOT – A whole system, held still for a moment
+
+system.snapshot(path) writes a ContemplativeSystem - its breath, its
+fields with their births and counters, and every pulse they hold - to
+one compact binary file, and ContemplativeSystem.restore(path) brings
+it back to life. Pulses keep their births, so they go on fading as if
+the system had never paused.
+
+The layout is built for waking quickly. Each field's pulses are stored
+as one packed array per quality (see PULSE_COLUMNS), read straight
+into the field's store without visiting pulses one by one; symbols,
+emotions and poetic traces are written once each in string tables and
+referred to by index. Resonance histories are stored after the pulses
+and may be left out on either side with history=False.
+
+    system.snapshot("morning.spsnap")
+    system = ContemplativeSystem.restore("morning.spsnap", history=False)
+"""
+
+import array
+import math
+import os
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional – only columnar fields need it
+    np = None
+
+from .contemplative_core import PULSE_COLUMNS
+from .resonance import ResonanceSummary, new_resonance_history
+
+MAGIC = b"SPBSNAP1"
+HEADER = struct.Struct("<8sI")  # magic, field count
+SYSTEM = struct.Struct("<ddddq")  # birth, inhale, hold, exhale, cycle count
+FIELD = struct.Struct("<dqqdddqqq")  # birth, emissions, composted, cycle hours, maintenance, last compost,
+#                                       next uid, history size, pulse count
+HISTORY = struct.Struct("<qq")  # events, summaries
+LENGTH = struct.Struct("<I")
+
+# How each quality of a pulse is packed
+COLUMN_TYPES = {"uid": "q", "birth": "d", "last_pulse": "d", "amplitude": "d", "decay_rate": "d",
+                "pulse_count": "q", "symbol_id": "q", "emotion_id": "q"}
+EVENT_COLUMNS = (("row", "q"), ("timestamp", "d"), ("symbol", "q"), ("emotion", "q"),
+                 ("strength", "d"), ("trace", "q"))
+SUMMARY_COLUMNS = (("row", "q"), ("count", "q"), ("total", "d"), ("max", "d"),
+                   ("symbol", "q"), ("emotion", "q"), ("timestamp", "d"))
+
+
+class _Writer:
+    def __init__(self, f):
+        self.f = f
+
+    def pack(self, layout: struct.Struct, *values) -> None:
+        self.f.write(layout.pack(*values))
+
+    def strings(self, strings: List[str]) -> None:
+        encoded = [s.encode("utf-8") for s in strings]
+        self.f.write(LENGTH.pack(len(encoded)))
+        self.f.write(array.array("I", [len(e) for e in encoded]).tobytes() if encoded else b"")
+        self.f.write(b"".join(encoded))
+
+    def column(self, typecode: str, values) -> None:
+        if np is not None and isinstance(values, np.ndarray):
+            data = values.astype("<" + typecode, copy=False).tobytes()
+        else:
+            packed = array.array(typecode, values)
+            if sys.byteorder != "little":
+                packed.byteswap()
+            data = packed.tobytes()
+        self.f.write(data)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def unpack(self, layout: struct.Struct) -> Tuple:
+        values = layout.unpack_from(self.data, self.position)
+        self.position += layout.size
+        return values
+
+    def strings(self) -> List[str]:
+        count, = self.unpack(LENGTH)
+        lengths = self.column("I", count, as_array=False)
+        strings = []
+        position = self.position
+        for length in lengths:
+            strings.append(bytes(self.data[position:position + length]).decode("utf-8"))
+            position += length
+        self.position = position
+        return strings
+
+    def skip_strings(self) -> None:
+        count, = self.unpack(LENGTH)
+        self.position += sum(self.column("I", count, as_array=False))
+
+    def skip_columns(self, typecodes, count: int) -> None:
+        self.position += sum(array.array(typecode).itemsize for typecode in typecodes) * count
+
+    def column(self, typecode: str, count: int, as_array: bool):
+        """Read `count` packed values - as a numpy array if asked and possible, otherwise a list."""
+        size = array.array(typecode).itemsize * count
+        chunk = self.data[self.position:self.position + size]
+        self.position += size
+        if as_array and np is not None:
+            return np.frombuffer(chunk, dtype="<" + typecode).copy()
+        values = array.array(typecode)
+        values.frombytes(chunk)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tolist()
+
+
+def _none_as_nan(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _nan_as_none(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _write_histories(out: _Writer, histories: List) -> None:
+    """Pack the histories of one field's pulses, event by event or summary by summary."""
+    strings: Dict[Optional[str], int] = {}
+
+    def intern(s: Optional[str]) -> int:
+        return -1 if s is None else strings.setdefault(s, len(strings))
+
+    events: List[List] = [[] for _ in EVENT_COLUMNS]
+    summaries: List[List] = [[] for _ in SUMMARY_COLUMNS]
+    for row, history in enumerate(histories):
+        if not history:
+            continue
+        if isinstance(history, ResonanceSummary):
+            for column, value in zip(summaries, (row, history.count, history.total_strength,
+                                                 history.max_strength, intern(history.last_symbol),
+                                                 intern(history.last_emotion),
+                                                 _none_as_nan(history.last_timestamp))):
+                column.append(value)
+            continue
+        for event in history:
+            for column, value in zip(events, (row, event["timestamp"], intern(event["other_symbol"]),
+                                              intern(event["other_emotion"]), event["resonance_strength"],
+                                              intern(event["poetic_trace"]))):
+                column.append(value)
+
+    out.strings(list(strings))
+    out.pack(HISTORY, len(events[0]), len(summaries[0]))
+    for (_, typecode), values in zip(EVENT_COLUMNS, events):
+        out.column(typecode, values)
+    for (_, typecode), values in zip(SUMMARY_COLUMNS, summaries):
+        out.column(typecode, values)
+
+
+def _read_histories(reader: _Reader, count: int, policy: str, history_size: int,
+                    keep: bool) -> Optional[List]:
+    """Unpack one field's histories - or only step over them, if they are not wanted."""
+    if not keep:
+        reader.skip_strings()
+        event_count, summary_count = reader.unpack(HISTORY)
+        reader.skip_columns([typecode for _, typecode in EVENT_COLUMNS], event_count)
+        reader.skip_columns([typecode for _, typecode in SUMMARY_COLUMNS], summary_count)
+        return None
+
+    strings = reader.strings()
+    event_count, summary_count = reader.unpack(HISTORY)
+    events = [reader.column(typecode, event_count, as_array=False) for _, typecode in EVENT_COLUMNS]
+    summaries = [reader.column(typecode, summary_count, as_array=False) for _, typecode in SUMMARY_COLUMNS]
+    if not (event_count or summary_count):
+        return None
+
+    def name(index: int) -> Optional[str]:
+        return None if index < 0 else strings[index]
+
+    histories: List[Any] = [None] * count
+    for row, timestamp, symbol, emotion, strength, trace in zip(*events):
+        history = histories[row]
+        if history is None:
+            history = histories[row] = new_resonance_history(policy, history_size)
+        history.record(timestamp, name(symbol), name(emotion), strength, name(trace))
+    for row, total_count, total, maximum, symbol, emotion, timestamp in zip(*summaries):
+        summary = histories[row] = ResonanceSummary()
+        summary.count = total_count
+        summary.total_strength = total
+        summary.max_strength = maximum
+        summary.last_symbol = name(symbol)
+        summary.last_emotion = name(emotion)
+        summary.last_timestamp = _nan_as_none(timestamp)
+    return histories
+
+
+def write_snapshot(system, path: str, history: bool = True) -> None:
+    """
+    Write `system` to `path`. The file is replaced at once, so a crash
+    while writing leaves the previous snapshot whole.
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        out = _Writer(f)
+        fields = list(system.fields)
+        out.pack(HEADER, MAGIC, len(fields))
+        breath = system.breath
+        system._count_breaths()
+        out.strings([system.name])
+        out.pack(SYSTEM, system.birth, breath.inhale, breath.hold, breath.exhale, breath.cycle_count)
+
+        for field in fields:
+            with field._lock:
+                columns, symbols, emotions = field._store.export()
+                histories = field._store.histories() if history else []
+                counters = (field.birth, field.total_emissions, field.total_composted,
+                            field.seasonal_cycle_hours, _none_as_nan(field.maintenance_interval),
+                            field.last_compost, field._store._next_uid, field._store.history_size)
+            out.strings([field.name, field.composting_mode, field.storage, field.history])
+            out.pack(FIELD, *counters, len(columns["uid"]))
+            out.strings(symbols)
+            out.strings(emotions)
+            for name in PULSE_COLUMNS:
+                out.column(COLUMN_TYPES[name], columns[name])
+            _write_histories(out, histories)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def read_snapshot(path: str, system_class, clock=None, history: bool = True, output=None):
+    """Bring a system written by write_snapshot back to life, as an instance of `system_class`."""
+    with open(path, "rb") as f:
+        reader = _Reader(f.read())
+    magic, field_count = reader.unpack(HEADER)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a Spirida snapshot")
+
+    name, = reader.strings()
+    system = system_class(name, clock=clock, output=output)
+    system.birth, inhale, hold, exhale, system.breath.cycle_count = reader.unpack(SYSTEM)
+    system.breath.inhale, system.breath.hold, system.breath.exhale = inhale, hold, exhale
+
+    for _ in range(field_count):
+        field_name, composting_mode, storage, history_policy = reader.strings()
+        (birth, emissions, composted, cycle_hours, maintenance, last_compost,
+         next_uid, history_size, count) = reader.unpack(FIELD)
+        symbols = reader.strings()
+        emotions = reader.strings()
+        columnar = storage == "columnar"
+        columns = {name: reader.column(COLUMN_TYPES[name], count, as_array=columnar) for name in PULSE_COLUMNS}
+        histories = _read_histories(reader, count, history_policy, history_size, history)
+
+        field = system.create_field(field_name, storage=storage, history=history_policy,
+                                    history_size=history_size,
+                                    maintenance_interval=_nan_as_none(maintenance))
+        field.composting_mode = composting_mode
+        field.birth = birth
+        field.total_emissions = emissions
+        field.total_composted = composted
+        field.seasonal_cycle_hours = cycle_hours
+        field.last_compost = last_compost
+        field._store.restore(columns, symbols, emotions, histories)
+        field._store._next_uid = max(field._store._next_uid, next_uid)
+    return system
@@ -2,7 +2,7 @@
 Spiralbase – memory and timekeeping for Spirida.
 Implements gentle memory traces and decay cycles.
 
-Note: this is still a prototype and not a fully implemented module. 
+Note: this is still a prototype and not a fully implemented module.
 
 It is a concept.
 A seed.
@@ -10,31 +10,119 @@ A seed.
 Let it grow by care and attuned attention.
 """
 
-spiral_memory = []
+import threading
+from collections import deque
+from typing import Callable, Iterator, List, Optional
 
-def spiral_memory_trace(symbol):
+from .sinks import default_sink
+
+
+class SpiralMemory:
+    """
+    A spiral memory trace: the most recent `capacity` symbols, oldest
+    first. When it is full, remembering something new lets the oldest
+    go; decaying forgets the oldest on purpose. Both take the same
+    time however large the memory is, and a memory may be shared
+    between threads.
+
+    Each spiral_interaction session keeps one of its own.
+
+    It still reads like the plain list spiral memory once was: it can
+    be indexed and sliced, appended to, popped and asked what it holds.
+    """
+
+    def __init__(self, capacity: int = 10):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._symbols: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def trace(self, symbol: str) -> None:
+        """Remember a symbol, letting the oldest go if the memory is full."""
+        with self._lock:
+            self._symbols.append(symbol)
+
+    def decay(self) -> Optional[str]:
+        """Forget the oldest symbol and return it (None if nothing is remembered)."""
+        with self._lock:
+            return self._symbols.popleft() if self._symbols else None
+
+    def symbols(self) -> List[str]:
+        """What is remembered now, oldest first."""
+        with self._lock:
+            return list(self._symbols)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._symbols.clear()
+
+    def describe(self) -> str:
+        """The memory as a gentle trace."""
+        symbols = self.symbols()
+        if symbols:
+            return "🧠 Spiral trace: " + " ".join(symbols)
+        return "🧠 Spiral trace is empty."
+
+    def append(self, symbol: str) -> None:
+        """The same as trace, for code written when spiral memory was a plain list."""
+        self.trace(symbol)
+
+    def pop(self, index: int = -1) -> str:
+        """Forget the symbol at `index` (the newest by default) and return it."""
+        with self._lock:
+            if not self._symbols:
+                raise IndexError("pop from an empty spiral memory")
+            if index in (0, -len(self._symbols)):
+                return self._symbols.popleft()
+            if index in (-1, len(self._symbols) - 1):
+                return self._symbols.pop()
+            symbol = self._symbols[index]
+            del self._symbols[index]
+            return symbol
+
+    def __getitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._symbols)[index]
+            return self._symbols[index]
+
+    def __contains__(self, symbol: object) -> bool:
+        with self._lock:
+            return symbol in self._symbols
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols())
+
+    def __repr__(self):
+        return f"SpiralMemory({self.symbols()!r}, capacity={self.capacity})"
+
+
+# The memory shared by callers that do not keep one of their own
+spiral_memory = SpiralMemory()
+
+def spiral_memory_trace(symbol, memory: Optional[SpiralMemory] = None):
     """
-    Store a symbol in spiral memory (max 10 items).
+    Store a symbol in spiral memory (max 10 items by default) – the
+    shared one, unless another SpiralMemory is given.
     """
-    global spiral_memory
-    spiral_memory.append(symbol)
-    if len(spiral_memory) > 10:
-        spiral_memory.pop(0)
+    (spiral_memory if memory is None else memory).trace(symbol)
 
-def decay_cycle_step():
+def decay_cycle_step(output: Optional[Callable[[str], None]] = None, memory: Optional[SpiralMemory] = None):
     """
     Removes the oldest memory entry to simulate forgetting.
+    The forgetting is told to output (a function), or the default sink.
     """
-    global spiral_memory
-    if spiral_memory:
-        forgotten = spiral_memory.pop(0)
-        print(f"🍂 Forgotten: {forgotten}")
+    forgotten = (spiral_memory if memory is None else memory).decay()
+    if forgotten is not None:
+        (output or default_sink().write)(f"🍂 Forgotten: {forgotten}")
 
-def print_memory_trace():
+def print_memory_trace(output: Optional[Callable[[str], None]] = None, memory: Optional[SpiralMemory] = None):
     """
-    Print current spiral memory as a gentle trace.
+    Print current spiral memory as a gentle trace - to output (a
+    function), or the default sink.
     """
-    if spiral_memory:
-        print("🧠 Spiral trace: " + " ".join(spiral_memory))
-    else:
-        print("🧠 Spiral trace is empty.")
+    (output or default_sink().write)((spiral_memory if memory is None else memory).describe())
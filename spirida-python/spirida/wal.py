@@ -0,0 +1,288 @@
+"""
+📜 WAL – A field's promise to remember
+
+Between one sync of a field and the next, everything it lives through
+exists only in memory. A WriteAheadLog follows the field and writes
+each happening down as it occurs - a pulse born, amplitudes renewed by
+resonance, pulses composted - so that after a crash the field can be
+brought back to its last moment by replaying the log onto its last
+synced state.
+
+Writing is cheap: records gather in a buffer, and a background writer
+puts everything gathered on disk with one fsync every `fsync_interval`
+seconds (group commit). A crash loses at most that interval. With
+fsync_interval=0 every record is on disk before emit returns - safe,
+but it limits a field to as many emits per second as the disk has
+fsyncs.
+
+    field = SpiralField.open("journal.spiralbase", wal=True)
+    field.emit("🌱", "hopeful")  # In the log within 50 ms
+
+Each record is framed by its length and a CRC32, so a record torn by
+the crash is recognised and the replay ends cleanly before it. A log
+begins with its generation, which the field's stored state names too:
+a log left over from before the last sync is known and ignored.
+"""
+
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional, Set
+
+from .contemplative_core import FieldObserver, PulseObject, PULSE_COLUMNS
+
+FRAME = struct.Struct("<II")  # payload length, crc32 of payload
+GENERATION = struct.Struct("<cq")  # b"G", generation - the first record of every log
+EMITTED = struct.Struct("<cqdddHH")  # b"E", uid, birth, amplitude, decay_rate, symbol and emotion lengths
+AMPLITUDES = struct.Struct("<cI")  # b"A", count - followed by (uid, amplitude) pairs
+AMPLITUDE = struct.Struct("<qd")
+RELEASED = struct.Struct("<cdI")  # b"C", moment of compost, count - followed by uids
+UID = struct.Struct("<q")
+
+
+class WriteAheadLog(FieldObserver):
+    """
+    An append-only log of everything that happens in one field.
+
+    Attach it with field.add_observer(log) - or let SpiralField.open(...,
+    wal=True) do so - and call replay(field) to recover. checkpoint()
+    empties the log once the field's state is safely stored elsewhere.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 0.05, generation: int = 0):
+        if fsync_interval < 0:
+            raise ValueError("fsync_interval cannot be negative")
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._begin(generation)
+        self.generation = self.generation_of(path)
+        self._buffer: List[bytes] = []
+        self._lock = threading.Lock()  # Guards the buffer - held only for a moment
+        self._file_lock = threading.Lock()  # Guards the file, taken before _lock
+        self._gathered = threading.Condition(self._lock)
+        self._closed = False
+        self.records_written = 0
+        self.commits = 0
+        self._writer: Optional[threading.Thread] = None
+        if fsync_interval > 0:
+            self._writer = threading.Thread(target=self._write_loop, daemon=True,
+                                            name=f"wal-{os.path.basename(path)}")
+            self._writer.start()
+
+    # Writing
+
+    def _append(self, payload: bytes) -> None:
+        frame = FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"{self.path} is closed")
+            self._buffer.append(frame)
+            self.records_written += 1
+            if self._writer is not None:
+                if len(self._buffer) == 1:
+                    self._gathered.notify()
+                return
+        self.commit()
+
+    def emitted(self, pulse: PulseObject) -> None:
+        symbol = pulse.symbol.encode("utf-8")
+        emotion = pulse.emotion.encode("utf-8")
+        self._append(EMITTED.pack(b"E", pulse._uid, pulse.birth, pulse.amplitude, pulse.decay_rate,
+                                  len(symbol), len(emotion)) + symbol + emotion)
+
+    def amplitudes_changed(self, uids: List[int], amplitudes: List[float]) -> None:
+        self._append(AMPLITUDES.pack(b"A", len(uids)) +
+                     b"".join(AMPLITUDE.pack(uid, amplitude) for uid, amplitude in zip(uids, amplitudes)))
+
+    def released(self, pulses: List[PulseObject], now: float) -> None:
+        self._append(RELEASED.pack(b"C", now, len(pulses)) +
+                     b"".join(UID.pack(pulse._uid) for pulse in pulses))
+
+    def commit(self) -> None:
+        """Put everything logged so far on disk now, without waiting for the writer."""
+        with self._file_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if batch:
+                # Emits carry on gathering into the new buffer meanwhile
+                self._file.write(b"".join(batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self.commits += 1
+
+    def _write_loop(self) -> None:
+        """Gather records for an interval, then commit them together."""
+        while True:
+            with self._lock:
+                while not self._buffer and not self._closed:
+                    self._gathered.wait()
+                if self._closed:
+                    return
+                self._gathered.wait(self.fsync_interval)  # Let others join this commit
+            self.commit()
+
+    def _begin(self, generation: int) -> None:
+        payload = GENERATION.pack(b"G", generation)
+        self._file.write(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.generation = generation
+
+    def checkpoint(self, generation: Optional[int] = None) -> None:
+        """
+        Empty the log and begin a new generation of it. Call only once
+        everything logged is safely stored elsewhere, naming the new
+        generation - SpiralField.sync() does so after writing its segments.
+        """
+        with self._file_lock:
+            with self._lock:
+                self._buffer.clear()
+            self._file.truncate(0)
+            self._begin(self.generation + 1 if generation is None else generation)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._gathered.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+        self.commit()
+        self._file.close()
+
+    # Recovering
+
+    @staticmethod
+    def records(path: str):
+        """
+        Read back every whole record in the log at `path`, in order, as
+        ("emitted", uid, birth, amplitude, decay_rate, symbol, emotion),
+        ("amplitudes", [(uid, amplitude), ...]) or ("released", now, [uid, ...]).
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        position = 0
+        while position + FRAME.size <= len(data):
+            length, crc = FRAME.unpack_from(data, position)
+            payload = data[position + FRAME.size:position + FRAME.size + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return  # Torn by a crash - nothing after it was promised
+            position += FRAME.size + length
+
+            kind = payload[:1]
+            if kind == b"G":
+                yield ("generation", GENERATION.unpack(payload)[1])
+            elif kind == b"E":
+                _, uid, birth, amplitude, decay_rate, symbol_length, emotion_length = EMITTED.unpack_from(payload)
+                strings = payload[EMITTED.size:]
+                yield ("emitted", uid, birth, amplitude, decay_rate,
+                       strings[:symbol_length].decode("utf-8"),
+                       strings[symbol_length:symbol_length + emotion_length].decode("utf-8"))
+            elif kind == b"A":
+                yield ("amplitudes", list(AMPLITUDE.iter_unpack(payload[AMPLITUDES.size:])))
+            elif kind == b"C":
+                _, now, count = RELEASED.unpack_from(payload)
+                yield ("released", now, [uid for uid, in UID.iter_unpack(payload[RELEASED.size:])])
+
+    @staticmethod
+    def generation_of(path: str) -> Optional[int]:
+        """The generation of the log at `path`, or None if it has none."""
+        for record in WriteAheadLog.records(path):
+            return record[1] if record[0] == "generation" else None
+        return None
+
+    def replay(self, field, next_uid: Optional[int] = None) -> int:
+        """Bring `field` up to the end of this log. See replay()."""
+        return replay(self.path, field, self.generation, next_uid)
+
+    def __repr__(self):
+        return f"WriteAheadLog({self.path!r}, fsync_interval={self.fsync_interval})"
+
+
+def replay(path: str, field, generation: Optional[int] = None, next_uid: Optional[int] = None) -> int:
+    """
+    Replay the log at `path` onto `field` and return how many records
+    were applied.
+
+    The field is expected to hold its last synced state - or nothing,
+    for a log kept from the start. A field written through to segments
+    may already hold some of what the log tells, so replaying is
+    idempotent: births already held are not born again, amplitudes are
+    set rather than added, and composting a pulse that is already gone
+    only counts it. Counters are brought forward from their synced
+    values: pulses with uids below `next_uid` (the field's next uid at
+    that sync; by default its next uid now) were already counted.
+
+    A log of another `generation` than the field's stored state names
+    belongs to an earlier sync, and is not replayed at all.
+    """
+    store = field._store
+    with field._lock:
+        counted = store._next_uid if next_uid is None else next_uid
+        born: Dict[int, list] = {}  # Births since the sync, by uid, as they ended
+        changed: Dict[int, float] = {}  # New amplitudes of pulses held at the sync
+        released: Set[int] = set()
+        emissions = composted = applied = 0
+        last_uid = counted - 1
+
+        for record in WriteAheadLog.records(path):
+            if record[0] == "generation":
+                if generation is not None and record[1] != generation:
+                    return 0
+                continue
+            applied += 1
+            if record[0] == "emitted":
+                _, uid, birth, amplitude, decay_rate, symbol, emotion = record
+                if uid >= counted:
+                    born[uid] = [uid, birth, birth, amplitude, decay_rate, 0, symbol, emotion]
+                    emissions += 1
+                    last_uid = max(last_uid, uid)
+            elif record[0] == "amplitudes":
+                for uid, amplitude in record[1]:
+                    if uid in born:
+                        born[uid][3] = amplitude
+                    else:
+                        changed[uid] = amplitude
+            else:
+                for uid in record[2]:
+                    if born.pop(uid, None) is not None or uid < counted:
+                        composted += 1
+                    released.add(uid)
+                    changed.pop(uid, None)
+
+        # Pulses the field already holds
+        gone = []
+        for pulse in store.snapshot():
+            uid = pulse._uid
+            if uid in released:
+                gone.append(pulse)
+            elif uid in born:
+                pulse.amplitude = born.pop(uid)[3]
+            elif uid in changed:
+                pulse.amplitude = changed[uid]
+        store.discard(gone)
+
+        # Pulses born since the sync that it has yet to hold
+        symbols: Dict[str, int] = {}
+        emotions: Dict[str, int] = {}
+        rows = [row[:6] + [symbols.setdefault(row[6], len(symbols)), emotions.setdefault(row[7], len(emotions))]
+                for row in sorted(born.values())]
+        store.restore({name: [row[i] for row in rows] for i, name in enumerate(PULSE_COLUMNS)},
+                      list(symbols), list(emotions))
+        store._next_uid = max(store._next_uid, last_uid + 1)
+        if born and store.observers:
+            # Restoring tells no one - but these births are news to the field's observers
+            for pulse in store.snapshot():
+                if pulse._uid in born:
+                    for observer in store.observers:
+                        observer.emitted(pulse)
+
+        field.total_emissions += emissions
+        field.total_composted += composted
+    return applied
@@ -0,0 +1,103 @@
+"""
+🧮 COLUMNAR – The same field, kept in columns, lives the same life
+
+A columnar field is only another home for a field's pulses: for the
+same emits on the same clock it must hold the same pulses, sense the
+same resonances and compost the same ones as a list field.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import STRENGTHENING_THRESHOLD, SpiralField
+from spirida.sinks import NullSink
+
+OFFERINGS = [
+    ("🌿", "calm", 1.0, 0.01),
+    ("🌊", "peaceful", 0.8, 0.02),
+    ("🌙", "grief", 0.6, 0.005),
+    ("🌿", "calm", 0.9, 0.01),
+    ("✨", "joy", 0.03, 0.5),
+    ("🔥", "anger", 1.0, 0.0),
+    ("🌊", "calm", 0.7, 0.01),
+    ("🍂", "grief", 0.05, 0.2),
+    ("🌱", "hopeful", 1.0, 0.01),
+    ("🌙", "peaceful", 0.4, 0.05),
+]
+
+
+def _state(field):
+    return sorted((p._uid, p.symbol, p.emotion, p.birth, p.decay_rate) for p in field.pulses)
+
+
+def _amplitudes(field):
+    return [p.amplitude for p in sorted(field.pulses, key=lambda p: p._uid)]
+
+
+def _pairs(resonances):
+    return sorted((r["pulse_a"]._uid, r["pulse_b"]._uid, round(r["resonance"]["strength"], 9))
+                  for r in resonances)
+
+
+def _lived(storage, mode):
+    clock = VirtualClock(1_000_000.0)
+    field = SpiralField("twin", mode, storage=storage, clock=clock, output=NullSink())
+    for symbol, emotion, amplitude, decay_rate in OFFERINGS:
+        field.emit(symbol, emotion, amplitude, decay_rate)
+        clock.advance(3.0)
+    return field, clock
+
+
+@pytest.fixture
+def twins():
+    return _lived("list", "natural")[0], _lived("columnar", "natural")[0]
+
+
+def test_same_emits_hold_the_same_pulses(twins):
+    kept, columns = twins
+    assert _state(columns) == _state(kept)
+    assert _amplitudes(columns) == pytest.approx(_amplitudes(kept))
+    assert columns.resonance_field() == pytest.approx(kept.resonance_field())
+    assert columns.total_emissions == kept.total_emissions == len(OFFERINGS)
+
+
+def test_columnar_history_keeps_only_the_strong_meetings(twins):
+    """A list pulse remembers every pulse it met at birth; a columnar one only those it strengthened."""
+    kept, columns = twins
+
+    def met(pulse):
+        return [(event["other_symbol"], event["other_emotion"], round(event["resonance_strength"], 9))
+                for event in pulse.resonance_history]
+
+    for kept_pulse, column_pulse in zip(sorted(kept.pulses, key=lambda p: p._uid),
+                                        sorted(columns.pulses, key=lambda p: p._uid)):
+        every = met(kept_pulse)
+        assert len(every) == kept_pulse._uid
+        assert met(column_pulse) == [event for event in every if event[2] > STRENGTHENING_THRESHOLD]
+
+
+@pytest.mark.parametrize("min_strength", [0.2, 0.4, 0.6])
+def test_same_resonances_are_sensed(twins, min_strength):
+    kept, columns = twins
+    found = _pairs(kept.find_resonances(min_strength))
+    assert _pairs(columns.find_resonances(min_strength)) == found
+    assert columns.count_resonances(min_strength) == kept.count_resonances(min_strength) == len(found)
+    count, strongest = columns.sense_resonances(3, min_strength)
+    assert (count, _pairs(strongest)) == (len(found), _pairs(kept.sense_resonances(3, min_strength)[1]))
+
+
+@pytest.mark.parametrize("mode", ["natural", "seasonal", "lunar", "resonant"])
+def test_same_pulses_are_composted(mode):
+    kept, kept_clock = _lived("list", mode)
+    columns, columns_clock = _lived("columnar", mode)
+    for elapsed in (10.0, 60.0, 600.0, 6000.0):
+        kept_clock.advance(elapsed)
+        columns_clock.advance(elapsed)
+        assert columns.compost(0.1) == kept.compost(0.1)
+        assert _state(columns) == _state(kept)
+        # The fade index may answer early (a revived pulse's old entry), never late
+        due, exactly = kept.next_compost(0.1), columns.next_compost(0.1)
+        assert exactly is None or (due is not None and due <= exactly + 1e-6)
+    assert columns.total_composted == kept.total_composted > 0
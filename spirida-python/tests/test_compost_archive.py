@@ -0,0 +1,122 @@
+"""
+🍂 COMPOST ARCHIVE – What faded can still be found
+"""
+
+import gzip
+import math
+import os
+
+import pytest
+
+from spirida.clock import VirtualClock
+from spirida.compost_archive import CompostArchive, read_manifest, scan_archive
+from spirida.contemplative_core import SpiralField
+from spirida.sinks import NullSink
+
+STORAGES = ["list", "columnar"]
+
+
+def _composting(storage, archive, rounds=3, per_round=5):
+    """A field whose faint pulses fade into `archive`, one round every 100 seconds."""
+    clock = VirtualClock(1_000_000.0)
+    field = SpiralField("journal", storage=storage, clock=clock, output=NullSink())
+    field.add_observer(archive)
+    for round_ in range(rounds):
+        for i in range(per_round):
+            field.emit("🌙" if i % 2 else "🍂", "grief" if round_ % 2 else "calm",
+                       amplitude=0.02, decay_rate=1.0)
+        clock.advance(100.0)
+        assert field.compost() == per_round
+    return field, clock
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_round_trip_and_scans(tmp_path, storage):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    path = str(tmp_path / "archive")
+    archive = CompostArchive(path, segment_records=4)
+    field, clock = _composting(storage, archive)
+    archive.close()
+
+    records = list(scan_archive(path))
+    assert [record["uid"] for record in records] == list(range(15))
+    first = records[0]
+    assert (first["symbol"], first["emotion"], first["decay_rate"]) == ("🍂", "calm", 1.0)
+    assert first["amplitude"] >= 0.02  # Renewed, perhaps, by its neighbours
+    assert first["composted_at"] == 1_000_100.0
+    assert first["final_attention"] == \
+        pytest.approx(first["amplitude"] * math.exp(-(first["composted_at"] - first["birth"])))
+    assert first["resonance_count"] >= 0
+
+    manifest = read_manifest(path)
+    assert [info["records"] for info in manifest] == [4, 4, 4, 3]
+    assert sum(info["records"] for info in manifest) == archive.archived == 15
+
+    middle = list(scan_archive(path, start=1_000_150.0, end=1_000_250.0))
+    assert {record["composted_at"] for record in middle} == {1_000_200.0}
+    assert all(record["symbol"] == "🌙" for record in archive.scan(symbol="🌙"))
+    assert len(list(archive.scan(symbol="🌙"))) == 6
+    assert len(list(archive.scan(emotion="grief"))) == 5
+
+
+def test_reopened_archive_carries_on_numbering(tmp_path):
+    path = str(tmp_path / "archive")
+    archive = CompostArchive(path, segment_records=10)
+    _composting("list", archive, rounds=1)
+    archive.close()
+    archive = CompostArchive(path, segment_records=10)
+    _composting("list", archive, rounds=1)
+    archive.close()
+    assert [info["segment"] for info in read_manifest(path)] == \
+        ["compost-000000.jsonl.gz", "compost-000001.jsonl.gz"]
+    assert len(list(scan_archive(path))) == 10
+
+
+def test_a_segment_left_open_by_a_crash_is_taken_in(tmp_path):
+    path = str(tmp_path / "archive")
+    archive = CompostArchive(path)
+    _composting("list", archive, rounds=4, per_round=50)
+    archive.close()
+    whole = list(scan_archive(path))
+    segment = os.path.join(path, read_manifest(path)[0]["segment"])
+    # The crash came before the segment was finished - or noted in the manifest
+    os.remove(os.path.join(path, "manifest.jsonl"))
+    os.truncate(segment, os.path.getsize(segment) * 2 // 3)
+    with pytest.raises(EOFError):
+        with gzip.open(segment, "rt", encoding="utf-8") as f:
+            f.read()
+
+    archive = CompostArchive(path)
+    archive.close()
+    recovered = list(scan_archive(path))
+    assert 0 < len(recovered) < len(whole)
+    assert recovered == whole[:len(recovered)]
+    assert read_manifest(path)[0]["records"] == len(recovered)
+
+
+def test_a_failed_write_is_raised_once_and_never_into_compost(tmp_path, monkeypatch):
+    path = str(tmp_path / "archive")
+    archive = CompostArchive(path)
+    write_record = archive._write_record
+    failures = []
+
+    def failing_once(record):
+        if not failures:
+            failures.append(record["uid"])
+            raise OSError("No space left on device")
+        write_record(record)
+
+    monkeypatch.setattr(archive, "_write_record", failing_once)
+    field, clock = _composting("list", archive, rounds=1)  # Composting itself never raises
+    with pytest.raises(OSError, match="No space left"):
+        archive.flush()
+    archive.flush()  # Raised once only
+
+    field.emit("🌙", "calm", amplitude=0.02, decay_rate=1.0)
+    clock.advance(100.0)
+    assert field.compost() == 1
+    archive.close()
+    assert len(list(scan_archive(path))) == 1  # The writer carried on
+    with pytest.raises(ValueError, match="closed"):
+        archive.released([], 0.0)
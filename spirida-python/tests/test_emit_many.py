@@ -0,0 +1,107 @@
+"""
+🌱 EMIT MANY – Many pulses offered at once
+"""
+
+import math
+
+import pytest
+
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import STRENGTHENING_THRESHOLD, SpiralField
+from spirida.sinks import NullSink
+
+STORAGES = ["list", "columnar"]
+NOW = 1_000_000.0
+
+OFFERED = [
+    ("🌿", "calm", 0.9, 0.01, NOW - 30.0),
+    ("🌿", "calm", 0.8, 0.01, NOW - 20.0),
+    ("🌊", "peaceful", 0.7, 0.02, NOW - 10.0),
+    ("🌙", "grief", 0.5, 0.001, NOW),
+]
+
+
+def _field(storage):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    return SpiralField("backfill", storage=storage, clock=VirtualClock(NOW), output=NullSink())
+
+
+def _held(field):
+    return [(p.symbol, p.emotion, p.amplitude, p.decay_rate, p.birth)
+            for p in sorted(field.pulses, key=lambda p: p._uid)]
+
+
+def _forms(offered):
+    """The same pulses as tuples, as dicts and as a dict of columns."""
+    names = ("symbol", "emotion", "amplitude", "decay_rate", "birth")
+    return {
+        "tuples": list(offered),
+        "dicts": [dict(zip(names, pulse)) for pulse in offered],
+        "columns": {name: [pulse[i] for pulse in offered] for i, name in enumerate(names)},
+    }
+
+
+@pytest.mark.parametrize("form", ["tuples", "dicts", "columns"])
+@pytest.mark.parametrize("storage", STORAGES)
+def test_every_form_births_the_same_pulses(storage, form):
+    field = _field(storage)
+    emitted = []
+    field.on_emit = emitted.append
+    assert field.emit_many(_forms(OFFERED)[form], resonate=False) == len(OFFERED)
+    assert _held(field) == [tuple(pulse) for pulse in OFFERED]
+    assert field.total_emissions == len(OFFERED)
+    assert emitted == [field]  # Told once for the whole batch
+    assert all(len(p.resonance_history) == 0 for p in field.pulses)
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_missing_values_take_emits_defaults(storage):
+    field = _field(storage)
+    field.emit_many([("🌿",), ("🌊", None, 0.5), {"symbol": "🌙", "birth": NOW - 100.0}], resonate=False)
+    assert _held(field) == [("🌿", "neutral", 1.0, 0.01, NOW), ("🌊", "neutral", 0.5, 0.01, NOW),
+                            ("🌙", "neutral", 1.0, 0.01, NOW - 100.0)]
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_a_given_birth_has_already_faded(storage):
+    field = _field(storage)
+    field.emit_many([("🍂", "grief", 0.5, 0.1, NOW - 60.0)], resonate=False)
+    (pulse,) = field.pulses
+    assert pulse.current_attention() == pytest.approx(0.5 * math.exp(-6.0))
+    assert field.resonance_field() == pytest.approx(0.5 * math.exp(-6.0))
+    assert field.compost(0.01) == 1
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_resonating_strengthens_only_the_strong_pairs(storage):
+    quiet, resonant = _field(storage), _field(storage)
+    quiet.emit_many(OFFERED, resonate=False)
+    resonant.emit_many(OFFERED, resonate=True)
+    before = {p._uid: p for p in quiet.pulses}
+
+    strengths = {}  # Every pair meets at the later of its births, before any strengthening
+    for later in quiet.pulses:
+        for earlier in quiet.pulses:
+            if earlier._uid < later._uid:
+                strength = later.resonance_strength(earlier, max(later.birth, earlier.birth))
+                if strength > STRENGTHENING_THRESHOLD:
+                    strengths[later._uid, earlier._uid] = strength
+    assert strengths  # The two 🌿 calm pulses at least
+
+    for pulse in resonant.pulses:
+        gain = sum(strength for pair, strength in strengths.items() if pulse._uid in pair)
+        assert (pulse.amplitude > before[pulse._uid].amplitude) == (gain > 0)
+        met = [(event["other_symbol"], round(event["resonance_strength"], 9), event["poetic_trace"])
+               for event in pulse.resonance_history]
+        assert met == [(before[other].symbol, round(strength, 9), None)
+                       for (uid, other), strength in strengths.items() if uid == pulse._uid]
+
+
+def test_list_and_columnar_resonate_alike():
+    pytest.importorskip("numpy")
+    kept, columns = _field("list"), _field("columnar")
+    for field in (kept, columns):
+        field.emit("🌿", "calm", 1.0, 0.01)
+        field.emit_many(OFFERED, resonate=True)
+    assert [pulse[2] for pulse in _held(columns)] == pytest.approx([pulse[2] for pulse in _held(kept)])
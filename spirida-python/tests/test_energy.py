@@ -0,0 +1,110 @@
+"""
+✨ ENERGY – The running sums agree with counting every pulse
+"""
+
+import math
+import random
+
+import pytest
+
+from spirida import energy
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import SpiralField
+from spirida.energy import MAX_EXACT_RATES, AttentionEnergy
+from spirida.sinks import NullSink
+
+STORAGES = ["list", "columnar"]
+
+
+def _counted(pulses, now):
+    return sum(amplitude * math.exp(-decay_rate * (now - birth)) for birth, amplitude, decay_rate in pulses)
+
+
+def _tolerance(kept, pulses):
+    """Quantised rates keep each pulse's attention within 0.15% of its amplitude."""
+    return 0.0015 * sum(amplitude for _, amplitude, _ in pulses) if kept.quantised else 1e-9
+
+
+def _pulses(count, rates, seed=1):
+    rng = random.Random(seed)
+    return [(rng.uniform(0.0, 500.0), rng.uniform(0.1, 1.0), rng.choice(rates)) for _ in range(count)]
+
+
+FEW_RATES = [0.0, 0.001, 0.01, 0.05]
+MANY_RATES = [0.0005 * (1 + i) for i in range(MAX_EXACT_RATES + 44)]
+
+
+@pytest.mark.parametrize("rates", [FEW_RATES, MANY_RATES], ids=["exact", "quantised"])
+def test_births_changes_and_departures(rates):
+    pulses = _pulses(2000, rates)
+    kept = AttentionEnergy()
+    for birth, amplitude, decay_rate in pulses:
+        kept.add(birth, amplitude, decay_rate)
+    assert kept.quantised == kept.needs_rebuild == (rates is MANY_RATES)
+    if kept.needs_rebuild:  # As a store does - the sums from before quantising no longer fit
+        kept.rebuild(pulses, 500.0)
+
+    for now in (500.0, 600.0, 2000.0):
+        assert kept.total(now) == pytest.approx(_counted(pulses, now), abs=_tolerance(kept, pulses))
+
+    rng = random.Random(2)
+    for i in rng.sample(range(len(pulses)), 300):  # Renewed by resonance
+        birth, amplitude, decay_rate = pulses[i]
+        pulses[i] = (birth, amplitude * 1.5, decay_rate)
+        kept.add(birth, amplitude * 0.5, decay_rate, count=0)
+    for birth, amplitude, decay_rate in pulses[:700]:  # Composted
+        kept.add(birth, -amplitude, decay_rate, count=-1)
+    pulses = pulses[700:]
+    assert kept.total(700.0) == pytest.approx(_counted(pulses, 700.0), abs=_tolerance(kept, pulses))
+
+    kept.rebuild(pulses, 700.0)
+    assert kept.total(900.0) == pytest.approx(_counted(pulses, 900.0), abs=_tolerance(kept, pulses))
+
+
+def test_a_class_with_every_pulse_gone_is_forgotten():
+    kept = AttentionEnergy()
+    kept.add(10.0, 0.5, 0.01)
+    kept.add(10.0, -0.5, 0.01, count=-1)
+    assert len(kept) == 0 and kept.total(20.0) == 0.0
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "without numpy"])
+@pytest.mark.parametrize("rates", [FEW_RATES, MANY_RATES], ids=["exact", "quantised"])
+def test_many_at_once_agrees_with_one_by_one(monkeypatch, numpy, rates):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(energy, "np", None)
+    pulses = _pulses(3000, rates, seed=4)
+    one, many = AttentionEnergy(), AttentionEnergy()
+    for birth, amplitude, decay_rate in pulses:
+        one.add(birth, amplitude, decay_rate)
+    if one.needs_rebuild:
+        one.rebuild(pulses, 500.0)
+    many.add_many(*zip(*pulses))
+    if many.needs_rebuild:
+        many.rebuild(pulses, 500.0)
+    assert many.quantised == one.quantised
+    assert many.total(800.0) == pytest.approx(one.total(800.0), rel=1e-9)
+
+
+@pytest.mark.parametrize("rates", [FEW_RATES, MANY_RATES], ids=["exact", "quantised"])
+@pytest.mark.parametrize("storage", STORAGES)
+def test_field_energy_after_emits_and_composts(storage, rates):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    clock = VirtualClock(1_000_000.0)
+    field = SpiralField("sums", storage=storage, clock=clock, output=NullSink())
+    rng = random.Random(9)
+    for round_ in range(4):
+        for _ in range(150):
+            field.emit(rng.choice("🌿🌊🌙✨"), rng.choice(["calm", "joy", "grief"]),
+                       rng.uniform(0.05, 1.0), rng.choice(rates))
+            clock.advance(rng.uniform(0.0, 2.0))
+        clock.advance(300.0)
+        field.compost(0.2)
+        now = clock.time()
+        counted = sum(p.current_attention(now) for p in field.pulses)
+        tolerance = 0.0015 * sum(p.amplitude for p in field.pulses) if rates is MANY_RATES else 1e-9
+        assert field.resonance_field() == pytest.approx(counted, rel=1e-9, abs=tolerance)
+    assert field.total_composted > 0
@@ -0,0 +1,104 @@
+"""
+🍂 FADE INDEX – Exactly the faded pulses, and only those
+"""
+
+import math
+import random
+
+import pytest
+
+from spirida import fade_index
+from spirida.fade_index import FadeIndex
+
+DECAY_RATES = [0.0, 0.001, 0.01, 0.05, 0.3]
+
+
+def _garden(count, seed=7):
+    """Pulses as handle -> [birth, amplitude, decay_rate], born over the first 100 seconds."""
+    rng = random.Random(seed)
+    return {handle: [rng.uniform(0.0, 100.0), rng.uniform(0.0, 1.5), rng.choice(DECAY_RATES)]
+            for handle in range(count)}
+
+
+def _faded(pulses, threshold, now):
+    return {handle for handle, (birth, amplitude, decay_rate) in pulses.items()
+            if amplitude * math.exp(-decay_rate * (now - birth)) < threshold}
+
+
+def _index(pulses, many):
+    index = FadeIndex(lambda handle: tuple(pulses[handle]) if handle in pulses else None)
+    if many:
+        handles = list(pulses)
+        index.add_many(handles, *([pulses[h][i] for h in handles] for i in range(3)))
+    else:
+        for handle, (birth, amplitude, decay_rate) in pulses.items():
+            index.add(handle, birth, amplitude, decay_rate)
+    return index
+
+
+def _compost(index, pulses, threshold, now):
+    popped = index.pop_faded(threshold, now)
+    for handle in popped:
+        del pulses[handle]
+    return set(popped)
+
+
+@pytest.fixture(params=["one by one", "many", "many without numpy"])
+def added(request, monkeypatch):
+    if request.param == "many without numpy":
+        monkeypatch.setattr(fade_index, "np", None)
+    return request.param != "one by one"
+
+
+@pytest.mark.parametrize("threshold", [0.01, 0.1, 0.5])
+def test_pops_exactly_the_faded(added, threshold):
+    pulses = _garden(500)
+    index = _index(pulses, added)
+    for now in (100.0, 150.0, 400.0, 2000.0, 20000.0):
+        expected = _faded(pulses, threshold, now)
+        assert _compost(index, pulses, threshold, now) == expected
+        assert not _faded(pulses, threshold, now)
+    assert len(index) == len(pulses)
+
+
+def test_steady_pulses_fade_only_if_never_strong_enough(added):
+    pulses = {"faint": [0.0, 0.005, 0.0], "steady": [0.0, 0.5, 0.0], "gone": [0.0, 0.0, 0.0]}
+    index = _index(pulses, added)
+    assert index.next_fade(0.01) is None
+    assert index.next_fade(0.01, now=1.0) == 1.0
+    assert _compost(index, pulses, 0.01, 1e9) == {"faint", "gone"}
+    assert _compost(index, pulses, 0.01, 1e12) == set()
+    assert set(pulses) == {"steady"}
+
+
+def test_revived_and_weakened_pulses(added):
+    pulses = _garden(300, seed=11)
+    index = _index(pulses, added)
+    rng = random.Random(3)
+    for now in (120.0, 300.0, 900.0):
+        for handle in rng.sample(sorted(pulses), min(60, len(pulses))):
+            birth, amplitude, decay_rate = pulses[handle]
+            pulses[handle][1] = amplitude * rng.choice([0.2, 0.5, 2.0, 5.0])
+            index.amplitude_changed(handle, birth, pulses[handle][1], decay_rate)
+        expected = _faded(pulses, 0.1, now)
+        assert _compost(index, pulses, 0.1, now) == expected
+
+
+def test_removed_pulses_are_never_popped():
+    pulses = _garden(100)
+    index = _index(pulses, many=False)
+    removed = set(sorted(pulses)[::3])
+    for handle in removed:
+        index.remove(handle)  # Left by other means - though it could still be resolved
+    expected = _faded(pulses, 1.0, 1e6) - removed
+    assert _compost(index, pulses, 1.0, 1e6) == expected
+    assert len(index) == len(pulses) - len(removed)
+
+
+def test_next_fade_is_never_late(added):
+    pulses = {handle: [birth, amplitude + 0.2, decay_rate]
+              for handle, (birth, amplitude, decay_rate) in _garden(200, seed=5).items()}
+    index = _index(pulses, added)
+    due = index.next_fade(0.1)
+    assert not _faded(pulses, 0.1, due - 1e-6)
+    assert _compost(index, pulses, 0.1, due + 1e-6)
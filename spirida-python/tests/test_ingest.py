@@ -0,0 +1,99 @@
+"""
+📥 INGEST – Events from small files, through the command line
+"""
+
+import json
+
+import pytest
+
+from spirida.ingest import main
+
+EVENTS = [
+    {"symbol": "🌿", "emotion": "calm"},
+    {"symbol": "🌊", "emotion": "joy", "amplitude": 0.8},
+    {"symbol": "🌙", "decay_rate": 0.001},
+    {"symbol": "✨", "birth": "2026-01-01T00:00:00Z"},
+    {"symbol": "🍂", "emotion": "grief"},
+]
+
+
+def _write(tmp_path, name, lines):
+    path = tmp_path / name
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def _statuses(out):
+    return [json.loads(line) for line in out.splitlines() if line.startswith("{")]
+
+
+def _run(capsys, *argv):
+    code = main(["--json", "--status-interval", "3600", "--max-delay", "60", *argv])
+    out, err = capsys.readouterr()
+    return code, _statuses(out), err
+
+
+@pytest.mark.parametrize("batch_size, batches", [(2, 3), (5, 1), (1000, 1)])
+def test_events_arrive_in_batches(tmp_path, capsys, batch_size, batches):
+    source = _write(tmp_path, "events.jsonl", [json.dumps(event) for event in EVENTS])
+    code, statuses, err = _run(capsys, source, "--batch-size", str(batch_size), "--no-resonance")
+    assert code == 0 and err == ""
+    final = statuses[-1]
+    assert (final["ingested"], final["rejected"], final["batches"]) == (5, 0, batches)
+    assert final["alive"] + final["composted"] == 5
+
+
+def test_bad_lines_are_skipped_and_named(tmp_path, capsys):
+    source = _write(tmp_path, "events.jsonl", [
+        json.dumps(EVENTS[0]),
+        "{not json",
+        json.dumps({"emotion": "calm"}),
+        json.dumps(EVENTS[1]),
+        json.dumps({"symbol": "🌙", "amplitude": "loud"}),
+    ])
+    code, statuses, err = _run(capsys, source)
+    assert code == 0
+    assert (statuses[-1]["ingested"], statuses[-1]["rejected"]) == (2, 3)
+    assert [line.split(":")[1] for line in err.splitlines()] == ["2", "3", "5"]
+
+
+def test_csv_by_file_name(tmp_path, capsys):
+    source = _write(tmp_path, "events.csv", ["symbol,emotion,amplitude", "🌿,calm,0.5", ",calm,", "🌊,,"])
+    code, statuses, err = _run(capsys, source)
+    assert code == 0
+    assert (statuses[-1]["ingested"], statuses[-1]["rejected"]) == (2, 1)
+    assert ":3:" in err
+
+
+def test_a_missing_source_fails_after_what_came_before(tmp_path, capsys):
+    source = _write(tmp_path, "events.jsonl", [json.dumps(event) for event in EVENTS[:2]])
+    missing = str(tmp_path / "missing.jsonl")
+    code, statuses, err = _run(capsys, source, missing)
+    assert code == 1
+    assert statuses[-1]["ingested"] == 2
+    assert "missing.jsonl" in err
+
+
+def test_only_rejected_lines_fail(tmp_path, capsys):
+    source = _write(tmp_path, "events.jsonl", ["{not json"])
+    code, statuses, _ = _run(capsys, source)
+    assert code == 1 and statuses[-1]["rejected"] == 1
+
+
+def test_store_keeps_what_was_ingested(tmp_path, capsys):
+    source = _write(tmp_path, "events.jsonl", [json.dumps(event) for event in EVENTS])
+    store = str(tmp_path / "journal.spiralbase")
+    for alive in (4, 8):  # The backdated ✨ has long faded, each time
+        code, statuses, _ = _run(capsys, source, "--store", store, "--wal", "--no-resonance")
+        assert code == 0 and (statuses[-1]["alive"], statuses[-1]["composted"]) == (alive, 1)
+
+
+@pytest.mark.parametrize("argv, complaint", [
+    (["--wal"], "--wal needs --store"),
+    (["--mode", "autumnal"], "invalid choice: 'autumnal'"),
+])
+def test_arguments_that_cannot_work_are_refused(capsys, argv, complaint):
+    with pytest.raises(SystemExit) as exit:
+        main(argv)
+    assert exit.value.code == 2
+    assert complaint in capsys.readouterr().err
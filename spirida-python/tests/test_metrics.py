@@ -0,0 +1,138 @@
+"""
+📊 METRICS – What the system measured, as Prometheus reads it
+"""
+
+import re
+import urllib.error
+import urllib.request
+
+import pytest
+
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import ContemplativeSystem
+from spirida.metrics import LATENCY_BUCKETS, Metrics, PrometheusExporter, prometheus_text, write_prometheus
+from spirida.sinks import NullSink
+
+STORAGES = ["list", "columnar"]
+
+# name{labels} value, as the text format has every sample
+SAMPLE = re.compile(r'^([a-z_]+)(\{[a-z_]+="(?:[^"\\]|\\.)*"(?:,[a-z_]+="(?:[^"\\]|\\.)*")*\})? (\S+)$')
+
+
+def _samples(text):
+    """Every sample line of an exposition, as (name, labels, value)."""
+    samples = []
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        samples.append((match.group(1), match.group(2) or "", float(match.group(3))))
+    return samples
+
+
+def _value(metrics, name, **labels):
+    (sample,) = [s for s in metrics[name]["samples"] if s["labels"] == labels]
+    return sample.get("value", sample.get("count"))
+
+
+def _system(storage):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    clock = VirtualClock(1_000_000.0)
+    system = ContemplativeSystem("grove", clock=clock, output=NullSink(), instrument=True)
+    return system, system.create_field("journal", storage=storage), clock
+
+
+def test_the_text_format():
+    metrics = Metrics()
+    metrics.inc("spirida_emitted_total", 3, field="journal")
+    metrics.inc("spirida_emitted_total", field='quoted "branch"\nwith \\ and newline')
+    for seconds in (0.000002, 0.003, 0.003, 20.0):
+        metrics.observe("spirida_compost_seconds", seconds, field="journal", mode="natural")
+    text = prometheus_text(metrics.snapshot())
+    lines = text.splitlines()
+    assert text.endswith("\n")
+
+    # Metrics come sorted by name, each announced by its HELP and TYPE
+    assert lines[:2] == ["# HELP spirida_compost_seconds Time taken by one compost pass",
+                         "# TYPE spirida_compost_seconds histogram"]
+    assert "# HELP spirida_emitted_total Pulses emitted" in lines
+    assert "# TYPE spirida_emitted_total counter" in lines
+
+    samples = _samples(text)
+    buckets = [(labels, value) for name, labels, value in samples if name == "spirida_compost_seconds_bucket"]
+    assert [re.search(r'le="([^"]+)"', labels).group(1) for labels, _ in buckets] == \
+        [repr(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)  # Cumulative
+    assert counts[0] == 1 and counts[LATENCY_BUCKETS.index(0.005)] == 3 and counts[-1] == 4
+    assert all(labels.startswith('{field="journal",mode="natural",le=') for labels, _ in buckets)
+    assert ("spirida_compost_seconds_count", '{field="journal",mode="natural"}', 4.0) in samples
+    (total,) = [value for name, _, value in samples if name == "spirida_compost_seconds_sum"]
+    assert total == pytest.approx(20.006002)
+
+    assert ("spirida_emitted_total", '{field="journal"}', 3.0) in samples
+    assert ("spirida_emitted_total", '{field="quoted \\"branch\\"\\nwith \\\\ and newline"}', 1.0) in samples
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_counters_after_a_few_breaths(storage):
+    system, field, clock = _system(storage)
+    for symbol in "🌿🌊🌙":
+        field.emit(symbol, "calm", amplitude=0.5, decay_rate=0.01)
+    field.emit_many([("🍂", "grief", 0.02, 1.0), ("🍂", "grief", 0.02, 1.0)])
+    measured = system.metrics()
+    assert _value(measured, "spirida_emitted_total", field="journal") == 5
+    assert _value(measured, "spirida_resonance_pairs_total", field="journal") == 0 + 1 + 2 + (2 * 3 + 1)
+    assert _value(measured, "spirida_emit_seconds", field="journal") == 3
+    assert _value(measured, "spirida_emit_many_seconds", field="journal") == 1
+    assert _value(measured, "spirida_field_pulses", field="journal") == 5
+
+    breath = system.breath.total_duration()
+    for _ in range(3):  # Three breaths, background maintenance after each
+        clock.advance(breath)
+        system._count_breaths()
+        system._maintain()
+    measured = system.metrics()
+    assert _value(measured, "spirida_breath_cycles", system="grove") == 3
+    assert _value(measured, "spirida_breath_duration_seconds", system="grove") == breath
+    assert _value(measured, "spirida_maintenance_seconds", system="grove") == 3
+    assert _value(measured, "spirida_composted_total", field="journal", mode="natural") == 2
+    assert _value(measured, "spirida_field_pulses", field="journal") == 3
+    assert _value(measured, "spirida_field_attention", field="journal") == \
+        pytest.approx(field.resonance_field())
+
+    samples = _samples(prometheus_text(measured))
+    assert ("spirida_emitted_total", '{field="journal"}', 5.0) in samples
+    assert ("spirida_breath_cycles", '{system="grove"}', 3.0) in samples
+    assert ("spirida_maintenance_seconds_count", '{system="grove"}', 3.0) in samples
+
+
+def test_only_gauges_without_instrumentation():
+    system = ContemplativeSystem("grove", clock=VirtualClock(1_000_000.0), output=NullSink())
+    system.create_field("journal").emit("🌿", "calm")
+    assert sorted(system.metrics()) == ["spirida_breath_cycles", "spirida_breath_duration_seconds",
+                                        "spirida_field_attention", "spirida_field_pulses"]
+
+
+def test_written_and_served(tmp_path):
+    system, field, _ = _system("list")
+    field.emit("🌿", "calm")
+    path = str(tmp_path / "spirida.prom")
+    write_prometheus(system, path)
+    with open(path, encoding="utf-8") as f:
+        assert ("spirida_emitted_total", '{field="journal"}', 1.0) in _samples(f.read())
+
+    exporter = PrometheusExporter(system, port=0).start()
+    try:
+        assert exporter.port != 0
+        url = f"http://127.0.0.1:{exporter.port}"
+        with urllib.request.urlopen(url + "/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert ("spirida_emitted_total", '{field="journal"}', 1.0) in _samples(response.read().decode())
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            urllib.request.urlopen(url + "/elsewhere", timeout=5)
+        assert missing.value.code == 404
+    finally:
+        exporter.stop()
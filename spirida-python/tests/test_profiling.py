@@ -0,0 +1,146 @@
+"""
+🔬 PROFILING – Collapsed stacks of the breath, and no thread left behind
+"""
+
+import asyncio
+import math
+import threading
+import time
+
+import pytest
+
+from spirida.async_core import AsyncContemplativeSystem
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import ContemplativeSystem
+from spirida.profiling import MODES, BreathProfiler
+from spirida.sinks import NullSink
+
+
+def _slow_pass(seconds=0.05):
+    """Work enough for a sampler to see, and a budget to be outlasted."""
+    until = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < until:
+        total += sum(range(100))
+    return total
+
+
+def _stacks(path):
+    """Each collapsed stack of a file, as (frames, weight)."""
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    stacks = []
+    for line in lines:
+        stack, weight = line.rsplit(" ", 1)
+        stacks.append((stack.split(";"), int(weight)))
+    return stacks
+
+
+def _sampler_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "spirida-profiler" and thread.is_alive()]
+
+
+def _profiled(tmp_path, mode, **kwargs):
+    return BreathProfiler(str(tmp_path / f"{mode}.folded"), mode=mode, interval=0.0005, **kwargs)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_every_nth_pass_is_kept_as_collapsed_stacks(tmp_path, mode):
+    profiler = _profiled(tmp_path, mode, every=2, budget=0)
+    reasons = []
+    for _ in range(4):
+        profiler.begin(10.0)
+        _slow_pass()
+        reasons.append(profiler.end(10.0))
+    profiler.close()
+    assert reasons == [None, "breath", None, "breath"]
+    assert (profiler.passes, profiler.captured, profiler.overruns) == (4, 2, 0)
+
+    stacks = _stacks(profiler.path)
+    assert stacks and all(frames[0] == "breath" and weight > 0 for frames, weight in stacks)
+    assert any(frame.startswith("_slow_pass (test_profiling.py:") for frames, _ in stacks for frame in frames)
+    # The profiler's own work is never counted against the breath
+    assert not any(frame.startswith(("begin (profiling.py:", "end (profiling.py:"))
+                   for frames, _ in stacks for frame in frames)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_overruns_are_kept_apart(tmp_path, mode):
+    profiler = _profiled(tmp_path, mode, every=0, budget=0.01)
+    profiler.begin(10.0)
+    assert profiler.end(10.0) is None  # Quick enough
+    profiler.begin(10.0)
+    _slow_pass()
+    assert profiler.end(10.0) == "breath (overrun)"
+    profiler.close()
+    assert (profiler.captured, profiler.overruns) == (1, 1)
+    assert {frames[0] for frames, _ in _stacks(profiler.path)} == {"breath (overrun)"}
+
+
+def test_no_sampler_is_left_running(tmp_path):
+    profiler = _profiled(tmp_path, "sampling", every=1)
+    profiler.begin(10.0)
+    profiler.end(10.0)
+    sampler = profiler._sampler
+    assert sampler.is_alive()
+    profiler.stop()
+    assert not sampler.is_alive() and not _sampler_threads()
+
+    profiler.begin(10.0)  # The next pass begins another
+    _slow_pass()
+    assert profiler.end(10.0) == "breath"
+    assert _sampler_threads()
+    profiler.close()
+    assert not _sampler_threads()
+    profiler.begin(10.0)  # Once closed, none begins
+    assert profiler.end(10.0) == "breath" and not _sampler_threads()
+
+
+def test_a_system_profiles_its_maintenance(tmp_path, monkeypatch):
+    system = ContemplativeSystem("grove", clock=VirtualClock(1_000_000.0), output=NullSink())
+
+    def slow_maintenance():
+        _slow_pass()
+        return math.inf
+
+    monkeypatch.setattr(system, "_gentle_maintenance", slow_maintenance)
+    profiler = system.enable_profiling(str(tmp_path / "breath.folded"), every=1)
+    system._maintain()
+    assert profiler.captured == 1
+    assert any(frame.startswith("slow_maintenance (test_profiling.py:")
+               for frames, _ in _stacks(profiler.path) for frame in frames)
+    system.disable_profiling()
+    assert system.profiler is None and not _sampler_threads()
+
+
+def _wait_for(condition, timeout=5.0):
+    until = time.monotonic() + timeout
+    while not condition() and time.monotonic() < until:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_stopping_the_breath_ends_the_sampler(tmp_path):
+    system = ContemplativeSystem("grove", clock=VirtualClock(1_000_000.0), output=NullSink())
+    profiler = system.enable_profiling(str(tmp_path / "breath.folded"), every=1)
+    system.start_breathing()
+    assert _wait_for(lambda: profiler.passes >= 1 and _sampler_threads())
+    system.stop_breathing()
+    assert not _sampler_threads()
+    assert system.profiler is profiler  # Still enabled, for when the breath begins again
+
+
+def test_stopping_an_async_breath_ends_the_sampler(tmp_path):
+    async def breathe():
+        system = AsyncContemplativeSystem("grove", clock=VirtualClock(1_000_000.0), output=NullSink())
+        profiler = system.enable_profiling(str(tmp_path / "breath.folded"), every=1)
+        await system.start_breathing()
+        for _ in range(500):
+            if profiler.passes >= 1 and _sampler_threads():
+                break
+            await asyncio.sleep(0.01)
+        assert profiler.passes >= 1
+        await system.stop_breathing()
+
+    asyncio.run(breathe())
+    assert not _sampler_threads()
@@ -0,0 +1,122 @@
+"""
+🗄️ SEGMENTS – A field put to sleep wakes as it was
+"""
+
+import json
+import os
+
+import pytest
+
+from spirida import segments
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import SpiralField
+from spirida.sinks import NullSink
+
+STORAGES = ["list", "columnar"]
+
+
+def _state(field):
+    return sorted((p._uid, p.symbol, p.emotion, p.birth, p.amplitude, p.decay_rate) for p in field.pulses)
+
+
+def _segment_files(path):
+    return sorted(name for name in os.listdir(path) if name.startswith("segment-"))
+
+
+def _open(path, storage, clock, capacity=4):
+    return SpiralField.open(path, storage=storage, segment_capacity=capacity, clock=clock, output=NullSink())
+
+
+@pytest.fixture(params=STORAGES + ["list without numpy"])
+def storage(request, monkeypatch):
+    if request.param == "columnar":
+        pytest.importorskip("numpy")
+    if request.param == "list without numpy":
+        monkeypatch.setattr(segments, "np", None)
+        return "list"
+    return request.param
+
+
+def test_reopened_field_wakes_as_it_was_closed(tmp_path, storage):
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "journal.spiralbase")
+    field = _open(path, storage, clock)
+    field.composting_mode = "seasonal"
+    for symbol, emotion in [("🌿", "calm"), ("🌊", "joy"), ("🌙", "grief")]:
+        field.emit(symbol, emotion, amplitude=0.8, decay_rate=0.002)
+        clock.advance(5.0)
+    field.emit("🍂", "grief", amplitude=0.02, decay_rate=1.0)
+    clock.advance(10.0)
+    assert field.compost() == 1
+    expected = _state(field)
+    field.close()
+    assert field.segments is None
+
+    clock.advance(100.0)
+    reopened = _open(path, storage, clock)
+    try:
+        assert _state(reopened) == expected
+        assert (reopened.name, reopened.composting_mode) == ("journal.spiralbase", "seasonal")
+        assert (reopened.total_emissions, reopened.total_composted) == (4, 1)
+        assert reopened.emit("✨", "joy")._uid == 4  # Uids are never given twice
+    finally:
+        reopened.close()
+
+
+def test_segments_roll_over_and_empty_ones_are_let_go(tmp_path, storage):
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "journal.spiralbase")
+    field = _open(path, storage, clock, capacity=4)
+    for i in range(4):
+        field.emit("🍂", "grief", amplitude=0.02, decay_rate=1.0)  # The first segment, soon to fade
+    for i in range(6):
+        field.emit("🌿", "calm", amplitude=1.0, decay_rate=0.0001)
+    field.sync()
+    assert _segment_files(path) == ["segment-000000.spb", "segment-000001.spb", "segment-000002.spb"]
+
+    clock.advance(10.0)
+    assert field.compost() == 4
+    assert _segment_files(path) == ["segment-000001.spb", "segment-000002.spb"]
+    field.emit("🌱", "hopeful")
+    field.emit("🌱", "hopeful")
+    field.emit("🌱", "hopeful")  # The last segment is full - a new one begins
+    assert _segment_files(path)[-1] == "segment-000003.spb"
+    expected = _state(field)
+    field.close()
+
+    reopened = _open(path, storage, clock, capacity=4)
+    try:
+        assert _state(reopened) == expected
+        reopened.emit("🌙", "peaceful")
+        assert _segment_files(path)[-1] == "segment-000003.spb"  # Filling the newest, not the let-go
+    finally:
+        reopened.close()
+
+
+def test_names_are_kept_once_and_come_back_whole(tmp_path, storage):
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "journal.spiralbase")
+    field = _open(path, storage, clock)
+    for symbol, emotion in [("🌿", "calm"), ("🌿", "calm"), ("branch with\nnewline", "quiet \"joy\""),
+                            ("🌊", "calm")]:
+        field.emit(symbol, emotion)
+    field.close()
+
+    def table(name):
+        with open(os.path.join(path, name), encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    assert table("symbols.txt") == ["🌿", "branch with\nnewline", "🌊"]
+    assert table("emotions.txt") == ["calm", "quiet \"joy\""]
+
+    reopened = _open(path, storage, clock)
+    try:
+        reopened.emit("🌊", "quiet \"joy\"")
+        reopened.emit("🌀", "calm")
+        assert sorted(p.symbol for p in reopened.pulses) == \
+            sorted(["🌿", "🌿", "branch with\nnewline", "🌊", "🌊", "🌀"])
+        assert {p.emotion for p in reopened.pulses} == {"calm", "quiet \"joy\""}
+    finally:
+        reopened.close()
+    assert table("symbols.txt") == ["🌿", "branch with\nnewline", "🌊", "🌀"]
+    assert table("emotions.txt") == ["calm", "quiet \"joy\""]
@@ -0,0 +1,78 @@
+"""
+💾 SNAPSHOT – A system written down and brought back whole
+"""
+
+import pytest
+
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import ContemplativeSystem
+from spirida.resonance import ResonanceSummary
+from spirida.sinks import NullSink
+
+STORAGES = ["list", "columnar"]
+
+
+def _state(field):
+    return [(p.symbol, p.emotion, p.birth, p.amplitude, p.decay_rate) for p in field.pulses]
+
+
+def _histories(field):
+    return [history.as_dict() if isinstance(history, ResonanceSummary) else list(history or ())
+            for history in field._store.histories()]
+
+
+def _lived_system(storage, history):
+    clock = VirtualClock(1_000_000.0)
+    system = ContemplativeSystem("rehearsal", clock=clock, output=NullSink())
+    field = system.create_field("journal", storage=storage, history=history, history_size=3,
+                                maintenance_interval=30.0)
+    field.composting_mode = "seasonal"
+    for symbol, emotion in [("🌿", "calm"), ("🌊", "calm"), ("🌙", "grief"), ("✨", "joy"), ("🌿", "peaceful")]:
+        field.emit(symbol, emotion, amplitude=0.9, decay_rate=0.002)
+        clock.advance(2.0)
+    field.emit("🍂", "grief", amplitude=0.02, decay_rate=1.0)
+    clock.advance(10.0)
+    field.compost()
+    field.find_resonances(0.3)
+    system.breath.cycle_count = 7
+    return system, clock
+
+
+@pytest.mark.parametrize("history", ["full", "ring", "aggregate"])
+@pytest.mark.parametrize("storage", STORAGES)
+def test_round_trip_keeps_every_pulse_counter_and_history(tmp_path, storage, history):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    system, clock = _lived_system(storage, history)
+    path = str(tmp_path / "system.snapshot")
+    system.snapshot(path)
+
+    restored = ContemplativeSystem.restore(path, clock=clock, output=NullSink())
+    field, back = system.get_field("journal"), restored.get_field("journal")
+    assert restored.name == system.name and restored.birth == system.birth
+    assert restored.breath.cycle_count == system.breath.cycle_count
+    assert (back.storage, back.history, back.composting_mode) == (storage, history, "seasonal")
+    assert back.maintenance_interval == 30.0
+    assert (back.birth, back.total_emissions, back.total_composted, back.last_compost) == \
+        (field.birth, field.total_emissions, field.total_composted, field.last_compost)
+    assert _state(back) == _state(field)
+    assert _histories(back) == _histories(field)
+    assert back.resonance_field() == pytest.approx(field.resonance_field())
+
+    # New pulses are never given a uid an old one had
+    born = back.emit("💧", "calm")
+    assert born._uid not in {p._uid for p in field.pulses}
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_round_trip_without_history(tmp_path, storage):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    system, clock = _lived_system(storage, "full")
+    path = str(tmp_path / "system.snapshot")
+    system.snapshot(path, history=False)
+
+    restored = ContemplativeSystem.restore(path, clock=clock, output=NullSink())
+    back = restored.get_field("journal")
+    assert _state(back) == _state(system.get_field("journal"))
+    assert all(not history for history in _histories(back))
@@ -0,0 +1,37 @@
+"""
+🌀 SPIRALBASE – Memory traces, kept where they are given
+"""
+
+import pytest
+
+from spirida import spiralbase
+from spirida.core import spiral_interaction
+from spirida.sinks import NullSink
+from spirida.spiralbase import SpiralMemory
+
+
+@pytest.mark.parametrize("singular", [True, False])
+def test_a_given_memory_is_the_one_traced(singular):
+    before = spiralbase.spiral_memory.symbols()
+    memory = SpiralMemory(capacity=20)
+    spiral_interaction(presence=3, rythm=0, singular=singular, on_output=NullSink(), interactions=2,
+                       memory=memory)
+    interactions = 1 if singular else 2
+    assert len(memory) == interactions * (3 - 1)  # Three pulses each, one let go on the third
+    assert spiralbase.spiral_memory.symbols() == before
+
+
+def test_memory_reads_like_the_list_it_once_was():
+    memory = SpiralMemory(capacity=3)
+    for symbol in ["🌿", "💧", "✨", "🍄"]:
+        memory.append(symbol)
+    assert len(memory) == 3 and list(memory) == ["💧", "✨", "🍄"]
+    assert (memory[0], memory[-1], memory[1:]) == ("💧", "🍄", ["✨", "🍄"])
+    assert "✨" in memory and "🌿" not in memory
+    assert memory.pop(0) == "💧"
+    assert memory.pop() == "🍄"
+    assert memory.symbols() == ["✨"]
+    memory.pop()
+    with pytest.raises(IndexError):
+        memory.pop()
+    assert not memory
@@ -0,0 +1,167 @@
+"""
+📜 WAL – A crashed field wakes as it was moments before
+
+A crash is played by copying a field's directory while the field is
+still open: only what has reached the disk comes along.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from spirida.clock import VirtualClock
+from spirida.contemplative_core import SpiralField
+from spirida.segments import Segment, SegmentStore
+from spirida.sinks import NullSink
+from spirida.wal import WriteAheadLog, replay
+
+STORAGES = ["list", "columnar"]
+
+
+def _state(field):
+    """Everything about a field's pulses that a recovery must bring back."""
+    return sorted((p.symbol, p.emotion, p.birth, round(p.amplitude, 12), p.decay_rate) for p in field.pulses)
+
+
+def _open(path, storage, clock):
+    return SpiralField.open(path, storage=storage, wal=True, clock=clock, output=NullSink())
+
+
+def _crash(path, into):
+    """What a crash would leave of the field kept at `path`."""
+    shutil.copytree(path, into)
+    return into
+
+
+@pytest.fixture
+def lived(tmp_path, request):
+    """A field that synced, then lived on - births, resonance and a compost - known only to its log."""
+    if request.param == "columnar":
+        pytest.importorskip("numpy")
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "journal.spiralbase")
+    field = _open(path, request.param, clock)
+    for symbol in ("🌿", "🌊", "🌙"):
+        field.emit(symbol, "calm")
+        clock.advance(1.0)
+    field.sync()
+
+    field.emit("✨", "joy")
+    field.emit("🍂", "grief", amplitude=0.02, decay_rate=1.0)
+    clock.advance(10.0)
+    assert field.compost() == 1
+    field.emit("💧", "calm")
+    field.wal.commit()
+    yield field, path, clock, request.param
+    field.close()
+
+
+@pytest.mark.parametrize("lived", STORAGES, indirect=True)
+def test_replay_recovers_everything_since_the_last_sync(lived, tmp_path):
+    field, path, clock, storage = lived
+    recovered = _open(_crash(path, str(tmp_path / "crashed")), storage, clock)
+    try:
+        assert _state(recovered) == _state(field)
+        assert recovered.total_emissions == field.total_emissions == 6
+        assert recovered.total_composted == field.total_composted == 1
+    finally:
+        recovered.close()
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_torn_last_record_ends_replay_cleanly(tmp_path, storage):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "wal.log")
+    field = SpiralField("journal", storage=storage, clock=clock, output=NullSink())
+    log = WriteAheadLog(path, fsync_interval=0)  # A log kept from the field's start
+    field.add_observer(log)
+    field.emit("🌿", "calm")
+    clock.advance(1.0)
+    field.emit("🌊", "calm")
+    field.emit_many([("🔥", "joy")], resonate=False)  # The last record is this birth alone
+    log.close()
+
+    whole = list(WriteAheadLog.records(path))
+    assert whole[-1][0] == "emitted" and whole[-1][5] == "🔥"
+    os.truncate(path, os.path.getsize(path) - 3)  # The crash tore it part way
+    assert list(WriteAheadLog.records(path)) == whole[:-1]
+
+    recovered = SpiralField("journal", storage=storage, clock=clock, output=NullSink())
+    assert replay(path, recovered) == len(whole) - 2  # Neither the generation nor the torn birth
+    assert _state(recovered) == [p for p in _state(field) if p[0] != "🔥"]
+    assert recovered.total_emissions == 2
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_recovered_field_is_stored_and_log_begins_again(tmp_path, storage):
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "journal.spiralbase")
+    field = _open(path, storage, clock)
+    field.emit("🌿", "calm")
+    field.wal.commit()
+    crashed = _crash(path, str(tmp_path / "crashed"))
+    field.close()
+
+    recovered = _open(crashed, storage, clock)
+    expected = _state(recovered)
+    generation = recovered.wal.generation
+    recovered.close()
+    assert [record[0] for record in WriteAheadLog.records(os.path.join(crashed, "wal.log"))] == ["generation"]
+
+    reopened = _open(crashed, storage, clock)
+    try:
+        assert _state(reopened) == expected
+        assert reopened.wal.generation >= generation
+    finally:
+        reopened.close()
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_crash_after_meta_finds_every_record_on_disk(tmp_path, storage, monkeypatch):
+    """Meta written, log not yet begun again: mapped pages not flushed by then are lost."""
+    if storage == "columnar":
+        pytest.importorskip("numpy")
+    flushed = {}  # What of each segment has surely reached the disk
+
+    def flush(segment, flush=Segment.flush):
+        flush(segment)
+        with open(segment.path, "rb") as f:
+            flushed[os.path.basename(segment.path)] = f.read()
+
+    crashes = []
+
+    def write_meta(store, meta, write_meta=SegmentStore.write_meta):
+        write_meta(store, meta)
+        into = str(tmp_path / f"crashed-{len(crashes)}")
+        shutil.copytree(store.path, into, ignore=shutil.ignore_patterns("segment-*"))
+        for name, data in flushed.items():
+            with open(os.path.join(into, name), "wb") as f:
+                f.write(data)
+        crashes.append(into)
+
+    monkeypatch.setattr(Segment, "flush", flush)
+    monkeypatch.setattr(SegmentStore, "write_meta", write_meta)
+    clock = VirtualClock(1_000_000.0)
+    path = str(tmp_path / "journal.spiralbase")
+    field = _open(path, storage, clock)
+    field.emit("🌿", "calm")
+    field.sync()
+    field.emit("🌊", "calm")
+    clock.advance(1.0)
+    field.emit("🌙", "grief")
+    field.sync()  # The crash comes right after this sync's meta
+    expected = _state(field)
+    field.close()
+    monkeypatch.undo()
+
+    recovered = _open(crashes[1], storage, clock)
+    try:
+        assert _state(recovered) == expected
+        assert recovered.total_emissions == 3
+    finally:
+        recovered.close()